@@ -0,0 +1,46 @@
+"""
+Times `CaseFields.get_configs` parsing on a synthetic `get_case_fields` payload.
+
+    python -m benchmarks.bench_case_fields --fields 500 --projects 20 --items 30
+"""
+import argparse
+import time
+
+from testrail_data._category import _parse_case_fields
+
+
+def case_fields(fields: int, projects: int, items: int, configs: int = 3) -> list:
+    payload = []
+    for i in range(fields):
+        has_items = i % 4 != 0
+        field = {'id': i, 'system_name': f'custom_field_{i}', 'configs': []}
+        for c in range(configs):
+            options = {'is_required': False}
+            if has_items:
+                options['items'] = '\n'.join(f'{n}, Option {n} of field {i}' for n in range(1, items + 1))
+            project_ids = list(range(c * projects, (c + 1) * projects))
+            field['configs'].append({'id': f'{i}-{c}', 'context': {'is_global': False, 'project_ids': project_ids},
+                                     'options': options})
+        payload.append(field)
+    return payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fields', type=int, default=500)
+    parser.add_argument('--projects', type=int, default=20)
+    parser.add_argument('--items', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    payload = case_fields(args.fields, args.projects, args.items)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        _parse_case_fields(payload)
+        timings.append(time.perf_counter() - start)
+    print(f'{args.fields} fields: best {min(timings) * 1000:.1f} ms of {args.repeat}')
+
+
+if __name__ == '__main__':
+    main()
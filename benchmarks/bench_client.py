@@ -0,0 +1,185 @@
+"""
+Measures the client against a local fake TestRail server: wall time, requests per
+second and peak memory of the main pulls, written as JSON for comparison across versions.
+
+    python -m benchmarks.bench_client --runs 50 --tests 300 --results 600 --latency 0.005
+    python -m benchmarks.bench_client --rate-limit-every 50 --drop-every 70
+    python -m benchmarks.bench_client --baseline benchmarks/results/baseline.json
+
+Exits with 1 when a scenario is slower than `--tolerance` times its `--baseline` wall time.
+"""
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+from testrail_data import RetryPolicy, Scheduler, TestRailAPI
+from testrail_data import _category
+from tests.fake_server import FakeTestRail
+
+PROJECT_ID = 1
+SUITE_ID = 1
+
+
+def routes(runs: int, tests: int, results: int, cases: int, sections: int) -> dict:
+    """
+    A project with `runs` runs of `tests` tests and `results` results each, and a suite
+    of `cases` cases over `sections` sections, with the metadata of `with_meta`.
+    """
+    data = {
+        f'get_runs/{PROJECT_ID}': [
+            {'id': run_id, 'name': f'Run {run_id}', 'project_id': PROJECT_ID, 'suite_id': SUITE_ID,
+             'is_completed': run_id % 2 == 0, 'passed_count': tests, 'created_on': 1600000000 + run_id}
+            for run_id in range(1, runs + 1)],
+        f'get_sections/{PROJECT_ID}': [
+            {'id': i, 'name': f'Section {i}', 'parent_id': None if i < 5 else i % 5 + 1, 'depth': 0}
+            for i in range(1, sections + 1)],
+        f'get_templates/{PROJECT_ID}': [{'id': 1, 'name': 'Test Case'}],
+        f'get_suites/{PROJECT_ID}': [{'id': SUITE_ID, 'name': 'Master'}],
+        'get_case_types': [{'id': i, 'name': f'Type {i}'} for i in range(1, 13)],
+        'get_priorities': [{'id': i, 'name': f'P{i}'} for i in range(1, 5)],
+        'get_case_fields': [{
+            'id': 1, 'system_name': 'custom_level',
+            'configs': [{'context': {'is_global': True, 'project_ids': None},
+                         'options': {'items': '1, Low\n2, Medium\n3, High'}}],
+        }],
+    }
+    case_rows = [
+        {'id': i, 'title': f'Case {i}', 'section_id': i % sections + 1, 'suite_id': SUITE_ID,
+         'template_id': 1, 'type_id': i % 12 + 1, 'priority_id': i % 4 + 1, 'custom_level': i % 3 + 1,
+         'created_on': 1600000000, 'updated_on': 1600000000}
+        for i in range(1, cases + 1)]
+    data[f'get_cases/{PROJECT_ID}'] = lambda params: [
+        case for case in case_rows if 'section_id' not in params or case['section_id'] == int(params['section_id'])]
+    for run_id in range(1, runs + 1):
+        data[f'get_run/{run_id}'] = {'id': run_id, 'project_id': PROJECT_ID}
+        data[f'get_tests/{run_id}'] = [
+            {'id': run_id * tests + i, 'run_id': run_id, 'case_id': i % cases + 1, 'status_id': i % 5 + 1,
+             'template_id': 1, 'type_id': i % 12 + 1, 'priority_id': i % 4 + 1, 'custom_level': i % 3 + 1}
+            for i in range(tests)]
+        data[f'get_results_for_run/{run_id}'] = [
+            {'id': run_id * results + i, 'test_id': run_id * tests + i % tests, 'status_id': i % 5 + 1,
+             'created_on': 1600000000 + i, 'created_by': 1, 'comment': 'Lorem ipsum ' * 4}
+            for i in range(results)]
+    return data
+
+
+def scenarios(args) -> dict:
+    run_ids = list(range(1, args.runs + 1))
+    return {
+        'runs.to_dataframe': lambda api: api.runs.to_dataframe(PROJECT_ID),
+        'results.dataframe_from_runs': lambda api: api.results.dataframe_from_runs(
+            *run_ids, max_workers=args.max_workers),
+        'tests.to_dataframe(with_meta)': lambda api: api.tests.to_dataframe(
+            *run_ids, with_meta=True, max_workers=args.max_workers),
+        'cases.to_dataframe(with_meta)': lambda api: api.cases.to_dataframe(PROJECT_ID, SUITE_ID, with_meta=True),
+        'cases.to_dataframe(by_section)': lambda api: api.cases.to_dataframe(
+            PROJECT_ID, SUITE_ID, with_meta=True, by_section=True, max_workers=args.max_workers),
+    }
+
+
+def measure(server: FakeTestRail, args, pull) -> dict:
+    """
+    Best wall time of `--repeat` pulls with a new client each, then the peak memory of one more.
+    """
+    scheduler = None
+    if args.rate_limit_every or args.drop_every:
+        scheduler = Scheduler(policy=RetryPolicy(total=10, backoff=0.001, max_backoff=0.01))
+    timings = []
+    for _ in range(args.repeat):
+        api = TestRailAPI(server.url, 'bench@example.com', 'password', scheduler=scheduler, warn_ignore=True)
+        server.calls.clear()
+        faults = sum(server.faults.values())
+        start = time.perf_counter()
+        df = pull(api)
+        timings.append(time.perf_counter() - start)
+    # requests include the ones answered with an injected fault, counted in faulted_requests too
+    requests = len(server.calls)
+    faulted = sum(server.faults.values()) - faults
+
+    api = TestRailAPI(server.url, 'bench@example.com', 'password', scheduler=scheduler, warn_ignore=True)
+    tracemalloc.start()
+    pull(api)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    wall = min(timings)
+    return {
+        'wall_s': round(wall, 4),
+        'requests': requests,
+        'faulted_requests': faulted,
+        'requests_per_s': round(requests / wall, 1) if wall else None,
+        'rows': 0 if df is None else int(df.shape[0]),
+        'peak_memory_mb': round(peak / 1024 ** 2, 2),
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Returns the scenarios slower than `tolerance` times their baseline wall time.
+    """
+    before = {row['scenario']: row for row in baseline['scenarios']}
+    return [row['scenario'] for row in report['scenarios']
+            if row['scenario'] in before and row['wall_s'] > before[row['scenario']]['wall_s'] * tolerance]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--tests', type=int, default=300, help='tests per run')
+    parser.add_argument('--results', type=int, default=600, help='results per run')
+    parser.add_argument('--cases', type=int, default=5000)
+    parser.add_argument('--sections', type=int, default=50)
+    parser.add_argument('--page-size', type=int, default=250)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--rate-limit-every', type=int, default=0, help='answer every n-th request with a 429')
+    parser.add_argument('--drop-every', type=int, default=0, help='drop the connection of every n-th request')
+    parser.add_argument('--max-workers', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--scenario', action='append', help='run only these scenarios')
+    parser.add_argument('--output', default='benchmarks/results/bench_client.json')
+    parser.add_argument('--baseline', help='a previous output to compare wall times with')
+    parser.add_argument('--tolerance', type=float, default=1.25)
+    args = parser.parse_args()
+
+    _category.page_size = args.page_size
+    _category.retry_sleep = 0
+    # injected faults are expected, keep the retry warnings out of the output
+    logging.getLogger('testrail_data').setLevel(logging.ERROR)
+    report = {
+        'created_on': int(time.time()),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'params': {k: v for k, v in vars(args).items() if k not in ('output', 'baseline', 'tolerance')},
+        'scenarios': [],
+    }
+    server = FakeTestRail(
+        routes(args.runs, args.tests, args.results, args.cases, args.sections), page_size=args.page_size,
+        latency=args.latency, rate_limit_every=args.rate_limit_every, drop_every=args.drop_every)
+    with server:
+        for name, pull in scenarios(args).items():
+            if args.scenario and name not in args.scenario:
+                continue
+            row = {'scenario': name, **measure(server, args, pull)}
+            report['scenarios'].append(row)
+            print('{scenario:<32} {wall_s:>8.3f}s {requests:>6} req {faulted_requests:>4} faulted '
+                  '{requests_per_s:>8} req/s {rows:>8} rows {peak_memory_mb:>8.1f} MB'.format(**row), file=sys.stderr)
+        report['faults'] = dict(server.faults)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    if args.baseline:
+        slower = compare(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        if slower:
+            print(f'Slower than the baseline: {", ".join(slower)}', file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
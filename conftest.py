@@ -38,3 +38,11 @@ def environ(auth_data):
     del os.environ['TESTRAIL_URL']
     del os.environ['TESTRAIL_EMAIL']
     del os.environ['TESTRAIL_PASSWORD']
+
+
+@pytest.fixture
+def fake_server():
+    from tests.fake_server import FakeTestRail
+
+    with FakeTestRail() as server:
+        yield server
@@ -8,8 +8,13 @@ setuptools.setup(
     version="0.0.10",
     install_requires=[
         "pandas",
-        "testrail-api>=1.10",
+        "testrail-api>=1.10,<2",
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "cache": ["pyarrow"],
+        "fast": ["orjson"],
+    },
     author="Max Leow",
     author_email="maxengiu@outlook.com",
     description="Pandas DataFrame integrated API wrapper for Testrail",
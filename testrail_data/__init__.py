@@ -1 +1,29 @@
-from testrail_data._testrail_api import TestRailAPI
+import importlib
+
+# public names and their modules, imported on first access so that importing
+# the package does not load pandas, aiohttp or the categories
+_exports = {
+    'TestRailAPI': '_testrail_api',
+    'AsyncTestRailAPI': '_async',
+    'ResultCache': '_cache',
+    'ResultSync': '_sync',
+    'ParquetExporter': '_export',
+    'SQLiteSnapshot': '_snapshot',
+    'RetryPolicy': '_scheduler',
+    'Scheduler': '_scheduler',
+    'Stats': '_stats',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'{__name__}.{_exports[name]}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
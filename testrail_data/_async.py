@@ -0,0 +1,988 @@
+import asyncio
+import functools
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Optional
+from urllib.parse import urlencode
+
+import pandas as pd
+from pandas import DataFrame
+from testrail_api._exception import StatusCodeError, TestRailError
+
+from testrail_data import _category
+from testrail_data._json import loads
+from testrail_data._scheduler import Scheduler
+from testrail_data._schema import async_compact
+from testrail_data._stats import Stats, stage
+from testrail_data._category import (
+    _Columns,
+    _chunks,
+    _concat_categorical,
+    _concat_frames,
+    _expand_plans,
+    _fill_custom_columns,
+    _fill_name_column,
+    _fill_section_paths,
+    _group_frames,
+    _has_configs,
+    _milestone_tree,
+    _parse_case_fields,
+    _section_tree,
+    _ungroup_frames,
+)
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+# without a scheduler a 429 is retried like `testrail_api` does: up to 3 attempts,
+# waiting for the Retry-After of the response or `rate_limit_sleep` seconds
+rate_limit_attempts = 3
+rate_limit_sleep = 3
+
+
+class AsyncSession:
+    """
+    An asyncio counterpart of `testrail_api` Session backed by a single shared
+    `aiohttp.ClientSession`, so every category reuses the same connection pool.
+    """
+
+    def __init__(
+            self,
+            url: Optional[str] = None,
+            email: Optional[str] = None,
+            password: Optional[str] = None,
+            timeout: float = 30,
+            limit: int = 100,
+            limit_per_host: int = 0,
+            verify: bool = True,
+            headers: Optional[dict] = None,
+            compact_dtypes: bool = True,
+            scheduler: Optional[Scheduler] = None,
+            json_decoder: Optional[Callable[[bytes], Any]] = None,
+            rate_limit: bool = True,
+    ):
+        """
+        :param url:
+            TestRail address
+        :param email:
+            Email for the account on the TestRail
+        :param password:
+            Password for the account on the TestRail or token
+        :param timeout:
+            How many seconds to wait for the server to send data
+        :param limit:
+            Total number of simultaneous connections in the pool
+        :param limit_per_host:
+            Number of simultaneous connections to the same host (0 is unlimited)
+        :param verify:
+            Controls whether we verify the server's certificate
+        :param headers:
+            Dictionary of HTTP Headers to send
+        :param compact_dtypes:
+            Cast the returned DataFrames into compact dtypes, see `TestRailAPI`
+        :param scheduler:
+            Rate limits and retries every request per endpoint, see `TestRailAPI`
+        :param json_decoder:
+            Decodes the response bodies, orjson when installed, `json` otherwise
+        :param rate_limit:
+            Retry a 429 for its Retry-After like `testrail_api` does, when there is no `scheduler`
+
+        Requests, pagination and in-process stages are counted in `stats`, see `Stats`.
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncTestRailAPI requires aiohttp, run `pip install testrail-data[async]`')
+        _url = url or os.environ.get("TESTRAIL_URL")
+        _email = email or os.environ.get("TESTRAIL_EMAIL")
+        _password = password or os.environ.get("TESTRAIL_PASSWORD")
+        if not _url or not _email or not _password:
+            raise TestRailError("No url or email or password values set")
+        self._base_url = f"{_url.rstrip('/')}/index.php?/api/v2/"
+        self._auth = aiohttp.BasicAuth(_email, _password)
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._verify = verify
+        self._headers = {"Content-Type": "application/json", **(headers or {})}
+        self._client = None
+        self.compact_dtypes = compact_dtypes
+        self.scheduler = scheduler
+        self.rate_limit = rate_limit
+        self.stats = Stats()
+        self.json_decoder = json_decoder or loads
+
+    @property
+    def client(self) -> 'aiohttp.ClientSession':
+        if self._client is None or self._client.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit, limit_per_host=self._limit_per_host, ssl=None if self._verify else False)
+            self._client = aiohttp.ClientSession(
+                connector=connector, auth=self._auth, headers=self._headers, timeout=self._timeout)
+        return self._client
+
+    @staticmethod
+    def _convert(params: dict) -> dict:
+        converted = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                value = ",".join(str(i) for i in value)
+            elif isinstance(value, bool):
+                value = int(value)
+            elif isinstance(value, datetime):
+                value = round(value.timestamp())
+            converted[key] = value
+        return converted
+
+    async def get(self, endpoint: str, params: Optional[dict] = None):
+        """GET method"""
+        url = f"{self._base_url}{endpoint}"
+        params = self._convert(params or {})
+        if params:
+            url = f"{url}&{urlencode(params)}"
+        body = {}
+
+        async def send():
+            try:
+                async with self.client.get(URL(url, encoded=True)) as response:
+                    body['content'] = await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self.stats.record_connection_error(endpoint)
+                raise
+            self.stats.record_response(endpoint, response.status)
+            return response
+
+        start = time.perf_counter()
+        try:
+            if self.scheduler is None:
+                for attempt in range(1, rate_limit_attempts + 1):
+                    response = await send()
+                    if not self.rate_limit or response.status != 429 or attempt == rate_limit_attempts:
+                        break
+                    await asyncio.sleep(int(response.headers.get('Retry-After', rate_limit_sleep)))
+            else:
+                response = await self.scheduler.send_async(send, endpoint, (aiohttp.ClientConnectionError,))
+        except Exception as e:
+            self.stats.record_call(endpoint, time.perf_counter() - start, error=e)
+            raise
+        self.stats.record_call(endpoint, time.perf_counter() - start, len(body['content']), response.status)
+        if response.status >= 400:
+            raise StatusCodeError(response.status, response.reason, str(response.url), body['content'])
+        with self.stats.stage('decode'):
+            return self.json_decoder(body['content']) if body['content'].strip() else None
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+async def _prefetch_pages(fetch, window: int) -> AsyncIterator[list]:
+    pending = deque(asyncio.ensure_future(fetch(i * _category.page_size)) for i in range(window))
+    offset = window * _category.page_size
+    try:
+        while pending:
+            records = await pending.popleft()
+            if len(records) == _category.page_size:
+                pending.append(asyncio.ensure_future(fetch(offset)))
+                offset += _category.page_size
+                yield records
+            else:
+                yield records
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        # let the cancelled requests unwind before the session may be closed
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _offset_pages(f):
+    """
+    The asyncio counterpart of `_category._offset_pages`.
+    """
+    def wrap(*args, **kwargs) -> AsyncIterator[list]:
+        if kwargs.get('offset'):
+            assert False, 'offset has been auto managed'
+        window = kwargs.pop('prefetch', _category.prefetch_window) or 0
+
+        async def auto_reset_connection(*_args, **_kwargs):
+            trial = _category._retry_total(args[0])
+            while trial > 0:
+                try:
+                    return await f(*_args, **_kwargs) or []
+                except aiohttp.ClientConnectionError:
+                    trial -= 1
+                    if trial == 0:
+                        raise
+                    await asyncio.sleep(_category.retry_sleep)
+                    args[0]._session.stats.record_retry()
+                    continue
+
+        async def pages():
+            offset = 0
+            data_size = _category.page_size
+            while data_size == _category.page_size:
+                records = await auto_reset_connection(*args, **kwargs, offset=offset)
+                data_size = len(records)
+                offset += _category.page_size
+                yield records
+
+        if window > 1:
+            return _count_pages(args[0]._session, f.__qualname__, _prefetch_pages(
+                lambda _offset: auto_reset_connection(*args, **kwargs, offset=_offset), window))
+        return _count_pages(args[0]._session, f.__qualname__, pages())
+
+    return wrap
+
+
+def async_iter_offset(f):
+    """
+    The asyncio counterpart of `iter_offset`, the decorated method returns an async iterator of pages.
+
+    :param f:
+    :return:
+    """
+    pages = _offset_pages(f)
+
+    @functools.wraps(f)
+    def wrap(*args, **kwargs) -> AsyncIterator[DataFrame]:
+        return _frames(args[0]._session, pages(*args, **kwargs))
+
+    return wrap
+
+
+async def _frames(session, pages: AsyncIterator[list]) -> AsyncIterator[DataFrame]:
+    try:
+        async for records in pages:
+            with stage(session, 'build'):
+                df = DataFrame(records)
+            yield df
+    finally:
+        # closing the frames early closes the pages, and cancels the pages in flight
+        await pages.aclose()
+
+
+async def _count_pages(session, method: str, pages: AsyncIterator[list]) -> AsyncIterator[list]:
+    """
+    The asyncio counterpart of `_category._count_pages`.
+    """
+    count = 0
+    try:
+        async for records in pages:
+            count += 1
+            yield records
+    finally:
+        session.stats.record_pages(method, count)
+        await pages.aclose()
+
+
+def async_auto_offset(f):
+    """
+    The asyncio counterpart of `auto_offset` for coroutine methods.
+
+    :param f:
+    :return:
+    """
+    pages = _offset_pages(f)
+
+    @functools.wraps(f)
+    async def wrap(*args, **kwargs):
+        columns = _Columns()
+        async for records in pages(*args, **kwargs):
+            with stage(args[0]._session, 'build'):
+                columns.extend(records)
+        with stage(args[0]._session, 'concat'):
+            return columns.frame()
+
+    return wrap
+
+
+async def _gather_runs(run_ids, max_workers: Optional[int], fetch) -> Optional[DataFrame]:
+    """
+    The asyncio counterpart of `_concat_runs`; `max_workers` bounds the number
+    of runs pulled at the same time.
+    """
+    if not max_workers:
+        dfs = [await fetch(run_id) for run_id in run_ids]
+        return pd.concat(dfs).reset_index(drop=True) if dfs else None
+
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def bounded(run_id):
+        async with semaphore:
+            return await fetch(run_id)
+
+    results = await asyncio.gather(*[bounded(run_id) for run_id in run_ids], return_exceptions=True)
+    failures = {run_id: e for run_id, e in zip(run_ids, results) if isinstance(e, Exception)}
+    return _concat_frames([df for df in results if not isinstance(df, Exception)], failures)
+
+
+class _AsyncCategory:
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+
+class AsyncMetas(_AsyncCategory):
+
+    async def get_run_projects(self, *run_ids: int) -> dict:
+        """
+        Returns the IDs of the projects test runs belong to as {<RUN_ID>: <PROJECT_ID>},
+        the runs are looked up concurrently, see `Metas.get_run_projects`.
+        """
+        run_ids = list(dict.fromkeys(run_ids))
+        runs = await asyncio.gather(*[AsyncRuns(self._session).get_run(run_id) for run_id in run_ids])
+        return {run_id: run['project_id'] for run_id, run in zip(run_ids, runs)}
+
+    async def get_config_names(self, project_id: int) -> dict:
+        """
+        Returns the configurations of a project, see `Metas.get_config_names`.
+        """
+        groups = await self._session.get(f"get_configs/{project_id}")
+        return {config['id']: (group['name'], config['name']) for group in groups for config in group['configs']}
+
+    async def fill_custom_fields(self, project_id: int, df: DataFrame, warning=False):
+        """
+        A helper to resolve metadata fill up for custom-columns.
+        Unmatched columns is assigned with `UNKNOWN <config_id>`.
+
+        :param project_id:
+            The ID of the project
+        :param df:
+            Dataframe contains custom-columns
+        :param warning:
+            False to turn off warning for unmatched columns, True is otherwise.
+        """
+        lookup_case_field = await AsyncCaseFields(self._session).get_configs()
+        with stage(self._session, 'fill_custom_fields'):
+            _fill_custom_columns(lookup_case_field, project_id, df, warning)
+
+    async def fill_id_fields(self, project_id: int, suite_id: int, df: DataFrame, categorical=False,
+                             section_paths=False):
+        """
+        A helper to resolve metadata fill up for Ids columns, the lookups are
+        pulled concurrently.
+
+        :param project_id:
+            The ID of the project
+        :param suite_id:
+            The ID of the test suite
+        :param df:
+            Dataframe contains Ids columns
+        :param categorical:
+            True to emit the name columns as `pandas.Categorical`
+        :param section_paths:
+            True to add the section path columns, see `Metas.fill_id_fields`
+        """
+        fields = {
+            'section_id': ('section_name', lambda: AsyncSections(self._session).get_sections_lookup(
+                project_id, suite_id)),
+            'template_id': ('template_name', lambda: AsyncTemplate(self._session).get_template_lookup(
+                project_id)),
+            'type_id': ('type_name', lambda: AsyncCaseTypes(self._session).get_case_types_lookup()),
+            'priority_id': ('priority_name', lambda: AsyncPriorities(self._session).get_priorities_lookup()),
+            'suite_id': ('suite_name', lambda: AsyncSuites(self._session).get_suites_lookup(project_id)),
+        }
+        if section_paths:
+            fields['section_id'] = ('section_name', lambda: AsyncSections(self._session).get_section_index(
+                project_id, suite_id))
+        columns = [c for c in fields if c in df.columns]
+        lookups = await asyncio.gather(*[fields[c][1]() for c in columns])
+        with stage(self._session, 'fill_id_fields'):
+            for column, lookup in zip(columns, lookups):
+                if isinstance(lookup, DataFrame):
+                    _fill_name_column(
+                        df, column, fields[column][0], dict(zip(lookup.index, lookup['name'])), categorical)
+                    _fill_section_paths(df, lookup, categorical)
+                else:
+                    _fill_name_column(df, column, fields[column][0], lookup, categorical)
+
+
+class AsyncRuns(_AsyncCategory):
+
+    async def get_run(self, run_id: int) -> dict:
+        return await self._session.get(f"get_run/{run_id}")
+
+    async def get_runs(self, project_id: int, **kwargs):
+        return await self._session.get(f"get_runs/{project_id}", params=kwargs)
+
+    @async_compact('runs')
+    @async_auto_offset
+    async def to_dataframe(self, project_id: int, **kwargs) -> DataFrame:
+        """
+        Returns a List of test runs for a project as DataFrame, see `Runs.to_dataframe`.
+
+        :param project_id: int
+            The ID of the project
+        :param kwargs: filters
+        :return: DataFrame
+        """
+        return await self.get_runs(project_id, **kwargs)
+
+    @async_iter_offset
+    async def iter_pages(self, project_id: int, **kwargs) -> AsyncIterator[DataFrame]:
+        """
+        Yields the test runs for a project page by page, see `Runs.iter_pages`.
+        """
+        return await self.get_runs(project_id, **kwargs)
+
+    async def get_runs_by_plan(self, *plan_ids: int) -> list:
+        """
+        Returns a list of run on an existing test plan.
+
+        :param plan_ids:
+            The ID or IDs of the test plan
+        :return: response
+        """
+        plans = await AsyncPlans(self._session).get_plans_by_id(*plan_ids)
+        return [run for plan in plans for entry in plan['entries'] for run in entry['runs']]
+
+    async def dataframe_from_plan(self, *plan_ids: int) -> DataFrame:
+        """
+        Returns a list of run on an existing test plan as Dataframe, see `Runs.dataframe_from_plan`.
+
+        :param plan_ids:
+            The ID or IDs of the test plan
+        :return: DataFrame
+        """
+        return (await AsyncPlans(self._session).expand(*plan_ids))[2]
+
+    @async_compact('runs')
+    async def get_runs_by_milestone(self, *milestone_ids: int, project_id: int) -> DataFrame:
+        """
+        Returns a list of run on an existing milestones, including those runs
+        in sub-milestones (at any depth) and plans, see `Runs.get_runs_by_milestone`.
+
+        :param milestone_ids:
+        :param project_id:
+            The ID of the project
+        :return: DataFrame
+        """
+        tree = await AsyncMilestones(self._session).get_milestone_tree(project_id, *milestone_ids)
+        chunks = _chunks(tree)
+        df_runs = await asyncio.gather(
+            *[self.to_dataframe(project_id=project_id, milestone_id=chunk) for chunk in chunks])
+        df_plans = await asyncio.gather(
+            *[AsyncPlans(self._session).to_dataframe(project_id=project_id, milestone_id=chunk) for chunk in chunks])
+        plan_ids = dict.fromkeys(plan_id for df in df_plans if 'id' in df.columns for plan_id in df['id'].to_list())
+        dfs = [df for df in [*df_runs, await self.dataframe_from_plan(*plan_ids)] if df.shape[0] > 0]
+        if not dfs:
+            return pd.DataFrame()
+        df = pd.concat(dfs)
+        return df.drop_duplicates('id').reset_index(drop=False) if 'id' in df.columns else df.reset_index(drop=False)
+
+
+class AsyncPlans(_AsyncCategory):
+
+    async def get_plan(self, plan_id: int) -> dict:
+        return await self._session.get(f"get_plan/{plan_id}")
+
+    async def get_plans(self, project_id: int, **kwargs):
+        return await self._session.get(f"get_plans/{project_id}", params=kwargs)
+
+    async def get_plans_by_id(self, *plan_ids: int) -> list:
+        """
+        Returns plans with their entries, each plan once, pulled concurrently.
+        """
+        return list(await asyncio.gather(*[self.get_plan(plan_id) for plan_id in dict.fromkeys(plan_ids)]))
+
+    async def expand(self, *plan_ids: int) -> tuple:
+        """
+        Returns plans, their entries and their runs as three normalized DataFrames, see `Plans.expand`.
+
+        :param plan_ids:
+            The ID or IDs of the test plan
+        :return: tuple of DataFrame (plans, entries, runs)
+        """
+        plans = await self.get_plans_by_id(*plan_ids)
+        project_ids = list(dict.fromkeys(plan['project_id'] for plan in plans if _has_configs(plan)))
+        meta = AsyncMetas(self._session)
+        configs = await asyncio.gather(*[meta.get_config_names(project_id) for project_id in project_ids])
+        return _expand_plans(plans, dict(zip(project_ids, configs)), getattr(self._session, 'compact_dtypes', False))
+
+    @async_compact('plans')
+    @async_auto_offset
+    async def to_dataframe(self, project_id: int, **kwargs) -> DataFrame:
+        """
+        Returns a list of test plans for a project in DataFrame, see `Plans.to_dataframe`.
+
+        :param project_id:
+            The ID of the project
+        :param kwargs: filters
+        :return: DataFrame
+        """
+        return await self.get_plans(project_id, **kwargs)
+
+    @async_iter_offset
+    async def iter_pages(self, project_id: int, **kwargs) -> AsyncIterator[DataFrame]:
+        """
+        Yields the test plans for a project page by page, see `Plans.iter_pages`.
+        """
+        return await self.get_plans(project_id, **kwargs)
+
+
+class AsyncCases(_AsyncCategory):
+
+    async def get_cases(self, project_id: int, **kwargs):
+        return await self._session.get(f"get_cases/{project_id}", params=kwargs)
+
+    @async_compact('cases')
+    async def to_dataframe(
+            self,
+            project_id: int,
+            suite_id: int,
+            with_meta=False,
+            categorical=False,
+            by_section=False,
+            max_workers: Optional[int] = None,
+            **kwargs
+    ) -> DataFrame:
+        """
+        Returns a list of test cases for a project or specific test suite in DataFrame,
+        see `Cases.to_dataframe`.
+
+        :param project_id:
+            The ID of the project
+        :param suite_id: int
+            The ID of the test suite
+        :param with_meta: boolean
+            ID's field will be filled up with new columns
+        :param categorical: boolean
+            True to emit the filled up name columns as `pandas.Categorical`
+        :param by_section: boolean
+            True to pull the cases of every section of the suite concurrently
+        :param max_workers:
+            Number of sections to pull at the same time with `by_section`, all at once by default
+        :param kwargs: filters
+        :return: DataFrame
+        """
+        if not by_section:
+            df = await self._cases(project_id, suite_id=suite_id, **kwargs)
+        else:
+            if 'section_id' in kwargs:
+                assert False, 'section_id has been managed by by_section'
+            df_sections = await AsyncSections(self._session).to_dataframe(project_id, suite_id)
+            section_ids = df_sections['id'].to_list() if 'id' in df_sections.columns else []
+            semaphore = asyncio.Semaphore(max_workers or max(1, len(section_ids)))
+
+            async def fetch(section_id):
+                async with semaphore:
+                    return await self._cases(project_id, suite_id=suite_id, section_id=section_id, **kwargs)
+
+            dfs = await asyncio.gather(*[fetch(section_id) for section_id in section_ids])
+            df = pd.concat(dfs).reset_index(drop=True) if dfs else DataFrame()
+        if with_meta:
+            meta = AsyncMetas(self._session)
+            await asyncio.gather(
+                meta.fill_id_fields(project_id, suite_id, df, categorical),
+                meta.fill_custom_fields(project_id, df))
+        return df
+
+    @async_auto_offset
+    async def _cases(self, project_id: int, **kwargs) -> DataFrame:
+        return await self.get_cases(project_id, limit=_category.page_size, **kwargs)
+
+    @async_iter_offset
+    async def iter_pages(self, project_id: int, suite_id: int, **kwargs) -> AsyncIterator[DataFrame]:
+        """
+        Yields the test cases of a project or test suite page by page, see `Cases.iter_pages`.
+        """
+        return await self.get_cases(project_id, suite_id=suite_id, limit=_category.page_size, **kwargs)
+
+
+class AsyncTests(_AsyncCategory):
+
+    async def get_tests(self, run_id: int, **kwargs):
+        return await self._session.get(f"get_tests/{run_id}", params=kwargs)
+
+    @async_compact('tests')
+    async def to_dataframe(
+            self,
+            *run_ids: int,
+            with_meta=False,
+            categorical=False,
+            project_id: Optional[int] = None,
+            max_workers: Optional[int] = None,
+            **kwargs
+    ) -> Optional[DataFrame]:
+        """
+        Returns single or multiple test run, the runs are pulled concurrently page by page
+        and the metadata is filled once per project, see `Tests.to_dataframe`.
+
+        :param run_ids:
+             The ID or IDs of the test run(s)
+        :param with_meta:
+            True to fill up template_id, type_id, priority_id with their respective name
+        :param categorical:
+            True to emit the filled up name columns as `pandas.Categorical`
+        :param project_id:
+            The ID of the project of all the runs if known, it saves looking up the run's projects
+        :param max_workers:
+            Number of runs to pull at the same time, all at once by default
+        :param kwargs: filters
+        :return: DataFrame
+        """
+        if not run_ids:
+            return None
+        semaphore = asyncio.Semaphore(max_workers or len(run_ids))
+
+        async def get_tests(run_id):
+            async with semaphore:
+                return await self._tests_for_run(run_id, **kwargs)
+
+        dfs = await asyncio.gather(*[get_tests(run_id) for run_id in run_ids])
+        if with_meta:
+            meta = AsyncMetas(self._session)
+            projects = {run_id: project_id for run_id in run_ids} if project_id is not None \
+                else await meta.get_run_projects(*run_ids)
+            groups = _group_frames(dfs, [projects[run_id] for run_id in run_ids])
+            await asyncio.gather(*[
+                fill for group_project_id, (_, df) in groups.items()
+                for fill in (meta.fill_id_fields(group_project_id, 0, df, categorical),
+                             meta.fill_custom_fields(group_project_id, df))])
+            dfs = _ungroup_frames(dfs, groups)
+        return _concat_categorical(dfs)
+
+    @async_auto_offset
+    async def _tests_for_run(self, run_id: int, **kwargs) -> DataFrame:
+        return await self.get_tests(run_id, limit=_category.page_size, **kwargs)
+
+    @async_iter_offset
+    async def iter_pages(self, run_id: int, **kwargs) -> AsyncIterator[DataFrame]:
+        """
+        Yields the tests of a test run page by page, see `Tests.iter_pages`.
+        """
+        return await self.get_tests(run_id, limit=_category.page_size, **kwargs)
+
+
+class AsyncMilestones(_AsyncCategory):
+
+    async def get_milestone(self, milestone_id: int) -> dict:
+        return await self._session.get(f"get_milestone/{milestone_id}")
+
+    async def get_milestones(self, project_id: int, **kwargs):
+        return await self._session.get(f"get_milestones/{project_id}", params=kwargs)
+
+    @async_auto_offset
+    async def to_dataframe(self, project_id: int, **kwargs) -> DataFrame:
+        """
+        Returns the list of milestones for a project as DataFrame, see `Milestones.to_dataframe`.
+        """
+        return await self.get_milestones(project_id, **kwargs)
+
+    async def get_milestone_tree(self, project_id: int, *milestone_ids: int) -> list:
+        """
+        Returns the IDs of milestones and all of their sub milestones, see `Milestones.get_milestone_tree`.
+        """
+        return _milestone_tree((await self.to_dataframe(project_id)).to_dict('records'), milestone_ids)
+
+    async def get_sub_milestones(self, *milestone_ids: int) -> list:
+        """
+        Returns sub milestones of a milestone if any.
+
+        :param milestone_ids:
+            The ID or IDs of the milestone
+        :return: response
+        """
+        milestones = await asyncio.gather(*[self.get_milestone(mid) for mid in milestone_ids])
+        return [sub for milestone in milestones for sub in milestone['milestones']]
+
+    async def sub_milestones_to_dataframe(self, *milestone_ids: int) -> DataFrame:
+        return DataFrame(await self.get_sub_milestones(*milestone_ids))
+
+
+class AsyncSections(_AsyncCategory):
+
+    async def get_sections(self, project_id: int, **kwargs):
+        return await self._session.get(f"get_sections/{project_id}", params=kwargs)
+
+    @async_auto_offset
+    async def to_dataframe(self, project_id: int, suite_id: int, **kwargs) -> DataFrame:
+        return await self.get_sections(
+            project_id, suite_id=suite_id, limit=_category.page_size, **kwargs)
+
+    async def get_sections_lookup(self, project_id: int, suite_id: int) -> dict:
+        df = await self.to_dataframe(project_id, suite_id)
+        return dict(zip(df['id'], df['name']))
+
+    async def get_section_index(self, project_id: int, suite_id: int) -> DataFrame:
+        """
+        Returns the section tree of a suite, see `Sections.get_section_index`.
+        """
+        df = await self.to_dataframe(project_id, suite_id)
+        return _section_tree(df.to_dict('records') if 'id' in df.columns else [])
+
+
+class AsyncTemplate(_AsyncCategory):
+
+    async def get_templates(self, project_id: int):
+        return await self._session.get(f"get_templates/{project_id}")
+
+    async def to_dataframe(self, project_id: int) -> DataFrame:
+        return DataFrame(await self.get_templates(project_id))
+
+    async def get_template_lookup(self, project_id: int) -> dict:
+        df = await self.to_dataframe(project_id)
+        return dict(zip(df['id'], df['name']))
+
+
+class AsyncCaseFields(_AsyncCategory):
+
+    async def get_case_fields(self):
+        return await self._session.get("get_case_fields")
+
+    async def get_configs(self) -> dict:
+        """
+        Return a map for case field, see `CaseFields.get_configs`.
+        """
+        return _parse_case_fields(await self.get_case_fields())[0]
+
+    async def get_configs_index(self) -> dict:
+        """
+        Return the reverse map of `get_configs`, see `CaseFields.get_configs_index`.
+        """
+        return _parse_case_fields(await self.get_case_fields())[1]
+
+
+class AsyncCaseTypes(_AsyncCategory):
+
+    async def get_case_types(self):
+        return await self._session.get("get_case_types")
+
+    async def to_dataframe(self) -> DataFrame:
+        return DataFrame(await self.get_case_types())
+
+    async def get_case_types_lookup(self) -> dict:
+        df = await self.to_dataframe()
+        return dict(zip(df['id'], df['name']))
+
+
+class AsyncPriorities(_AsyncCategory):
+
+    async def get_priorities(self):
+        return await self._session.get("get_priorities")
+
+    async def to_dataframe(self) -> DataFrame:
+        return DataFrame(await self.get_priorities())
+
+    async def get_priorities_lookup(self) -> dict:
+        df = await self.to_dataframe()
+        return dict(zip(df['id'], df['name']))
+
+
+class AsyncResults(_AsyncCategory):
+
+    @async_compact('results')
+    @async_auto_offset
+    async def dataframe_from_case(self, run_id: int, case_id: int, **kwargs) -> DataFrame:
+        """
+        Returns a list of test results for a test run and case combination in Dataframe,
+        see `Results.dataframe_from_case`.
+        """
+        return await self._session.get(
+            f"get_results_for_case/{run_id}/{case_id}", params={'limit': _category.page_size, **kwargs})
+
+    @async_compact('results')
+    @async_auto_offset
+    async def dataframe_from_test(self, test_id: int, **kwargs) -> DataFrame:
+        """
+        Returns a list of test results for a test as DataFrame, see `Results.dataframe_from_test`.
+        """
+        return await self._session.get(
+            f"get_results/{test_id}", params={'limit': _category.page_size, **kwargs})
+
+    @async_auto_offset
+    async def _results_for_run(self, run_id: int, **kwargs) -> DataFrame:
+        return await self._session.get(
+            f"get_results_for_run/{run_id}", params={'limit': _category.page_size, **kwargs})
+
+    @async_compact('results')
+    async def dataframe_from_run(self, run_id: int, **kwargs) -> DataFrame:
+        """
+        Returns a list of test results for a test run, see `Results.dataframe_from_run`.
+        """
+        return await self._results_for_run(run_id, **kwargs)
+
+    @async_iter_offset
+    async def iter_case_pages(self, run_id: int, case_id: int, **kwargs) -> AsyncIterator[DataFrame]:
+        """
+        Yields the test results for a test run and case combination page by page,
+        see `Results.iter_case_pages`.
+        """
+        return await self._session.get(
+            f"get_results_for_case/{run_id}/{case_id}", params={'limit': _category.page_size, **kwargs})
+
+    @async_iter_offset
+    async def iter_test_pages(self, test_id: int, **kwargs) -> AsyncIterator[DataFrame]:
+        """
+        Yields the test results for a test page by page, see `Results.iter_test_pages`.
+        """
+        return await self._session.get(
+            f"get_results/{test_id}", params={'limit': _category.page_size, **kwargs})
+
+    @async_iter_offset
+    async def iter_run_pages(self, run_id: int, **kwargs) -> AsyncIterator[DataFrame]:
+        """
+        Yields the test results for a test run page by page, see `Results.iter_run_pages`.
+
+        >>> async for df in api.results.iter_run_pages(run_id=1):
+        ...     ...
+        """
+        return await self._session.get(
+            f"get_results_for_run/{run_id}", params={'limit': _category.page_size, **kwargs})
+
+    @async_compact('results')
+    async def dataframe_from_runs(self, *run_ids: int, max_workers: Optional[int] = None, **kwargs) -> DataFrame:
+        """
+        Returns a list of test results for one or many test runs.
+
+        :param run_ids:
+            The ID or IDs of the test run(s)
+        :param max_workers:
+            Number of runs to pull concurrently. When set, a failed run does not
+            abort the pull; it is listed in `df.attrs['failed_runs']` instead.
+        :param kwargs: filters, see `Results.dataframe_from_run`
+        :return: DataFrame
+        """
+        return await _gather_runs(
+            run_ids, max_workers, lambda run_id: self._results_for_run(run_id, **kwargs))
+
+    @async_compact('results')
+    async def dataframe_from_milestone(
+            self,
+            project_id: int,
+            *milestone_ids: int,
+            max_workers: Optional[int] = None,
+            **kwargs
+    ) -> DataFrame:
+        """
+        Returns a list of test results from milestone(s) which contains run(s).
+
+        :param project_id:
+            The ID of the project
+        :param milestone_ids:
+            The ID or IDs of the milestone(s)
+        :param max_workers:
+            Number of runs to pull concurrently. When set, a failed run does not
+            abort the pull; it is listed in `df.attrs['failed_runs']` instead.
+        :param kwargs: filters, see `Results.dataframe_from_run`
+        :return: DataFrame
+        """
+        runs = AsyncRuns(self._session)
+        df_runs = await asyncio.gather(
+            *[runs.to_dataframe(project_id=project_id, milestone_id=chunk) for chunk in _chunks(list(milestone_ids))])
+        run_ids = [run_id for df in df_runs if 'id' in df.columns for run_id in df['id'].to_list()]
+        return await _gather_runs(
+            run_ids, max_workers, lambda run_id: self._results_for_run(run_id, **kwargs))
+
+
+class AsyncSuites(_AsyncCategory):
+
+    async def get_suites(self, project_id: int):
+        return await self._session.get(f"get_suites/{project_id}")
+
+    async def to_dataframe(self, project_id: int) -> DataFrame:
+        return DataFrame(await self.get_suites(project_id))
+
+    async def get_suites_lookup(self, project_id: int) -> dict:
+        df = await self.to_dataframe(project_id)
+        return dict(zip(df['id'], df['name']))
+
+
+class AsyncStatuses(_AsyncCategory):
+
+    async def get_statuses(self):
+        return await self._session.get("get_statuses")
+
+    async def to_dataframe(self) -> DataFrame:
+        return DataFrame(await self.get_statuses())
+
+    async def get_statuses_lookup(self, column='name') -> dict:
+        df = await self.to_dataframe()
+        return dict(zip(df['id'], df[column]))
+
+
+class AsyncTestRailAPI(AsyncSession):
+    """
+    An asyncio client exposing the same categories as `TestRailAPI`.
+
+    >>> async with AsyncTestRailAPI(url, email, password) as api:
+    ...     df = await api.results.dataframe_from_runs(1, 2, 3, max_workers=8)
+
+    Categories are kept for the lifetime of the instance, see `TestRailAPI`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._categories = {}
+
+    def _category(self, cls):
+        return self._categories.get(cls) or self._categories.setdefault(cls, cls(self))
+
+    @property
+    def runs(self) -> AsyncRuns:
+        return self._category(AsyncRuns)
+
+    @property
+    def plans(self) -> AsyncPlans:
+        return self._category(AsyncPlans)
+
+    @property
+    def results(self) -> AsyncResults:
+        return self._category(AsyncResults)
+
+    @property
+    def cases(self) -> AsyncCases:
+        return self._category(AsyncCases)
+
+    @property
+    def milestones(self) -> AsyncMilestones:
+        return self._category(AsyncMilestones)
+
+    @property
+    def case_fields(self) -> AsyncCaseFields:
+        return self._category(AsyncCaseFields)
+
+    @property
+    def sections(self) -> AsyncSections:
+        return self._category(AsyncSections)
+
+    @property
+    def templates(self) -> AsyncTemplate:
+        return self._category(AsyncTemplate)
+
+    @property
+    def case_types(self) -> AsyncCaseTypes:
+        return self._category(AsyncCaseTypes)
+
+    @property
+    def priorities(self) -> AsyncPriorities:
+        return self._category(AsyncPriorities)
+
+    @property
+    def suites(self) -> AsyncSuites:
+        return self._category(AsyncSuites)
+
+    @property
+    def statuses(self) -> AsyncStatuses:
+        return self._category(AsyncStatuses)
+
+    @property
+    def tests(self) -> AsyncTests:
+        return self._category(AsyncTests)
+
+    @property
+    def metas(self) -> AsyncMetas:
+        return self._category(AsyncMetas)
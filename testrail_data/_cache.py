@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pandas import DataFrame
+
+_MISSING = object()
+
+
+class ResultCache:
+    """
+    An on-disk LRU cache for the results of completed runs.
+
+    Each entry is a Parquet (or Feather) file keyed by TestRail instance, run id and
+    filter kwargs. Reading an entry refreshes its modification time; once the cache
+    grows over `max_bytes` the least recently used files are removed.
+
+    >>> api = TestRailAPI(result_cache=ResultCache('~/.cache/testrail_data', max_bytes=2 * 1024 ** 3))
+    """
+
+    formats = ('parquet', 'feather')
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = 1024 ** 3, fmt: str = 'parquet'):
+        """
+        :param path:
+            Directory to keep the cached files in
+        :param max_bytes:
+            Size cap of the cache directory, default is 1 GiB
+        :param fmt:
+            `parquet` or `feather`, both require pyarrow
+        """
+        assert fmt in self.formats, f'fmt must be one of {self.formats}'
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError('ResultCache requires pyarrow, run `pip install testrail-data[cache]`')
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.fmt = fmt
+        self._lock = threading.Lock()
+
+    def key(self, instance: str, run_id: int, filters: Optional[dict] = None) -> str:
+        """
+        Returns the cache key of a run's results pulled with `filters`.
+
+        :param instance:
+            The TestRail address
+        :param run_id:
+            The ID of the test run
+        :param filters:
+            The filter kwargs the results are pulled with
+        :return: str
+        """
+        payload = json.dumps([instance, run_id, filters or {}], sort_keys=True, default=str)
+        return f'{run_id}-{hashlib.sha1(payload.encode()).hexdigest()}'
+
+    def _file(self, key: str) -> Path:
+        return self.path / f'{key}.{self.fmt}'
+
+    def get(self, key: str) -> Optional['DataFrame']:
+        """
+        Returns the cached DataFrame or None when the key is not cached.
+        """
+        import pandas as pd
+
+        file = self._file(key)
+        try:
+            df = pd.read_parquet(file) if self.fmt == 'parquet' else pd.read_feather(file)
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(file)
+        except FileNotFoundError:
+            pass
+        return df
+
+    def put(self, key: str, df: 'DataFrame') -> bool:
+        """
+        Stores a DataFrame and evicts the least recently used entries beyond the size cap.
+
+        :return: False when the DataFrame cannot be serialized and was not cached
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        os.close(fd)
+        try:
+            if self.fmt == 'parquet':
+                df.to_parquet(tmp)
+            else:
+                df.reset_index(drop=True).to_feather(tmp)
+            os.replace(tmp, self._file(key))
+        except (ValueError, TypeError, NotImplementedError):
+            os.remove(tmp)
+            return False
+        self.evict()
+        return True
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits `max_bytes`.
+        """
+        with self._lock:
+            files = []
+            for file in self.path.glob(f'*.{self.fmt}'):
+                try:
+                    stat = file.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, file))
+            total = sum(size for _, size, _ in files)
+            for _, size, file in sorted(files, key=lambda x: x[0]):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    file.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def clear(self):
+        """
+        Removes every cached entry.
+        """
+        with self._lock:
+            for file in self.path.glob(f'*.{self.fmt}'):
+                try:
+                    file.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+class MetaCache:
+    """
+    A thread-safe in-memory cache of metadata lookups with a time to live.
+
+    Entries are keyed by kind and ids, e.g. `('sections', <PROJECT_ID>, <SUITE_ID>)`.
+    Concurrent requests for the same missing key wait for a single load instead
+    of each pulling it.
+    """
+
+    project_kinds = ('sections', 'section_index', 'templates', 'suites', 'configs')
+
+    def __init__(self, ttl: float = 300):
+        """
+        :param ttl:
+            Seconds an entry is served for before it is loaded again
+        """
+        self.ttl = ttl
+        self._entries = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, loader, *ids):
+        """
+        Returns the cached value of a key, calling `loader()` once when it is missing or expired.
+
+        :param kind:
+            The kind of metadata, e.g. `sections`
+        :param loader:
+            A callable pulling the value
+        :param ids:
+            The ids the value belongs to; project scoped kinds start with the project id
+        """
+        key = (kind, *ids)
+        value = self._fresh(key)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self._fresh(key)
+            if value is _MISSING:
+                value = loader()
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def peek(self, kind: str, *ids):
+        """
+        Returns the cached value of a key or None, without loading it.
+        """
+        value = self._fresh((kind, *ids))
+        return None if value is _MISSING else value
+
+    def pin(self, kind: str, value, *ids):
+        """
+        Caches a value which never changes (e.g. a completed plan) without expiry.
+        """
+        self._entries[(kind, *ids)] = (float('inf'), value)
+
+    def _fresh(self, key):
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return _MISSING
+        return entry[1]
+
+    def invalidate(self, *kinds: str, project_id: Optional[int] = None):
+        """
+        Drops cached entries; everything by default, otherwise only the given
+        kinds and/or the project scoped entries (sections, templates, suites, configs, ...) of a project.
+
+        :param kinds:
+            Kinds of metadata to drop, e.g. `sections`, `case_fields`
+        :param project_id:
+            The ID of the project to drop the entries of
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if kinds and key[0] not in kinds:
+                    continue
+                if project_id is not None and (key[0] not in self.project_kinds or key[1] != project_id):
+                    continue
+                del self._entries[key]
@@ -1,6 +1,16 @@
+import ast
+import copy
+import itertools
+import operator
+import threading
 import time
-from typing import Optional
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 import functools
+from testrail_data._schema import apply_schema, compact
+from testrail_data._stats import stage
 from testrail_api._category import Runs as TR_Runs, _MetaCategory
 from testrail_api._category import Plans as TR_Plans
 from testrail_api._category import Results as TR_Results
@@ -14,55 +24,735 @@ from testrail_api._category import CaseTypes as TR_CaseType
 from testrail_api._category import Priorities as TR_Priorities
 from testrail_api._category import Suites as TR_Suites
 from testrail_api._category import Statuses as TR_Statuses
+from testrail_api._category import Configurations as TR_Configurations
 from requests.exceptions import ConnectionError
-from pandas import DataFrame
+from pandas import DataFrame, Series
+from pandas.api.types import is_object_dtype
+import numpy as np
 import pandas as pd
 
 page_size = 250
 retry_total = 5
 retry_sleep = 2
+prefetch_window = 0
+global_project = 'global'
+filter_chunk_size = 100
+section_path_separator = ' > '
 
 
-def auto_offset(f):
+def _prefetch_pages(fetch, window: int) -> Iterator[list]:
+    """
+    Fetch pages with up to `window` offsets in flight on a thread pool.
+    Pages are yielded in offset order and no more offsets are scheduled
+    once a short page comes back.
+
+    :param fetch:
+        Callable taking an offset and an event, set once no more pages are needed,
+        and returning the records of a page
+    :param window:
+        Number of pages to keep in flight
+    :return: iterator of lists of records
+    """
+    done = threading.Event()
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        pending = deque(executor.submit(fetch, i * page_size, done) for i in range(window))
+        offset = window * page_size
+        try:
+            while pending:
+                records = pending.popleft().result()
+                if len(records) == page_size:
+                    pending.append(executor.submit(fetch, offset, done))
+                    offset += page_size
+                    yield records
+                else:
+                    yield records
+                    break
+        finally:
+            done.set()
+            for future in pending:
+                future.cancel()
+
+
+class _Columns:
     """
-    A decorator to work with pagination and connection error retry.
+    Builds a single DataFrame out of pages of records, appending every record
+    to a list per column instead of building a DataFrame per page and concatenating them.
 
-    :param f:
-    :return:
+    Fields missing from a record are NaN, the frame equals `DataFrame(<ALL RECORDS>)`
+    with the index of the concatenated pages.
     """
-    @functools.wraps(f)
-    def wrap(*args, **kwargs):
-        offset = 0
+
+    def __init__(self):
+        self.columns = {}
+        self.sizes = []
+
+    def extend(self, records: list):
+        columns = self.columns
+        n = sum(self.sizes)
+        for record in records:
+            for key, value in record.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [np.nan] * n
+                column.append(value)
+            n += 1
+            if len(record) != len(columns):
+                for column in columns.values():
+                    if len(column) < n:
+                        column.append(np.nan)
+        self.sizes.append(len(records))
+
+    def frame(self) -> DataFrame:
+        index = None
+        if len(self.sizes) > 1:
+            index = np.concatenate([np.arange(size) for size in self.sizes])
+        if not self.columns:
+            return DataFrame(index=index)
+        return DataFrame(self.columns, index=index)
+
+
+def _fan_out(func, keys, max_workers: int):
+    """
+    Call `func` for every key on a bounded thread pool.
+
+    :param func:
+        Callable taking a single key
+    :param keys:
+        Keys to call `func` with
+    :param max_workers:
+        Maximum number of concurrent calls
+    :return: tuple
+        A list of results in the order of `keys` (None where the call failed)
+        and a dict of {<KEY>: <EXCEPTION>} for the failed calls
+    """
+    keys = list(keys)
+    results = [None] * len(keys)
+    failures = {}
+    if not keys:
+        return results, failures
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys)))) as executor:
+        futures = [executor.submit(func, key) for key in keys]
+        for i, (key, future) in enumerate(zip(keys, futures)):
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                failures[key] = e
+    return results, failures
+
+
+def _chunks(ids: list, size: Optional[int] = None) -> list:
+    """
+    Split ids into lists of `filter_chunk_size` for comma separated list filters.
+    """
+    size = size or filter_chunk_size
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+def _milestone_tree(milestones: list, milestone_ids) -> list:
+    """
+    Walk the milestone tree of `milestone_ids` depth first, in pre-order and without duplicates.
+
+    :param milestones:
+        The milestones of the project as returned by `get_milestones`
+    :param milestone_ids:
+        The IDs of the milestones to start from
+    :return: list of milestone IDs
+    """
+    children = {}
+
+    def collect(records: list):
+        for milestone in records:
+            parent_id = milestone.get('parent_id')
+            if parent_id is not None and not pd.isna(parent_id):
+                children.setdefault(int(parent_id), []).append(int(milestone['id']))
+            nested = milestone.get('milestones')
+            if isinstance(nested, list):
+                for sub in nested:
+                    children.setdefault(int(milestone['id']), []).append(int(sub['id']))
+                collect(nested)
+
+    collect(milestones)
+    tree = []
+    seen = set()
+    stack = list(reversed(milestone_ids))
+    while stack:
+        milestone_id = stack.pop()
+        if milestone_id in seen:
+            continue
+        seen.add(milestone_id)
+        tree.append(milestone_id)
+        stack.extend(reversed(list(dict.fromkeys(children.get(milestone_id, [])))))
+    return tree
+
+
+def _has_configs(plan: dict) -> bool:
+    return any(run.get('config_ids') for entry in plan.get('entries') or [] for run in entry.get('runs') or [])
+
+
+def _expand_plans(plans: list, configs: dict, compact_dtypes=False) -> tuple:
+    """
+    Normalize plans into plan, entry and run frames, see `Plans.expand`.
+
+    :param plans:
+        Plans as returned by `get_plan`
+    :param configs:
+        {<PROJECT_ID>: {<CONFIG_ID>: (<GROUP_NAME>, <CONFIG_NAME>)}}
+    """
+    plan_rows, entry_rows, run_rows = [], [], []
+    for plan in plans:
+        plan_rows.append({k: v for k, v in plan.items() if k != 'entries'})
+        config_names = configs.get(plan.get('project_id'), {})
+        for entry in plan.get('entries') or []:
+            entry_rows.append({**{k: v for k, v in entry.items() if k != 'runs'}, 'plan_id': plan['id']})
+            for run in entry.get('runs') or []:
+                row = {**run, 'plan_id': plan['id'], 'entry_id': entry.get('id')}
+                for config_id in run.get('config_ids') or []:
+                    if config_id in config_names:
+                        group, name = config_names[config_id]
+                        row[f'config_{group}'] = name
+                run_rows.append(row)
+    df_plans, df_entries, df_runs = DataFrame(plan_rows), DataFrame(entry_rows), DataFrame(run_rows)
+    if compact_dtypes:
+        apply_schema(df_plans, 'plans')
+        apply_schema(df_runs, 'runs')
+    return df_plans, df_entries, df_runs
+
+
+def _grow_pool(session, max_workers: Optional[int], prefetch: Optional[int] = None):
+    """
+    Let the connection pool of a session keep a connection per concurrent request,
+    `max_workers` pulls of `prefetch` pages each.
+    """
+    grow = getattr(session, 'grow_pool', None)
+    size = (max_workers or 1) * max(1, prefetch_window if prefetch is None else prefetch)
+    if grow is not None and size > 1:
+        grow(size)
+
+
+def _concat_runs(run_ids, max_workers: Optional[int], fetch) -> Optional[DataFrame]:
+    """
+    Pull a DataFrame per run and concatenate them in the order of `run_ids`.
+
+    Without `max_workers` runs are pulled one after another and the first error is raised.
+    With `max_workers` runs are pulled concurrently; failed runs are skipped, reported with
+    a warning and listed in `df.attrs['failed_runs']` as {<RUN_ID>: <ERROR>}.
+    """
+    if not max_workers:
+        dfs = [fetch(run_id) for run_id in run_ids]
+        return pd.concat(dfs).reset_index(drop=True) if dfs else None
+
+    results, failures = _fan_out(fetch, run_ids, max_workers)
+    return _concat_frames([df for df in results if df is not None], failures)
+
+
+def _concat_frames(dfs: list, failures: dict) -> Optional[DataFrame]:
+    """
+    Concatenate the frames of the runs pulled successfully and report the failed ones.
+    """
+    if not dfs and not failures:
+        return None
+    df = pd.concat(dfs).reset_index(drop=True) if dfs else DataFrame()
+    if failures:
+        df.attrs['failed_runs'] = {run_id: repr(e) for run_id, e in failures.items()}
+        warnings.warn(f'Failed to pull {len(failures)} run(s): {sorted(failures)}')
+    return df
+
+
+def _project_runs(session, project_id: int, max_workers: int = 1, **kwargs) -> tuple:
+    """
+    Pull the runs of a project together with the runs of its test plans, which `get_runs` leaves out.
+
+    :param kwargs: filters of `Runs.to_dataframe`, `suite_id` is applied to the runs of plans
+        once they are pulled and `refs_filter` only to the runs outside of plans
+    :return: tuple
+        The runs as dicts, each run once and the ones of plans with their `plan_id`,
+        the plans as listed by `get_plans` and a dict of {<PLAN_ID>: <EXCEPTION>}
+        for the plans which failed to pull, their runs are missing
+    """
+    plan_filters = {k: v for k, v in kwargs.items() if k not in ('suite_id', 'refs_filter')}
+    plans = [plan for df in Plans(session).iter_pages(project_id, **plan_filters) for plan in df.to_dict('records')]
+    details, failures = _fan_out(Plans(session)._get_plan, [plan['id'] for plan in plans], max_workers)
+    suite_ids = kwargs.get('suite_id')
+    if isinstance(suite_ids, str):
+        suite_ids = suite_ids.split(',')
+    elif suite_ids is not None and not isinstance(suite_ids, (list, tuple)):
+        suite_ids = [suite_ids]
+    suite_ids = None if suite_ids is None else {int(suite_id) for suite_id in suite_ids}
+
+    runs = [run for df in Runs(session).iter_pages(project_id, **kwargs) for run in df.to_dict('records')]
+    runs.extend({**run, 'plan_id': plan['id']} for plan in details if plan for entry in plan.get('entries') or []
+                for run in entry.get('runs') or [] if suite_ids is None or run.get('suite_id') in suite_ids)
+    return list({int(run['id']): run for run in runs}.values()), plans, failures
+
+
+def _retry_total(category) -> int:
+    """
+    Number of attempts of a page, a session with a scheduler retries connection errors itself.
+    """
+    return 1 if getattr(getattr(category, '_session', None), 'scheduler', None) else retry_total
+
+
+def _offset_pages(f):
+    """
+    Turns a method that pulls the records of a single page into a generator of the
+    records of all pages, with connection error retry, see `iter_offset`.
+    """
+    def wrap(*args, **kwargs) -> Iterator[list]:
         if kwargs.get('offset'):
             assert False, 'offset has been auto managed'
+        window = kwargs.pop('prefetch', prefetch_window) or 0
 
-        def auto_reset_connection(*_args, **_kwargs):
-            trial = retry_total
+        session = getattr(args[0], '_session', None)
+        stats = getattr(session, 'stats', None)
+
+        def auto_reset_connection(*_args, _done=None, **_kwargs):
+            trial = _retry_total(args[0])
             while trial > 0:
                 try:
-                    return f(*_args, **_kwargs)
+                    return f(*_args, **_kwargs) or []
                 except ConnectionError:
                     trial -= 1
                     if trial == 0:
                         raise
-                    time.sleep(retry_sleep)
+                    if _done is None:
+                        time.sleep(retry_sleep)
+                    elif _done.wait(retry_sleep):
+                        # a prefetched page past the end is not worth retrying
+                        raise
+                    if stats is not None:
+                        stats.record_retry()
                     continue
 
-        df = auto_reset_connection(*args, **kwargs, offset=offset)
-        data_size = df.shape[0]
-        frames = [df]
-        while data_size == page_size:
-            offset += page_size
-            df2 = auto_reset_connection(*args, **kwargs, offset=offset)
-            data_size = df2.shape[0]
-            frames.append(df2)
-        return pd.concat(frames, sort=False)
+        def pages():
+            offset = 0
+            data_size = page_size
+            while data_size == page_size:
+                records = auto_reset_connection(*args, **kwargs, offset=offset)
+                data_size = len(records)
+                offset += page_size
+                yield records
+
+        if window > 1:
+            _grow_pool(session, 1, window)
+            return _count_pages(session, f.__qualname__, _prefetch_pages(
+                lambda _offset, _done: auto_reset_connection(*args, **kwargs, offset=_offset, _done=_done), window))
+        return _count_pages(session, f.__qualname__, pages())
+
+    return wrap
+
+
+def iter_offset(f):
+    """
+    A decorator turning a method that pulls the records of a single page into
+    a generator of all pages as DataFrames, with connection error retry.
+
+    Pages are pulled one after another, or `prefetch=<n>` pages at a time (see
+    `auto_offset`), and only the pages in flight are held in memory.
+
+    :param f:
+    :return:
+    """
+    pages = _offset_pages(f)
+
+    @functools.wraps(f)
+    def wrap(*args, **kwargs) -> Iterator[DataFrame]:
+        return _frames(getattr(args[0], '_session', None), pages(*args, **kwargs))
+
+    return wrap
+
+
+def _frames(session, pages: Iterator[list]) -> Iterator[DataFrame]:
+    for records in pages:
+        with stage(session, 'build'):
+            df = DataFrame(records)
+        yield df
+
+
+def _count_pages(session, method: str, pages: Iterator[list]) -> Iterator[list]:
+    """
+    Record the number of pages walked in the session's `stats`, once the walk ends.
+    """
+    stats = getattr(session, 'stats', None)
+    if stats is None:
+        return pages
+
+    def walk():
+        count = 0
+        try:
+            for records in pages:
+                count += 1
+                yield records
+        finally:
+            stats.record_pages(method, count)
+
+    return walk()
+
+
+def auto_offset(f):
+    """
+    A decorator to work with pagination and connection error retry, the records
+    of all pages are collected per column and turned into a single DataFrame.
+
+    Pages are pulled one after another by default. Pass `prefetch=<n>` to the
+    decorated method (or set the module level `prefetch_window`) to keep `n`
+    pages in flight concurrently; pages are still returned in order.
+
+    :param f:
+    :return:
+    """
+    pages = _offset_pages(f)
+
+    @functools.wraps(f)
+    def wrap(*args, **kwargs):
+        session = getattr(args[0], '_session', None)
+        columns = _Columns()
+        for records in pages(*args, **kwargs):
+            with stage(session, 'build'):
+                columns.extend(records)
+        with stage(session, 'concat'):
+            return columns.frame()
 
     return wrap
 
 
+def _parse_list_value(x: str):
+    """
+    Parse a list-valued custom field stored as string, e.g. `'[1, 2]'`.
+    Anything else than a list literal is returned as is.
+    """
+    try:
+        value = ast.literal_eval(x)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return x
+    return value if isinstance(value, list) else x
+
+
+def _custom_field_key(x):
+    """
+    Normalise a scalar custom field value into its option id, floats and numeric strings are cast to int.
+    """
+    if isinstance(x, float) or (isinstance(x, str) and x.isnumeric()):
+        return int(x)
+    return x
+
+
+def _resolve_custom_values(values: Series, options: dict):
+    """
+    Resolve distinct custom field values into their option labels.
+
+    :param values:
+        Distinct values; list values are given as tuples
+    :param options:
+        The {<ID>: <LABEL>} map of the field for the project
+    :return: tuple
+        The labels and a mask of the unmatched values
+    """
+    result = Series('', index=values.index, dtype=object)
+    unknown = Series(False, index=values.index)
+    origin = values.map(lambda x: str(list(x)) if isinstance(x, tuple) else x)
+    is_str = values.map(type).eq(str)
+    if is_str.any():
+        values = values.copy()
+        values.loc[is_str] = values.loc[is_str].map(_parse_list_value)
+    kinds = values.map(type)
+    is_list = kinds.eq(list) | kinds.eq(tuple)
+    empty = values.map(operator.not_).astype(bool) | values.isna()
+    is_scalar = ~(empty | is_list)
+    is_list &= ~empty
+
+    if is_scalar.any():
+        keys = values.loc[is_scalar].map(_custom_field_key)
+        labels = keys.map(options)
+        missing = labels.isna()
+        result.loc[is_scalar] = labels.where(~missing, 'UNKNOWN ' + keys.map(str))
+        unknown.loc[keys.index[missing]] = True
+
+    if is_list.any():
+        items = values.loc[is_list].explode()
+        items = items[items.ne(0)]
+        labels = items.map(options)
+        is_missing = labels.isna().to_numpy()
+        # exploded items keep their row's index, so each row is a contiguous run
+        found = zip(labels.index[~is_missing], labels.to_numpy(dtype=object)[~is_missing])
+        joined = {key: ','.join(str(label) for _, label in group)
+                  for key, group in itertools.groupby(found, key=operator.itemgetter(0))}
+        result.loc[list(joined)] = list(joined.values())
+        missing = pd.unique(labels.index[is_missing])
+        result.loc[missing] = 'UNKNOWN ' + origin.loc[missing].map(str)
+        unknown.loc[missing] = True
+    return result, unknown
+
+
+def _resolve_custom_column(s: Series, options: dict, warning=False) -> Series:
+    """
+    Resolve a custom-column into its option labels.
+
+    Empty values give `''`, list values (or their string form) are joined with `,`
+    skipping zeros, and unmatched values give `UNKNOWN <value>`. Labels are resolved
+    once per distinct value and mapped back onto the rows.
+
+    :param s:
+        The custom-column
+    :param options:
+        The {<ID>: <LABEL>} map of the field for the project
+    :param warning:
+        True to print unmatched values
+    """
+    values = s
+    if is_object_dtype(s.dtype):
+        values = Series(s.to_numpy(dtype=object))
+        is_list = values.map(type).eq(list)
+        if is_list.any():
+            values.loc[is_list] = values.loc[is_list].map(tuple)
+    codes, uniques = pd.factorize(values)
+    labels, unknown = _resolve_custom_values(Series(np.asarray(uniques, dtype=object), dtype=object), options)
+    # missing values are coded -1, which picks the trailing empty label
+    labels = np.append(labels.to_numpy(dtype=object), '')
+    unknown = np.append(unknown.to_numpy(dtype=bool), False)[codes]
+
+    if warning and unknown.any():
+        for x in s.to_numpy(dtype=object)[unknown]:
+            print(s.name, x, type(x))
+    return Series(labels[codes], index=s.index, name=s.name)
+
+
+def _fill_custom_columns(lookup_case_field: dict, project_id: int, df: DataFrame, warning=False):
+    """
+    Replace the values of custom-columns in place with their labels.
+
+    :param lookup_case_field:
+        The case field map returned by `CaseFields.get_configs`
+    :param project_id:
+        The ID of the project
+    :param df:
+        Dataframe contains custom-columns
+    :param warning:
+        False to turn off warning for unmatched columns, True is otherwise.
+    """
+    for col in [c for c in df.columns if 'custom_' in c]:
+        lookup_custom_field = lookup_case_field.get(col)
+        if lookup_custom_field is None:
+            if warning:
+                for x in df[col]:
+                    print(col, x, type(x))
+            df[col] = ('UNKNOWN ' + Series(df[col].to_numpy(dtype=object)).map(str)).to_list()
+        elif project_id in lookup_custom_field:
+            df[col] = _resolve_custom_column(df[col], lookup_custom_field[project_id], warning)
+        elif global_project in lookup_custom_field:
+            df[col] = _resolve_custom_column(df[col], lookup_custom_field[global_project], warning)
+        else:
+            df[col] = ''
+
+
+def _fill_name_column(df: DataFrame, id_column: str, name_column: str, lookup: dict, categorical=False):
+    """
+    Add `name_column` to the DataFrame by looking up `id_column` in `lookup`.
+    Unmatched IDs are assigned with `UNKNOWN <id>`, or with the `UNKNOWN`
+    category when `categorical` is True.
+    """
+    ids = df[id_column]
+    if categorical:
+        categories = list(pd.unique(Series(list(lookup.values()), dtype=object)))
+        if 'UNKNOWN' not in categories:
+            categories.append('UNKNOWN')
+        position = {name: i for i, name in enumerate(categories)}
+        codes = ids.map({key: position[name] for key, name in lookup.items()})
+        codes = codes.fillna(position['UNKNOWN']).astype('int64')
+        df[name_column] = pd.Categorical.from_codes(codes.to_numpy(), categories=categories)
+        return
+
+    names = ids.map(lookup)
+    missing = (names.isna() & ~ids.isin(list(lookup))).to_numpy()
+    if missing.any():
+        names = names.to_numpy(dtype=object)
+        names[missing] = [f'UNKNOWN {key}' for key in ids.to_numpy(dtype=object)[missing]]
+        names = Series(names, index=df.index)
+    df[name_column] = names
+
+
+def _concat_categorical(dfs: list) -> DataFrame:
+    """
+    Concatenate frames, keeping the categorical columns categorical even when
+    their categories differ between frames.
+    """
+    df = pd.concat(dfs).reset_index(drop=True)
+    for col in {c for d in dfs for c in d.select_dtypes('category').columns}:
+        df[col] = df[col].astype('category')
+    return df
+
+
+def _section_tree(sections: list) -> DataFrame:
+    """
+    Index the section tree of a suite in a single walk.
+
+    :param sections:
+        The sections of a suite as returned by `get_sections`
+    :return: DataFrame
+        Indexed by section ID in pre-order (parents before their children, siblings in
+        the order of `sections`) with the `name`, `parent_id`, `depth` (0 for top-level
+        sections), `root_id` (the top-level ancestor), `path` (the names from the root
+        joined by `section_path_separator`), `pre_order` and `subtree_end` of each section.
+        The subtree of a section are the rows `pre_order` to `subtree_end`.
+    """
+    names = {}
+    children = {}
+    roots = []
+    for section in sections:
+        names[int(section['id'])] = section.get('name')
+    for section in sections:
+        parent_id = section.get('parent_id')
+        if parent_id is None or pd.isna(parent_id) or int(parent_id) not in names:
+            roots.append(int(section['id']))
+        else:
+            children.setdefault(int(parent_id), []).append(int(section['id']))
+
+    ids, parents, depths, root_ids, paths = [], [], [], [], []
+    stack = [(section_id, None, 0, section_id, names[section_id]) for section_id in reversed(roots)]
+    seen = set()
+    while stack:
+        section_id, parent_id, depth, root_id, path = stack.pop()
+        if section_id in seen:
+            continue
+        seen.add(section_id)
+        ids.append(section_id)
+        parents.append(parent_id)
+        depths.append(depth)
+        root_ids.append(root_id)
+        paths.append(path)
+        stack.extend(
+            (child_id, section_id, depth + 1, root_id, f'{path}{section_path_separator}{names[child_id]}')
+            for child_id in reversed(children.get(section_id, [])))
+
+    position = {section_id: i for i, section_id in enumerate(ids)}
+    subtree_end = list(range(len(ids)))
+    for i in range(len(ids) - 1, 0, -1):
+        if parents[i] is not None:
+            parent = position[parents[i]]
+            subtree_end[parent] = max(subtree_end[parent], subtree_end[i])
+    return DataFrame({
+        'name': [names[section_id] for section_id in ids],
+        'parent_id': pd.array(parents, dtype='Int32'),
+        'depth': pd.array(depths, dtype='Int32'),
+        'root_id': pd.array(root_ids, dtype='Int32'),
+        'path': paths,
+        'pre_order': pd.array(range(len(ids)), dtype='Int32'),
+        'subtree_end': pd.array(subtree_end, dtype='Int32'),
+    }, index=pd.Index(ids, name='id'))
+
+
+def _fill_section_paths(df: DataFrame, index: DataFrame, categorical=False):
+    """
+    Add the `section_path`, `section_depth` and `section_root_id` columns of the
+    `section_id` column from a `_section_tree` index.
+    """
+    _fill_name_column(df, 'section_id', 'section_path', dict(zip(index.index, index['path'])), categorical)
+    positions = index.index.get_indexer(pd.Index(df['section_id']))
+    found = positions >= 0
+    for column, source in (('section_depth', 'depth'), ('section_root_id', 'root_id')):
+        values = Series(pd.NA, index=df.index, dtype='Int32')
+        values[found] = index[source].to_numpy()[positions[found]]
+        df[column] = values
+
+
+def _group_frames(dfs: list, keys: list) -> dict:
+    """
+    Concatenate the frames sharing a key, e.g. the tests of the runs of a project,
+    so they can be processed at once.
+
+    :return: dict
+        {<KEY>: (<POSITIONS OF THE FRAMES>, <DATAFRAME>)}
+    """
+    positions = {}
+    for i, key in enumerate(keys):
+        positions.setdefault(key, []).append(i)
+    return {key: (group, pd.concat([dfs[i] for i in group]).reset_index(drop=True))
+            for key, group in positions.items()}
+
+
+def _ungroup_frames(dfs: list, groups: dict) -> list:
+    """
+    Split the frames of `_group_frames` back into one frame per position.
+    """
+    dfs = list(dfs)
+    for group, df in groups.values():
+        bounds = np.cumsum([0] + [dfs[i].shape[0] for i in group])
+        for i, start, stop in zip(group, bounds[:-1], bounds[1:]):
+            dfs[i] = df.iloc[start:stop]
+    return dfs
+
+
 class Metas(_MetaCategory):
 
+    def _lookup(self, kind: str, loader, *ids):
+        """
+        Serve a metadata lookup from the session's `meta_cache` when one is configured.
+        """
+        cache = getattr(self._session, 'meta_cache', None)
+        if cache is None:
+            return loader()
+        return cache.get(kind, loader, *ids)
+
+    def get_run_project(self, run_id: int) -> int:
+        """
+        Returns the ID of the project a test run belongs to.
+
+        :param run_id:
+            The ID of the test run
+        :return: int
+        """
+        return self.get_run_projects(run_id)[run_id]
+
+    def get_run_projects(self, *run_ids: int, max_workers: Optional[int] = 4) -> dict:
+        """
+        Returns the IDs of the projects test runs belong to. A run never moves to
+        another project, so the lookups are kept in the session's `meta_cache`
+        until it is invalidated and only the unknown runs are pulled.
+
+        :param run_ids:
+            The ID or IDs of the test run(s)
+        :param max_workers:
+            Number of runs to look up concurrently, None to look them up one after another;
+            the first failure is raised
+        :return: dict
+            {<RUN_ID>: <PROJECT_ID>}
+        """
+        cache = getattr(self._session, 'meta_cache', None)
+        projects = {}
+        for run_id in dict.fromkeys(run_ids):
+            projects[run_id] = cache.peek('run_project', run_id) if cache is not None else None
+        missing = [run_id for run_id, project_id in projects.items() if project_id is None]
+        if not missing:
+            return projects
+
+        def load(run_id):
+            return Runs(self._session).get_run(run_id)['project_id']
+
+        if not max_workers or len(missing) < 2:
+            loaded = [load(run_id) for run_id in missing]
+        else:
+            _grow_pool(self._session, max_workers)
+            loaded, failures = _fan_out(load, missing, max_workers)
+            if failures:
+                raise next(iter(failures.values()))
+        for run_id, project_id in zip(missing, loaded):
+            projects[run_id] = project_id
+            if cache is not None:
+                cache.pin('run_project', project_id, run_id)
+        return projects
+
+    def get_config_names(self, project_id: int) -> dict:
+        """
+        Returns the configurations of a project as {<CONFIG_ID>: (<GROUP_NAME>, <CONFIG_NAME>)}.
+
+        :param project_id:
+            The ID of the project
+        :return: dict
+        """
+        def load():
+            groups = TR_Configurations(self._session).get_configs(project_id)
+            return {config['id']: (group['name'], config['name']) for group in groups for config in group['configs']}
+        return self._lookup('configs', load, project_id)
+
     def fill_custom_fields(self, project_id: int, df: DataFrame, warning=False):
         """
         A helper to resolve metadata fill up for custom-columns.
@@ -77,37 +767,46 @@ class Metas(_MetaCategory):
 
         :return:
         """
-        lookup_case_field = CaseFields(self._session).get_configs()
+        with stage(self._session, 'fill_custom_fields'):
+            lookup_case_field = self._lookup('case_fields', CaseFields(self._session).get_configs)
+            _fill_custom_columns(lookup_case_field, project_id, df, warning)
 
-        def fill(x, column):
-            try:
-                def list_type(y):
-                    y = [i for i in y if i != 0]
-                    labels = [lookup_custom_field[project_id][i] for i in y]
-                    return ','.join(labels)
-
-                lookup_custom_field = lookup_case_field[column]
-                if not x or project_id not in lookup_custom_field:
-                    return ''
-                elif isinstance(x, str) and isinstance(eval(x), list):
-                    return list_type(eval(x))
-                elif isinstance(x, list):
-                    return list_type(x)
-                elif isinstance(x, float) or str(x).isnumeric():
-                    if str(x) == 'nan':
-                        return ''
-                    x = int(x)
-                    return lookup_custom_field[project_id][x]
-                return lookup_custom_field[project_id][x]
-            except KeyError:
-                if warning:
-                    print(column, x, type(x))
-                return f'UNKNOWN {x}'
-
-        for col in [c for c in df.columns if 'custom_' in c]:
-            df[col] = df[col].apply(fill, column=col)
-
-    def fill_id_fields(self, project_id: int, suite_id: int, df: DataFrame):
+    def get_section_index(self, project_id: int, suite_id: int) -> DataFrame:
+        """
+        Returns the section tree of a suite indexed by section ID, with the depth, root,
+        path and pre-order range of every section, see `Sections.get_section_index`.
+
+        :param project_id:
+            The ID of the project
+        :param suite_id:
+            The ID of the test suite
+        :return: DataFrame
+        """
+        return self._lookup(
+            'section_index', lambda: Sections(self._session).get_section_index(project_id, suite_id),
+            project_id, suite_id)
+
+    def get_subtree_ids(self, project_id: int, suite_id: int, *section_ids: int) -> list:
+        """
+        Returns the IDs of sections and all of their sub sections (at any depth), e.g.
+        to keep the results of a top-level area with `df[df['section_id'].isin(ids)]`.
+
+        :param project_id:
+            The ID of the project
+        :param suite_id:
+            The ID of the test suite
+        :param section_ids:
+            The ID or IDs of the sections
+        :return: list
+        """
+        index = self.get_section_index(project_id, suite_id)
+        ids = []
+        for section_id in section_ids:
+            start, end = index.at[section_id, 'pre_order'], index.at[section_id, 'subtree_end']
+            ids.extend(index.index[start:end + 1].to_list())
+        return list(dict.fromkeys(ids))
+
+    def fill_id_fields(self, project_id: int, suite_id: int, df: DataFrame, categorical=False, section_paths=False):
         """
         A helper to resolve metadata fill up for Ids columns
         :param project_id:
@@ -117,79 +816,99 @@ class Metas(_MetaCategory):
             single suite mode)
         :param df:
             Dataframe contains custom-columns
+        :param categorical:
+            True to emit the name columns as `pandas.Categorical`, unknown IDs
+            fall into the `UNKNOWN` category.
+        :param section_paths:
+            True to add the `section_path`, `section_depth` and `section_root_id`
+            columns from the section index, see `get_section_index`
         :return:
         """
-
-        def lookup_wrapper(key, lookup: dict):
-            try:
-                return lookup[key]
-            except KeyError:
-                return f"UNKNOWN {key}"
-
-        if 'section_id' in df.columns:
-            lookup_section = Sections(self._session).get_sections_lookup(project_id, suite_id)
-            df['section_name'] = df['section_id'].apply(lookup_wrapper, lookup=lookup_section)
+        with stage(self._session, 'fill_id_fields'):
+            self._fill_id_fields(project_id, suite_id, df, categorical, section_paths)
+
+    def _fill_id_fields(self, project_id: int, suite_id: int, df: DataFrame, categorical: bool, section_paths: bool):
+        if 'section_id' in df.columns and section_paths:
+            index = self.get_section_index(project_id, suite_id)
+            _fill_name_column(df, 'section_id', 'section_name', dict(zip(index.index, index['name'])), categorical)
+            _fill_section_paths(df, index, categorical)
+        elif 'section_id' in df.columns:
+            lookup_section = self._lookup(
+                'sections', lambda: Sections(self._session).get_sections_lookup(project_id, suite_id),
+                project_id, suite_id)
+            _fill_name_column(df, 'section_id', 'section_name', lookup_section, categorical)
         if 'template_id' in df.columns:
-            lookup_template = Template(self._session).get_template_lookup(project_id)
-            df['template_name'] = df['template_id'].apply(lookup_wrapper, lookup=lookup_template)
+            lookup_template = self._lookup(
+                'templates', lambda: Template(self._session).get_template_lookup(project_id), project_id)
+            _fill_name_column(df, 'template_id', 'template_name', lookup_template, categorical)
         if 'type_id' in df.columns:
-            lookup_case_type = CaseTypes(self._session).get_case_types_lookup()
-            df['type_name'] = df['type_id'].apply(lookup_wrapper, lookup=lookup_case_type)
+            lookup_case_type = self._lookup('case_types', CaseTypes(self._session).get_case_types_lookup)
+            _fill_name_column(df, 'type_id', 'type_name', lookup_case_type, categorical)
         if 'priority_id' in df.columns:
-            lookup_priority = Priorities(self._session).get_priorities_lookup()
-            df['priority_name'] = df['priority_id'].apply(lookup_wrapper, lookup=lookup_priority)
+            lookup_priority = self._lookup('priorities', Priorities(self._session).get_priorities_lookup)
+            _fill_name_column(df, 'priority_id', 'priority_name', lookup_priority, categorical)
         if 'suite_id' in df.columns:
-            lookup_suite = Suites(self._session).get_suites_lookup(project_id)
-            df['suite_name'] = df['suite_id'].apply(lookup_wrapper, lookup=lookup_suite)
+            lookup_suite = self._lookup(
+                'suites', lambda: Suites(self._session).get_suites_lookup(project_id), project_id)
+            _fill_name_column(df, 'suite_id', 'suite_name', lookup_suite, categorical)
 
 
 class Runs(TR_Runs):
+    @compact('runs')
     def get_runs_by_milestone(
             self,
             *milestone_ids: int,
-            project_id: int
+            project_id: int,
+            max_workers: Optional[int] = 4
     ) -> DataFrame:
         """
         Returns a list of run on an existing milestones,
-        including those runs in sub-milestones and plans.
+        including those runs in sub-milestones (at any depth) and plans.
+
+        The milestone tree is resolved from a single listing of the project's milestones,
+        runs and plans of all milestones are pulled with `milestone_id` list filters
+        (`filter_chunk_size` ids per request) and the entries of the plans are pulled concurrently.
 
         :param milestone_ids:
         :param project_id:
             The ID of the project
+        :param max_workers:
+            Number of plans to pull concurrently, None to pull them one after another
         :return: DataFrame
         """
-        def get_runs(*mile_ids):
-            dataframes = []
-            for mid in mile_ids:
-                # Get all run
-                df_run1 = self.to_dataframe(project_id=project_id, milestone_id=mid)
-                if df_run1.shape[0] > 0:
-                    dataframes.append(df_run1)
-                # Get all plan
-                plans = Plans(self._session).get_plans(project_id=project_id, milestone_id=mid)
-                plan_ids = [plan['id'] for plan in plans]
-                df_run2 = self.dataframe_from_plan(*plan_ids)
-                if df_run2.shape[0] > 0:
-                    dataframes.append(df_run2)
-            return dataframes
-        dfs = get_runs(milestone_ids)
-        milestone = Milestones(self._session)
-        df_milestone = milestone.sub_milestones_to_dataframe(*milestone_ids).filter(['id'])
-        if df_milestone.shape[0] > 0:
-            dfs.extend(get_runs(*df_milestone['id'].to_list()))
-        return pd.concat(dfs).reset_index(drop=False) if dfs else pd.DataFrame()
-
-    def get_runs_by_plan(self, *plan_ids: int) -> list:
+        tree = Milestones(self._session).get_milestone_tree(project_id, *milestone_ids)
+        dfs = []
+        plan_ids = []
+        for chunk in _chunks(tree):
+            df_runs = self.to_dataframe(project_id=project_id, milestone_id=chunk)
+            if df_runs.shape[0] > 0:
+                dfs.append(df_runs)
+            df_plans = Plans(self._session).to_dataframe(project_id=project_id, milestone_id=chunk)
+            if 'id' in df_plans.columns:
+                plan_ids.extend(df_plans['id'].to_list())
+        df_plan_runs = self.dataframe_from_plan(*dict.fromkeys(plan_ids), max_workers=max_workers)
+        if df_plan_runs.shape[0] > 0:
+            dfs.append(df_plan_runs)
+        if not dfs:
+            return pd.DataFrame()
+        df = pd.concat(dfs)
+        return df.drop_duplicates('id').reset_index(drop=False) if 'id' in df.columns else df.reset_index(drop=False)
+
+    def get_runs_by_plan(self, *plan_ids: int, max_workers: Optional[int] = 4) -> list:
         """
         Returns a list of run on an existing test plan.
 
         param plan_ids:
             The ID or IDs of the test plan
+        :param max_workers:
+            Number of plans to pull concurrently, see `Plans.get_plans_by_id`
         :return: response
         """
-        entries = [Plans(self._session).get_plan(plan_id)['entries'] for plan_id in plan_ids]
+        plans = Plans(self._session).get_plans_by_id(*plan_ids, max_workers=max_workers)
+        entries = [plan['entries'] for plan in plans]
         return [x3 for x0 in entries for x1 in x0 for x3 in x1['runs']]
 
+    @compact('runs')
     @auto_offset
     def to_dataframe(self, project_id: int, **kwargs) -> DataFrame:
         """
@@ -210,6 +929,8 @@ class Runs(TR_Runs):
                 0/False to return active test runs only.
             :key limit/offset: int
                 Limit the result to :limit test runs. Use :offset to skip records.
+            :key prefetch: int
+                Number of pages to fetch concurrently (default: sequential)
             :key milestone_id: List[int] or comma-separated string
                 A comma-separated list of milestone IDs to filter by.
             :key refs_filter: str
@@ -218,21 +939,41 @@ class Runs(TR_Runs):
                 A comma-separated list of test suite IDs to filter by.
         :return: DataFrame
         """
-        return DataFrame(self.get_runs(project_id, **kwargs))
+        return self.get_runs(project_id, **kwargs)
+
+    @iter_offset
+    def iter_pages(self, project_id: int, **kwargs) -> Iterator[DataFrame]:
+        """
+        Yields the test runs for a project page by page, one DataFrame per page,
+        see `to_dataframe` for the filters.
+
+        >>> for df in api.runs.iter_pages(project_id=1, is_completed=True):
+        ...     df.to_parquet(...)
+
+        :param project_id: int
+            The ID of the project
+        :param kwargs: filters
+        :return: iterator of DataFrame
+        """
+        return self.get_runs(project_id, **kwargs)
 
-    def dataframe_from_plan(self, *plan_ids: int) -> DataFrame:
+    def dataframe_from_plan(self, *plan_ids: int, max_workers: Optional[int] = 4) -> DataFrame:
         """
-        Returns a list of run on an existing test plan as Dataframe
+        Returns a list of run on an existing test plan as Dataframe,
+        with the `plan_id`, `entry_id` and `config_<GROUP>` columns of `Plans.expand`.
 
         :param plan_ids:
             The ID or IDs of the test plan
+        :param max_workers:
+            Number of plans to pull concurrently
         :return: response
         """
-        return pd.DataFrame(self.get_runs_by_plan(*plan_ids))
+        return Plans(self._session).expand(*plan_ids, max_workers=max_workers)[2]
 
 
 class Plans(TR_Plans):
 
+    @compact('plans')
     @auto_offset
     def to_dataframe(self, project_id: int, **kwargs) -> DataFrame:
         """
@@ -258,17 +999,94 @@ class Plans(TR_Plans):
                 Limit the result to :limit test plans. Use :offset to skip records.
             :key milestone_id: List[int] or comma-separated string
                 A comma-separated list of milestone IDs to filter by.
+            :key prefetch: int
+                Number of pages to fetch concurrently (default: sequential)
         :return: response
         """
-        return DataFrame(self.get_plans(project_id, **kwargs))
+        return self.get_plans(project_id, **kwargs)
+
+    def _get_plan(self, plan_id: int) -> dict:
+        cache = getattr(self._session, 'meta_cache', None)
+        plan = cache.peek('plan', plan_id) if cache is not None else None
+        if plan is None:
+            plan = self.get_plan(plan_id)
+            if cache is not None and plan.get('is_completed'):
+                cache.pin('plan', plan, plan_id)
+        # a copy, so editing a plan or its entries does not change the cached one
+        return copy.deepcopy(plan)
+
+    def get_plans_by_id(self, *plan_ids: int, max_workers: Optional[int] = 4) -> list:
+        """
+        Returns plans with their entries, each plan once. Completed plans do not change
+        and are kept in the session's `meta_cache` until it is invalidated.
+
+        :param plan_ids:
+            The ID or IDs of the test plan
+        :param max_workers:
+            Number of plans to pull concurrently, None to pull them one after another;
+            the first failure is raised
+        :return: list
+        """
+        plan_ids = list(dict.fromkeys(plan_ids))
+        if not max_workers or len(plan_ids) < 2:
+            return [self._get_plan(plan_id) for plan_id in plan_ids]
+        _grow_pool(self._session, max_workers)
+        plans, failures = _fan_out(self._get_plan, plan_ids, max_workers)
+        if failures:
+            raise next(iter(failures.values()))
+        return plans
+
+    def expand(self, *plan_ids: int, max_workers: Optional[int] = 4) -> tuple:
+        """
+        Returns plans, their entries and their runs as three normalized DataFrames:
+
+        - plans: one row per plan, without `entries`
+        - entries: one row per entry with its `plan_id`, without `runs`
+        - runs: one row per run with its `plan_id`, `entry_id` and a `config_<GROUP>`
+          column per configuration group holding the name of the run's configuration
+
+        :param plan_ids:
+            The ID or IDs of the test plan
+        :param max_workers:
+            Number of plans to pull concurrently
+        :return: tuple of DataFrame (plans, entries, runs)
+        """
+        plans = self.get_plans_by_id(*plan_ids, max_workers=max_workers)
+        meta = Metas(self._session)
+        configs = {plan['project_id']: meta.get_config_names(plan['project_id'])
+                   for plan in plans if _has_configs(plan)}
+        return _expand_plans(plans, configs, getattr(self._session, 'compact_dtypes', False))
+
+    @iter_offset
+    def iter_pages(self, project_id: int, **kwargs) -> Iterator[DataFrame]:
+        """
+        Yields the test plans for a project page by page, one DataFrame per page,
+        see `to_dataframe` for the filters.
+
+        :param project_id:
+            The ID of the project
+        :param kwargs: filters
+        :return: iterator of DataFrame
+        """
+        return self.get_plans(project_id, **kwargs)
 
 
 class Cases(TR_Cases):
 
-    def to_dataframe(self, project_id: int, suite_id: int, with_meta=False, **kwargs):
+    @compact('cases')
+    def to_dataframe(
+            self,
+            project_id: int,
+            suite_id: int,
+            with_meta=False,
+            categorical=False,
+            by_section=False,
+            max_workers: Optional[int] = 4,
+            **kwargs
+    ):
         """
         Returns a list of test cases for a project or specific test suite in DataFrame
-        (if the project has multiple suites enabled).
+        (if the project has multiple suites enabled). All pages are pulled.
 
         :param project_id:
             The ID of the project
@@ -277,6 +1095,13 @@ class Cases(TR_Cases):
             single suite mode)
         :param with_meta: boolean
             ID's field will be filled up with new columns
+        :param categorical: boolean
+            True to emit the filled up name columns as `pandas.Categorical`
+        :param by_section: boolean
+            True to list the sections of the suite and pull the cases of every section
+            concurrently, merged in the order of the sections. Faster for large suites.
+        :param max_workers:
+            Number of sections to pull concurrently with `by_section`
         :param kwargs:
             :key created_after: int/datetime
                 Only return test cases created after this date (as UNIX timestamp).
@@ -292,9 +1117,8 @@ class Cases(TR_Cases):
             :key milestone_id: List[int] or comma-separated string
                 A comma-separated list of milestone IDs to filter by (not available
                 if the milestone field is disabled for the project).
-            :key offset: int
-                Where to start counting the tests cases from (the offset)
-                (requires TestRail 6.7 or later)
+            :key prefetch: int
+                Number of pages to fetch concurrently (default: sequential)
             :key priority_id: List[int] or comma-separated string
                 A comma-separated list of priority IDs to filter by.
             :key refs: str
@@ -315,24 +1139,88 @@ class Cases(TR_Cases):
                 A comma-separated list of user IDs who updated test cases to filter by.
         :return: DataFrame
         """
-        df = DataFrame(self.get_cases(project_id, suite_id=suite_id, **kwargs))
+        if by_section:
+            df = self._dataframe_by_section(project_id, suite_id, max_workers, **kwargs)
+        else:
+            df = self._cases(project_id, suite_id=suite_id, **kwargs)
         if with_meta:
             meta = Metas(self._session)
-            meta.fill_id_fields(project_id, suite_id, df)
+            meta.fill_id_fields(project_id, suite_id, df, categorical)
             meta.fill_custom_fields(project_id, df)
         return df
 
+    @auto_offset
+    def _cases(self, project_id: int, **kwargs) -> DataFrame:
+        return self.get_cases(project_id, **kwargs)
+
+    def _dataframe_by_section(self, project_id: int, suite_id: int, max_workers: Optional[int], **kwargs):
+        if 'section_id' in kwargs:
+            assert False, 'section_id has been managed by by_section'
+        df_sections = Sections(self._session).to_dataframe(project_id, suite_id)
+        section_ids = df_sections['id'].to_list() if 'id' in df_sections.columns else []
+
+        def fetch(section_id):
+            return self._cases(project_id, suite_id=suite_id, section_id=section_id, **kwargs)
+
+        if not max_workers or len(section_ids) < 2:
+            dfs = [fetch(section_id) for section_id in section_ids]
+        else:
+            _grow_pool(self._session, max_workers, kwargs.get('prefetch'))
+            dfs, failures = _fan_out(fetch, section_ids, max_workers)
+            if failures:
+                raise next(iter(failures.values()))
+        return pd.concat(dfs).reset_index(drop=True) if dfs else DataFrame()
+
+    @iter_offset
+    def iter_pages(self, project_id: int, suite_id: int, **kwargs) -> Iterator[DataFrame]:
+        """
+        Yields the test cases of a project or test suite page by page, one DataFrame per page,
+        see `to_dataframe` for the filters.
+
+        :param project_id:
+            The ID of the project
+        :param suite_id:
+            The ID of the test suite
+        :param kwargs: filters
+        :return: iterator of DataFrame
+        """
+        return self.get_cases(project_id, suite_id=suite_id, **kwargs)
+
 
 class Tests(TR_Tests):
-    def to_dataframe(self, *run_ids: int, with_meta=False, **kwargs) -> Optional[DataFrame]:
+    @compact('tests')
+    def to_dataframe(
+            self,
+            *run_ids: int,
+            with_meta=False,
+            categorical=False,
+            project_id: Optional[int] = None,
+            max_workers: Optional[int] = 4,
+            **kwargs
+    ) -> Optional[DataFrame]:
         """
         Returns single or multiple test run.
 
+        The tests of every run are pulled page by page and the runs are pulled concurrently.
+        With `with_meta`, the projects of the runs are looked up in bulk (see `Metas.get_run_projects`)
+        and the metadata is filled once per project over the tests of all of its runs.
+
         :param run_ids:
              The ID or IDs of the test run(s)
         :param with_meta:
             True to fill up template_id, type_id, priority_id with their respective name
-        :param kwargs:
+        :param categorical:
+            True to emit the filled up name columns as `pandas.Categorical`
+        :param project_id:
+            The ID of the project of all the runs if known, it saves looking up the run's projects
+        :param max_workers:
+            Number of runs to pull concurrently, None to pull them one after another;
+            the first failure is raised
+        :param kwargs: filters
+            :key status_id: List[int] or comma-separated string
+                A comma-separated list of status IDs to filter by.
+            :key prefetch: int
+                Number of pages to fetch concurrently (default: sequential)
         :return: DataFrame
 
         Examples
@@ -343,20 +1231,82 @@ class Tests(TR_Tests):
         OR
         #> df = api.tests.to_dataframe(2,3,4, with_meta=True)
         """
-        dfs = []
-        for run_id in run_ids:
-            df = DataFrame(self.get_tests(run_id, **kwargs))
-            run = Runs(self._session).get_run(run_id)
-            project_id = run['project_id']
-            if with_meta:
-                meta = Metas(self._session)
-                meta.fill_id_fields(project_id, 0, df)
-                meta.fill_custom_fields(project_id, df)
-            dfs.append(df)
-        return pd.concat(dfs).reset_index(drop=True) if dfs else None
+        if not run_ids:
+            return None
+        if not max_workers or len(run_ids) < 2:
+            dfs = [self._tests_for_run(run_id, **kwargs) for run_id in run_ids]
+        else:
+            _grow_pool(self._session, max_workers, kwargs.get('prefetch'))
+            dfs, failures = _fan_out(lambda run_id: self._tests_for_run(run_id, **kwargs), run_ids, max_workers)
+            if failures:
+                raise next(iter(failures.values()))
+        if with_meta:
+            meta = Metas(self._session)
+            projects = {run_id: project_id for run_id in run_ids} if project_id is not None \
+                else meta.get_run_projects(*run_ids, max_workers=max_workers)
+            groups = _group_frames(dfs, [projects[run_id] for run_id in run_ids])
+            for group_project_id, (_, df) in groups.items():
+                meta.fill_id_fields(group_project_id, 0, df, categorical)
+                meta.fill_custom_fields(group_project_id, df)
+            dfs = _ungroup_frames(dfs, groups)
+        return _concat_categorical(dfs)
+
+    @auto_offset
+    def _tests_for_run(self, run_id: int, **kwargs) -> DataFrame:
+        return self.get_tests(run_id, **kwargs)
+
+    @iter_offset
+    def iter_pages(self, run_id: int, **kwargs) -> Iterator[DataFrame]:
+        """
+        Yields the tests of a test run page by page, one DataFrame per page,
+        see `to_dataframe` for the filters.
+
+        :param run_id:
+            The ID of the test run
+        :param kwargs: filters
+        :return: iterator of DataFrame
+        """
+        return self.get_tests(run_id, **kwargs)
 
 
 class Milestones(TR_Milestone):
+
+    @auto_offset
+    def to_dataframe(self, project_id: int, **kwargs) -> DataFrame:
+        """
+        Returns the list of milestones for a project as DataFrame.
+
+        :param project_id:
+            The ID of the project
+        :param kwargs: filters
+            :key is_completed: int/bool
+                1/True to return completed milestones only.
+                0/False to return open (active/upcoming) milestones only.
+            :key is_started: int/bool
+                1/True to return started milestones only.
+                0/False to return upcoming milestones only.
+            :key prefetch: int
+                Number of pages to fetch concurrently (default: sequential)
+        :return: DataFrame
+        """
+        return self.get_milestones(project_id, **kwargs)
+
+    def get_milestone_tree(self, project_id: int, *milestone_ids: int) -> list:
+        """
+        Returns the IDs of milestones and all of their sub milestones (at any depth),
+        each milestone followed by its sub milestones.
+
+        Children are known from the `parent_id` of the listed milestones and from
+        their nested `milestones`, so the tree is resolved with a single listing.
+
+        :param project_id:
+            The ID of the project
+        :param milestone_ids:
+            The ID or IDs of the milestone
+        :return: list
+        """
+        return _milestone_tree(self.to_dataframe(project_id).to_dict('records'), milestone_ids)
+
     def get_sub_milestones(self, *milestone_ids) -> list:
         """
         Returns sub milestones of a milestone if any.
@@ -380,21 +1330,22 @@ class Milestones(TR_Milestone):
 
 
 class Sections(TR_Sections):
+    @auto_offset
     def to_dataframe(self, project_id: int, suite_id: int, **kwargs) -> DataFrame:
         """
-         Returns a list of sections for a project and test suite in DataFrame
+         Returns a list of sections for a project and test suite in DataFrame,
+         in the order of the suite (parents before their children). All pages are pulled.
 
         :param project_id:
             The ID of the project
         :param suite_id:
             The ID of the test suite
         :param kwargs:
-            :key offset: int
-                Where to start counting the sections from (the offset)
-                (requires TestRail 6.7 or later)
+            :key prefetch: int
+                Number of pages to fetch concurrently (default: sequential)
         :return:
         """
-        return DataFrame(self.get_sections(project_id=project_id, suite_id=suite_id, **kwargs))
+        return self.get_sections(project_id=project_id, suite_id=suite_id, **kwargs)
 
     def get_sections_lookup(self, project_id: int, suite_id: int) -> dict:
         """
@@ -414,6 +1365,29 @@ class Sections(TR_Sections):
         df = self.to_dataframe(project_id, suite_id)
         return dict(zip(df['id'], df['name']))
 
+    def get_section_index(self, project_id: int, suite_id: int) -> DataFrame:
+        """
+         Returns the section tree of a suite, built in a single walk over its sections:
+
+                 name  parent_id  depth  root_id                      path  pre_order  subtree_end
+         id
+         1      Login       <NA>      0        1                     Login          0            2
+         4     Errors          1      1        1            Login > Errors          1            2
+         7    Timeout          4      2        1  Login > Errors > Timeout          2            2
+         2     Search       <NA>      0        2                    Search          3            3
+
+         Rows are in pre-order, so the subtree of a section is
+         `index.iloc[pre_order:subtree_end + 1]`, see `Metas.get_subtree_ids`.
+
+        :param project_id:
+            The ID of the project
+        :param suite_id:
+            The ID of the test suite
+        :return: DataFrame
+        """
+        df = self.to_dataframe(project_id, suite_id)
+        return _section_tree(df.to_dict('records') if 'id' in df.columns else [])
+
 
 class Template(TR_Template):
     def to_dataframe(self, project_id: int) -> DataFrame:
@@ -442,6 +1416,50 @@ class Template(TR_Template):
         return dict(zip(df['id'], df['name']))
 
 
+def _split_item(line: str, index: int):
+    if line:
+        items = line.split(',')
+        return int(items[index]) if items[index].isnumeric() else items[index]
+    return 0
+
+
+def _parse_case_fields(case_fields: list) -> tuple:
+    """
+    Build the case field map described in `CaseFields.get_configs` and its reverse
+    label index from the response of `get_case_fields` in a single pass.
+
+    Options of a global context (no project ids) are kept under `global_project`.
+
+    :return: tuple
+        ({<SYSTEM_NAME>: {<PROJECT_ID>: {<ID>: <LABEL>}}},
+         {<SYSTEM_NAME>: {<PROJECT_ID>: {<LABEL>: <ID>}}})
+    """
+    lookup = {}
+    index = {}
+    first_configs = {}
+    for field in case_fields:
+        system_name = field.get('system_name')
+        # a repeated system name resolves to the configs of its first field
+        configs = first_configs.setdefault(system_name, field.get('configs') or [])
+        options = {}
+        labels = {}
+        lookup[system_name] = options
+        index[system_name] = labels
+        has_items = any('items' in (config.get('options') or {}) for config in configs)
+        for config in configs:
+            items = (config.get('options') or {}).get('items')
+            if has_items and isinstance(items, str):
+                parsed = {_split_item(r, 0): _split_item(r, 1) for r in items.split('\n')}
+                reverse = {label.strip() if isinstance(label, str) else label: key
+                           for key, label in parsed.items() if key != 0}
+                project_ids = (config.get('context') or {}).get('project_ids')
+                for pid in project_ids if project_ids is not None else [global_project]:
+                    options[pid] = parsed
+                    labels[pid] = reverse
+            options.update({None: '', '': ''})
+    return lookup, index
+
+
 class CaseFields(TR_CaseFields):
     def get_configs(self) -> dict:
         """
@@ -453,34 +1471,19 @@ class CaseFields(TR_CaseFields):
 
         :return:
         """
-        df = DataFrame(self.get_case_fields()).filter(['system_name', 'configs'])
+        return _parse_case_fields(self.get_case_fields())[0]
 
-        def get_df_by_system_name(name: str):
-            df_config = pd.DataFrame(df.query(f'system_name == "{name}"')['configs'].to_list()[0])
-            df_context = pd.DataFrame(df_config['context'].to_list())
-            df_option = pd.DataFrame(df_config['options'].to_list())
-            df_merged = df_context.join(df_option)
-            return df_merged
-
-        def split_by_comma(i: str, index):
-            if i:
-                items = i.split(',')
-                return int(items[index]) if items[index].isnumeric() else items[index]
-            return 0
+    def get_configs_index(self) -> dict:
+        """
+        Return the reverse map of `get_configs`, labels (stripped) to their ID:
 
-        lookup = {}
-        for _, row_i in df.iterrows():
-            system_name = row_i['system_name']
-            options = {}
-            lookup[system_name] = options
-            for _, row_j in get_df_by_system_name(system_name).iterrows():
-                if 'items' in row_j:
-                    for pid in row_j['project_ids']:
-                        options[pid] = {split_by_comma(r, 0): split_by_comma(r, 1)
-                                        for r in row_j['items'].split('\n')}
-                options.update({None: '', '': ''})
+        {
+            {<SYSTEM_NAME>: {<PROJECT_ID>: {<VALUE>: <TYPE_ID>}}
+        }
 
-        return lookup
+        :return:
+        """
+        return _parse_case_fields(self.get_case_fields())[1]
 
 
 class CaseTypes(TR_CaseType):
@@ -516,6 +1519,7 @@ class Priorities(TR_Priorities):
 
 class Results(TR_Results):
 
+    @compact('results')
     @auto_offset
     def dataframe_from_case(self, run_id: int, case_id: int, **kwargs) -> DataFrame:
         """
@@ -534,10 +1538,13 @@ class Results(TR_Results):
                 A single Defect ID (e.g. TR-1, 4291, etc.)
             :key status_id: List[int] or comma-separated string
                 A comma-separated list of status IDs to filter by.
+            :key prefetch: int
+                Number of pages to fetch concurrently (default: sequential)
         :return: DataFrame
         """
-        return DataFrame(self.get_results_for_case(run_id, case_id, **kwargs))
+        return self.get_results_for_case(run_id, case_id, **kwargs)
 
+    @compact('results')
     @auto_offset
     def dataframe_from_test(self, test_id: int, **kwargs) -> DataFrame:
         """
@@ -550,15 +1557,89 @@ class Results(TR_Results):
                 A single Defect ID (e.g. TR-1, 4291, etc.)
             :key status_id: List[int] or comma-separated string
                 A comma-separated list of status IDs to filter by.
+            :key prefetch: int
+                Number of pages to fetch concurrently (default: sequential)
         :return: DataFrame
         """
-        return DataFrame(self.get_results(test_id, **kwargs))
+        return self.get_results(test_id, **kwargs)
 
     @auto_offset
+    def _results_for_run(self, run_id: int, **kwargs) -> DataFrame:
+        return self.get_results_for_run(run_id, **kwargs)
+
+    @iter_offset
+    def iter_case_pages(self, run_id: int, case_id: int, **kwargs) -> Iterator[DataFrame]:
+        """
+        Yields the test results for a test run and case combination page by page,
+        see `dataframe_from_case` for the filters.
+
+        :param run_id:
+            The ID of the test run
+        :param case_id:
+            The ID of the test case
+        :param kwargs: filters
+        :return: iterator of DataFrame
+        """
+        return self.get_results_for_case(run_id, case_id, **kwargs)
+
+    @iter_offset
+    def iter_test_pages(self, test_id: int, **kwargs) -> Iterator[DataFrame]:
+        """
+        Yields the test results for a test page by page, see `dataframe_from_test` for the filters.
+
+        :param test_id:
+            The ID of the test
+        :param kwargs: filters
+        :return: iterator of DataFrame
+        """
+        return self.get_results(test_id, **kwargs)
+
+    @iter_offset
+    def iter_run_pages(self, run_id: int, **kwargs) -> Iterator[DataFrame]:
+        """
+        Yields the test results for a test run page by page, one DataFrame per page,
+        so large runs can be streamed to storage or aggregated without holding
+        the whole run in memory. The `result_cache` is not consulted.
+
+        >>> for df in api.results.iter_run_pages(run_id=1, prefetch=4):
+        ...     counts = counts.add(df['status_id'].value_counts(), fill_value=0)
+
+        :param run_id:
+            The ID of the test run
+        :param kwargs: filters, see `dataframe_from_run`
+        :return: iterator of DataFrame
+        """
+        return self.get_results_for_run(run_id, **kwargs)
+
+    def _dataframe_from_run(self, run_id: int, is_completed: Optional[bool] = None, **kwargs) -> DataFrame:
+        """
+        Pull the results of a run, serving completed runs from the session's
+        `result_cache` when one is configured.
+
+        :param is_completed:
+            The completion state of the run if already known, it is looked up otherwise
+        """
+        cache = getattr(self._session, 'result_cache', None)
+        if cache is None:
+            return self._results_for_run(run_id, **kwargs)
+        filters = {k: v for k, v in kwargs.items() if k != 'prefetch'}
+        key = cache.key(self._session.instance_url, run_id, filters)
+        df = cache.get(key)
+        if df is not None:
+            return df
+        if is_completed is None:
+            is_completed = Runs(self._session).get_run(run_id)['is_completed']
+        df = self._results_for_run(run_id, **kwargs)
+        if is_completed:
+            cache.put(key, df)
+        return df
+
+    @compact('results')
     def dataframe_from_run(self, run_id: int, **kwargs) -> DataFrame:
         """
         Returns a list of test results for a test run.
         This method will return up to all entries in the response array.
+        Results of completed runs are served from `TestRailAPI(result_cache=...)` if configured.
 
         :param run_id:
             The ID of the test run
@@ -573,17 +1654,24 @@ class Results(TR_Results):
                 A single Defect ID (e.g. TR-1, 4291, etc.)
             :key status_id: List[int] or comma-separated string
                 A comma-separated list of status IDs to filter by.
+            :key prefetch: int
+                Number of pages to fetch concurrently (default: sequential)
         :return: DataFrame
         """
-        return DataFrame(self.get_results_for_run(run_id, **kwargs))
+        return self._dataframe_from_run(run_id, **kwargs)
 
-    def dataframe_from_runs(self, *run_ids: int, **kwargs) -> DataFrame:
+    @compact('results')
+    def dataframe_from_runs(self, *run_ids: int, max_workers: Optional[int] = None, **kwargs) -> DataFrame:
         """
         Returns a list of test results for one or many test runs.
         This method will return up to all entries in the response array.
+        The results of the runs follow the order of `run_ids` as given, not their IDs.
 
         :param run_ids:
             The ID or IDs of the test run(s)
+        :param max_workers:
+            Number of runs to pull concurrently. When set, a failed run does not
+            abort the pull; it is listed in `df.attrs['failed_runs']` instead.
         :param kwargs: filters
             :key created_after: int/datetime
                 Only return test results created after this date.
@@ -597,10 +1685,18 @@ class Results(TR_Results):
                 A comma-separated list of status IDs to filter by.
         :return: DataFrame
         """
-        dfs = [self.dataframe_from_run(run_id, **kwargs) for run_id in run_ids]
-        return pd.concat(dfs).reset_index(drop=True) if dfs else None
+        _grow_pool(self._session, max_workers, kwargs.get('prefetch'))
+        return _concat_runs(
+            run_ids, max_workers, lambda run_id: self._dataframe_from_run(run_id, **kwargs))
 
-    def dataframe_from_milestone(self, project_id: int, *milestone_ids: int, **kwargs) -> DataFrame:
+    @compact('results')
+    def dataframe_from_milestone(
+            self,
+            project_id: int,
+            *milestone_ids: int,
+            max_workers: Optional[int] = None,
+            **kwargs
+    ) -> DataFrame:
         """
         Returns a list of test results from milestone(s) which contains run(s).
         This method will return up to all entries in the response array.
@@ -609,6 +1705,9 @@ class Results(TR_Results):
             The ID of the project
         :param milestone_ids:
             The ID or IDs of the milestone(s)
+        :param max_workers:
+            Number of runs to pull concurrently. When set, a failed run does not
+            abort the pull; it is listed in `df.attrs['failed_runs']` instead.
         :param kwargs: filters
             :key created_after: int/datetime
                 Only return test results created after this date.
@@ -622,13 +1721,16 @@ class Results(TR_Results):
                 A comma-separated list of status IDs to filter by.
         :return:
         """
-        results = []
-        for milestone_id in milestone_ids:
-            df_runs = Runs(self._session).to_dataframe(
-                project_id=project_id, milestone_id=milestone_id)
-            _ = [results.append(self.dataframe_from_run(run_id, **kwargs))
-                 for run_id in df_runs['id'].to_list()]
-        return pd.concat(results).reset_index(drop=True) if results else None
+        completed = {}
+        for chunk in _chunks(list(milestone_ids)):
+            df_runs = Runs(self._session).to_dataframe(project_id=project_id, milestone_id=chunk)
+            if 'id' in df_runs.columns:
+                is_completed = df_runs.get('is_completed', Series([None] * len(df_runs)))
+                completed.update(zip(df_runs['id'].to_list(), is_completed.to_list()))
+        _grow_pool(self._session, max_workers, kwargs.get('prefetch'))
+        return _concat_runs(
+            list(completed), max_workers,
+            lambda run_id: self._dataframe_from_run(run_id, is_completed=completed[run_id], **kwargs))
 
 
 class Suites(TR_Suites):
@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Hashable
+
+
+class _Call:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.finished = None
+
+
+class Coalescer:
+    """
+    Single-flight de-duplication of identical requests: concurrent calls with the
+    same key share a single call and its result, and a successful result keeps being
+    shared for `window` seconds after the call returned. Failed calls are not kept.
+
+    Callers sharing a call receive the very same object, it must not be modified;
+    `TestRailAPI` shares the HTTP response and decodes its body for every caller.
+
+    >>> coalescer = Coalescer(window=1)
+    >>> run, shared = coalescer.call('get_run/1', lambda: api.get('get_run/1'))
+    """
+
+    def __init__(self, window: float = 0):
+        """
+        :param window:
+            Seconds a result is shared after its call returned, 0 to only share in-flight calls
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._expiry = deque()
+
+    def _expire(self, now: float):
+        while self._expiry and now - self._expiry[0][1].finished > self.window:
+            key, call = self._expiry.popleft()
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    def call(self, key: Hashable, func: Callable):
+        """
+        Returns `func()`, or the result of the identical call in flight or returned within the window.
+
+        :param key:
+            Identifies identical calls
+        :param func:
+            Makes the call
+        :return: tuple
+            The result and whether it was shared from another call
+        """
+        with self._lock:
+            self._expire(time.monotonic())
+            call = self._calls.get(key)
+            shared = call is not None
+            if not shared:
+                call = self._calls[key] = _Call()
+        if shared:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            call.finished = time.monotonic()
+            call.done.set()
+            with self._lock:
+                if call.error is None and self.window > 0:
+                    self._expiry.append((key, call))
+                elif self._calls.get(key) is call:
+                    del self._calls[key]
+        return call.result, False
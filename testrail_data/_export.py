@@ -0,0 +1,261 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import pandas as pd
+from pandas import DataFrame
+
+from testrail_data._category import Cases, Results, Suites, Tests, _fan_out, _grow_pool, _project_runs
+from testrail_data._schema import apply_schema
+
+null_partition = '__HIVE_DEFAULT_PARTITION__'
+
+
+def _fingerprint(value) -> str:
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _key(value) -> Optional[int]:
+    """
+    Normalise a partition key; a page with missing IDs holds them as float or NaN.
+    """
+    return None if value is None or pd.isna(value) else int(value)
+
+
+def _partition(entity: str, keys: dict) -> str:
+    return '/'.join([entity, *(f'{k}={null_partition if v is None else v}' for k, v in keys.items())])
+
+
+class ParquetExporter:
+    """
+    Exports projects into a Hive-partitioned Parquet dataset:
+
+        runs/project_id=<P>/milestone_id=<M>/part-00000.parquet
+        plans/project_id=<P>/milestone_id=<M>/part-00000.parquet
+        tests/project_id=<P>/milestone_id=<M>/run_id=<R>/part-00000.parquet
+        results/project_id=<P>/milestone_id=<M>/run_id=<R>/part-00000.parquet, part-00001.parquet, ...
+        cases/project_id=<P>/suite_id=<S>/part-00000.parquet
+
+    Tests, results and cases are written page by page, so at most a page is held in memory.
+    Partition keys only live in the paths and every file is cast with
+    `apply_schema(categorical=False)`, so the files of an entity share one schema.
+
+    `_manifest.json` keeps a fingerprint per partition. A re-export does not pull the
+    tests and results of runs whose metadata (counts, completion, updates) is unchanged,
+    and only rewrites the runs, plans and cases partitions whose content changed.
+
+    >>> exporter = ParquetExporter(api, '~/testrail/dataset')
+    >>> report = exporter.export(project_id=1, max_workers=8)
+    >>> duckdb.sql("SELECT * FROM read_parquet('~/testrail/dataset/results/**/*.parquet', hive_partitioning=1)")
+    """
+
+    entities = ('runs', 'plans', 'tests', 'results', 'cases')
+
+    def __init__(self, api, path: Union[str, Path]):
+        """
+        :param api:
+            The TestRailAPI to pull from
+        :param path:
+            Root directory of the dataset
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError('ParquetExporter requires pyarrow, run `pip install testrail-data[cache]`')
+        self._api = api
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._manifest_file = self.path / '_manifest.json'
+        self.manifest = json.loads(self._manifest_file.read_text()) \
+            if self._manifest_file.exists() else {'partitions': {}}
+
+    def export(
+            self,
+            project_id: int,
+            *milestone_ids: int,
+            entities: Iterable[str] = entities,
+            max_workers: Optional[int] = None
+    ) -> DataFrame:
+        """
+        Exports a project, or the runs and plans of some of its milestones, and saves the manifest.
+
+        Partitions of runs, plans, milestones and suites no longer found in TestRail
+        are removed when the whole project is exported.
+
+        :param project_id:
+            The ID of the project
+        :param milestone_ids:
+            The ID or IDs of the milestones to limit runs, plans, tests and results to
+        :param entities:
+            Entities to export, see `ParquetExporter.entities`
+        :param max_workers:
+            Number of plans and runs to pull concurrently
+        :return: DataFrame
+            A row per partition with its `entity`, `partition`, `rows` and
+            `status` (written, unchanged or failed)
+        """
+        entities = set(entities)
+        assert entities <= set(self.entities), f'entities must be within {self.entities}'
+        max_workers = max_workers or 1
+        _grow_pool(self._api, max_workers)
+        full = not milestone_ids
+        report = []
+
+        filters = [{'milestone_id': mid} for mid in milestone_ids] or [{}]
+        runs, plans, failures = [], [], {}
+        for f in filters:
+            pulled = _project_runs(self._api, project_id, max_workers, **f)
+            runs.extend(pulled[0])
+            plans.extend(pulled[1])
+            failures.update(pulled[2])
+        report.extend(self._failed('plans', failures))
+        # runs of plans which failed to pull are missing, keep their partitions
+        full = full and not failures
+
+        if 'runs' in entities:
+            report.extend(self._export_by_milestone('runs', project_id, runs, full))
+        if 'plans' in entities:
+            plans = [{k: v for k, v in plan.items() if k != 'entries'} for plan in plans]
+            report.extend(self._export_by_milestone('plans', project_id, plans, full))
+
+        run_entities = [entity for entity in ('tests', 'results') if entity in entities]
+        if run_entities:
+            by_id = {_key(run['id']): run for run in runs}
+            for entity in run_entities:
+                for run in runs:
+                    self._drop_moved(entity, self._run_keys(project_id, run))
+            outcomes, failures = _fan_out(
+                lambda run_id: self._export_run(project_id, run_entities, by_id[run_id]), list(by_id), max_workers)
+            report.extend(row for rows in outcomes if rows for row in rows)
+            report.extend(self._failed('runs', failures))
+            if full and not failures:
+                for entity in run_entities:
+                    self._prune(entity, project_id, [row[1] for row in report if row[0] == entity])
+
+        if 'cases' in entities:
+            partitions = []
+            for suite in Suites(self._api).get_suites(project_id):
+                keys = {'project_id': project_id, 'suite_id': suite['id']}
+                pages = lambda: Cases(self._api).iter_pages(project_id, suite['id'])  # noqa: E731
+                report.append(self._write('cases', keys, pages))
+                partitions.append(report[-1][1])
+            self._prune('cases', project_id, partitions)
+
+        self.save()
+        return DataFrame(report, columns=['entity', 'partition', 'rows', 'status'])
+
+    def _export_by_milestone(self, entity: str, project_id: int, records: list, full: bool) -> list:
+        groups = {}
+        for record in records:
+            groups.setdefault(_key(record.get('milestone_id')), []).append(record)
+        report = []
+        for milestone_id, group in groups.items():
+            keys = {'project_id': project_id, 'milestone_id': milestone_id}
+            report.append(self._write(entity, keys, lambda: [DataFrame(group)], _fingerprint(group)))
+        if full:
+            self._prune(entity, project_id, [row[1] for row in report])
+        return report
+
+    @staticmethod
+    def _run_keys(project_id: int, run: dict) -> dict:
+        return {'project_id': project_id, 'milestone_id': _key(run.get('milestone_id')), 'run_id': _key(run['id'])}
+
+    def _export_run(self, project_id: int, entities: list, run: dict) -> list:
+        keys = self._run_keys(project_id, run)
+        fingerprint = _fingerprint(run)
+        report = []
+        for entity in entities:
+            if entity == 'results':
+                pages = lambda: Results(self._api).iter_run_pages(run['id'])  # noqa: E731
+            else:
+                pages = lambda: Tests(self._api).iter_pages(run['id'])  # noqa: E731
+            report.append(self._write(entity, keys, pages, fingerprint))
+        return report
+
+    def _write(self, entity: str, keys: dict, pages, fingerprint: Optional[str] = None) -> tuple:
+        """
+        Writes the pages returned by `pages()` into a partition unless its fingerprint is unchanged.
+        The partition is swapped in once every page is written.
+
+        Without a `fingerprint`, it is computed from the pages as they are written
+        and an unchanged partition is left in place.
+        """
+        partition = _partition(entity, keys)
+        entry = self.manifest['partitions'].get(partition)
+        if entry is not None and entry['fingerprint'] == fingerprint:
+            return entity, partition, entry['rows'], 'unchanged'
+
+        digest = hashlib.sha1()
+        tmp = Path(tempfile.mkdtemp(prefix='.tmp-', dir=self.path))
+        try:
+            rows = 0
+            parts = 0
+            for df in pages():
+                if df is None or df.empty:
+                    continue
+                if fingerprint is None:
+                    digest.update(_fingerprint(df.to_dict('records')).encode())
+                df = df.drop(columns=[key for key in keys if key in df.columns])
+                apply_schema(df, entity, categorical=False).to_parquet(tmp / f'part-{parts:05d}.parquet', index=False)
+                rows += len(df)
+                parts += 1
+            if fingerprint is None:
+                fingerprint = digest.hexdigest()
+                if entry is not None and entry['fingerprint'] == fingerprint:
+                    return entity, partition, entry['rows'], 'unchanged'
+            target = self.path / partition
+            if target.exists():
+                shutil.rmtree(target)
+            if rows:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp, target)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.manifest['partitions'][partition] = {
+            'fingerprint': fingerprint, 'rows': rows, 'exported_on': int(time.time())}
+        return entity, partition, rows, 'written'
+
+    def _drop_moved(self, entity: str, keys: dict):
+        """
+        Removes the partition a run was exported to under another milestone.
+        """
+        partition = _partition(entity, keys)
+        prefix = _partition(entity, {'project_id': keys['project_id']}) + '/'
+        suffix = f"/run_id={keys['run_id']}"
+        for old in list(self.manifest['partitions']):
+            if old != partition and old.startswith(prefix) and old.endswith(suffix):
+                self._remove(old)
+
+    def _prune(self, entity: str, project_id: int, keep: list):
+        """
+        Removes the partitions of a project's entity which are not in `keep`.
+        """
+        prefix = _partition(entity, {'project_id': project_id}) + '/'
+        keep = set(keep)
+        for partition in list(self.manifest['partitions']):
+            if partition.startswith(prefix) and partition not in keep:
+                self._remove(partition)
+
+    def _remove(self, partition: str):
+        shutil.rmtree(self.path / partition, ignore_errors=True)
+        self.manifest['partitions'].pop(partition, None)
+
+    @staticmethod
+    def _failed(kind: str, failures: dict) -> list:
+        if failures:
+            warnings.warn(f'Failed to export {len(failures)} {kind}: {sorted(failures)}')
+        return [(kind, f'id={key}', 0, 'failed') for key in failures]
+
+    def save(self):
+        """
+        Writes the manifest to `path`.
+        """
+        tmp = self._manifest_file.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.manifest, indent=2))
+        os.replace(tmp, self._manifest_file)
@@ -0,0 +1,17 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def loads(content: bytes):
+    """
+    Decodes a JSON response body, with orjson when installed (`pip install testrail-data[fast]`),
+    several times faster than `json` on the large pages of results and tests.
+    Raises a ValueError on invalid JSON, like `json.loads`.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import requests
+from testrail_api._exception import TestRailError
+
+logger = logging.getLogger(__package__)
+
+write_prefixes = ('add_', 'update_', 'delete_', 'close_', 'move_', 'copy_')
+
+
+class RetryPolicy:
+    """
+    How a request is retried: up to `total` retries on the given status codes and,
+    if `connection_errors`, on connection errors and timeouts, waiting an exponential
+    backoff with full jitter, or the whole `Retry-After` of the response when it has one.
+    """
+
+    def __init__(
+            self,
+            total: int = 5,
+            backoff: float = 1,
+            max_backoff: float = 60,
+            statuses: tuple = (429, 500, 502, 503, 504),
+            connection_errors: bool = True,
+            max_retry_after: Optional[float] = None,
+    ):
+        """
+        :param total:
+            Maximum number of retries
+        :param backoff:
+            Base delay in seconds, the n-th retry waits up to `backoff * 2 ** n`
+        :param max_backoff:
+            Cap of a single backoff in seconds, a `Retry-After` is not capped
+        :param statuses:
+            HTTP status codes to retry
+        :param connection_errors:
+            True to retry connection errors and timeouts
+        :param max_retry_after:
+            Longest `Retry-After` in seconds to wait for, a TestRailError is raised
+            instead of retrying when the server asks for a longer wait. None for no limit.
+        """
+        self.total = total
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+        self.connection_errors = connection_errors
+        self.max_retry_after = max_retry_after
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Returns the seconds to wait before the retry number `attempt` (from 0).
+        """
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket refilled at `rate` tokens per second up to `burst` tokens.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns the seconds to wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._resume_at - now)
+
+    def pause(self, seconds: float):
+        """
+        Holds every request back for `seconds`, e.g. after the server asked to retry later.
+        """
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def _retry_after(headers) -> Optional[float]:
+    value = headers.get('Retry-After') if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class Scheduler:
+    """
+    Schedules the requests of a `TestRailAPI` (or `AsyncTestRailAPI`): a client side rate
+    limit shared by every thread, and retries following the policy of the endpoint.
+    A `Retry-After` response holds back all requests of the client, not only the retried one.
+
+    >>> api = TestRailAPI(scheduler=Scheduler(rate_limit=180))
+    >>> api = TestRailAPI(scheduler=Scheduler(policies={'get_results_for_run': RetryPolicy(total=10)}))
+    """
+
+    def __init__(
+            self,
+            rate_limit: Optional[float] = None,
+            burst: int = 1,
+            policy: Optional[RetryPolicy] = None,
+            policies: Optional[Dict[str, RetryPolicy]] = None,
+    ):
+        """
+        :param rate_limit:
+            Requests per minute, unlimited by default
+        :param burst:
+            Number of requests allowed at once before the rate limit applies
+        :param policy:
+            The retry policy of the endpoints without a policy of their own
+        :param policies:
+            Retry policies by endpoint prefix, e.g. `{'get_results': RetryPolicy(total=10)}`,
+            the longest matching prefix wins. Write endpoints (add_, update_, delete_, ...)
+            are only retried on 429 unless configured here.
+        """
+        self.bucket = TokenBucket(rate_limit / 60, burst) if rate_limit else None
+        self.policy = policy or RetryPolicy()
+        self.policies = {prefix: RetryPolicy(statuses=(429,), connection_errors=False) for prefix in write_prefixes}
+        self.policies.update(policies or {})
+
+    def policy_for(self, endpoint: str) -> RetryPolicy:
+        """
+        Returns the retry policy of an endpoint.
+        """
+        prefixes = [prefix for prefix in self.policies if endpoint.startswith(prefix)]
+        return self.policies[max(prefixes, key=len)] if prefixes else self.policy
+
+    def _wait(self) -> float:
+        return self.bucket.reserve() if self.bucket is not None else 0.0
+
+    def _backoff(self, policy: RetryPolicy, attempt: int, endpoint: str, reason, headers=None) -> float:
+        retry_after = _retry_after(headers)
+        if retry_after is not None and policy.max_retry_after is not None and retry_after > policy.max_retry_after:
+            raise TestRailError(f'{endpoint}: {reason}, the server asks to retry after {retry_after:.0f}s, '
+                                f'over the max_retry_after of {policy.max_retry_after}s')
+        delay = policy.delay(attempt, retry_after)
+        if retry_after is not None and self.bucket is not None:
+            self.bucket.pause(delay)
+        logger.warning('%s: %s, retrying in %.1fs (%s/%s)', endpoint, reason, delay, attempt + 1, policy.total)
+        return delay
+
+    def send(self, send, endpoint: str) -> requests.Response:
+        """
+        Calls `send()` to make the request of `endpoint`, retrying it per policy.
+
+        :param send:
+            Callable returning a `requests.Response`
+        :param endpoint:
+            The API endpoint, e.g. `get_results_for_run/1`
+        :return: the last response
+        """
+        policy = self.policy_for(endpoint)
+        attempt = 0
+        while True:
+            time.sleep(self._wait())
+            try:
+                response = send()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not policy.connection_errors or attempt >= policy.total:
+                    raise
+                time.sleep(self._backoff(policy, attempt, endpoint, e))
+                attempt += 1
+                continue
+            if response.status_code not in policy.statuses or attempt >= policy.total:
+                return response
+            time.sleep(self._backoff(policy, attempt, endpoint, response.status_code, response.headers))
+            attempt += 1
+
+    async def send_async(self, send, endpoint: str, connection_errors: tuple = ()):
+        """
+        The asyncio counterpart of `send`, `send` is a coroutine function returning
+        a response with `status` and `headers`.
+
+        :param connection_errors:
+            Exception types of the transport to treat as connection errors
+        """
+        policy = self.policy_for(endpoint)
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._wait())
+            try:
+                response = await send()
+            except (asyncio.TimeoutError, *connection_errors) as e:
+                if not policy.connection_errors or attempt >= policy.total:
+                    raise
+                await asyncio.sleep(self._backoff(policy, attempt, endpoint, e))
+                attempt += 1
+                continue
+            if response.status not in policy.statuses or attempt >= policy.total:
+                return response
+            await asyncio.sleep(self._backoff(policy, attempt, endpoint, response.status, response.headers))
+            attempt += 1
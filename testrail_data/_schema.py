@@ -0,0 +1,119 @@
+import functools
+import warnings
+
+import pandas as pd
+from pandas import DataFrame
+
+from testrail_data._stats import stage
+
+ID = 'Int32'
+COUNT = 'Int32'
+FLAG = 'boolean'
+# pandas < 2 only holds nanosecond datetimes
+TIMESTAMP = 'datetime64[s]' if int(pd.__version__.split('.')[0]) >= 2 else 'datetime64[ns]'
+CATEGORY = 'category'
+
+_run = {
+    'id': ID, 'suite_id': ID, 'milestone_id': ID, 'assignedto_id': ID, 'project_id': ID, 'plan_id': ID,
+    'created_by': ID, 'updated_by': ID, 'config': CATEGORY, 'is_completed': FLAG, 'include_all': FLAG,
+    'created_on': TIMESTAMP, 'completed_on': TIMESTAMP, 'updated_on': TIMESTAMP,
+    'passed_count': COUNT, 'blocked_count': COUNT, 'untested_count': COUNT, 'retest_count': COUNT,
+    'failed_count': COUNT,
+}
+
+schemas = {
+    'runs': _run,
+    'plans': _run,
+    'results': {
+        'id': ID, 'test_id': ID, 'status_id': CATEGORY, 'created_by': ID, 'assignedto_id': CATEGORY,
+        'created_on': TIMESTAMP,
+    },
+    'tests': {
+        'id': ID, 'case_id': ID, 'run_id': ID, 'status_id': CATEGORY, 'assignedto_id': CATEGORY,
+        'template_id': CATEGORY, 'type_id': CATEGORY, 'priority_id': CATEGORY, 'milestone_id': CATEGORY,
+    },
+    'cases': {
+        'id': ID, 'section_id': ID, 'suite_id': ID, 'display_order': COUNT, 'created_by': ID, 'updated_by': ID,
+        'template_id': CATEGORY, 'type_id': CATEGORY, 'priority_id': CATEGORY, 'milestone_id': CATEGORY,
+        'created_on': TIMESTAMP, 'updated_on': TIMESTAMP,
+    },
+}
+
+
+def _convert(s, dtype: str, categorical: bool = True):
+    if dtype == TIMESTAMP:
+        s = pd.to_datetime(s, unit='s')
+        return s if str(s.dtype) == TIMESTAMP else s.astype(TIMESTAMP)
+    if dtype == CATEGORY:
+        if not categorical:
+            return s.astype(ID)
+        if s.dtype.kind == 'f':
+            s = s.astype(ID)
+        return s.astype(CATEGORY)
+    return s.astype(dtype)
+
+
+def apply_schema(df: DataFrame, entity: str, categorical: bool = True) -> DataFrame:
+    """
+    Cast the known columns of an entity's DataFrame into compact dtypes in place:
+    nullable `Int32` IDs and counts, `boolean` flags, `datetime64` timestamps
+    (from UNIX seconds) and categoricals for low-cardinality columns.
+
+    Columns that are missing or already cast are left untouched, as are columns
+    holding values that do not fit the dtype, with a warning.
+
+    :param df:
+        The DataFrame to cast
+    :param entity:
+        A key of `schemas`, e.g. `results`
+    :param categorical:
+        False to cast the categorical columns into `Int32` instead, so frames
+        cast separately share the same schema
+    :return: DataFrame
+    """
+    for column, dtype in schemas[entity].items():
+        target = ID if dtype == CATEGORY and not categorical else dtype
+        if column not in df.columns or str(df[column].dtype) == target:
+            continue
+        try:
+            df[column] = _convert(df[column], dtype, categorical)
+        except (TypeError, ValueError, OverflowError) as e:
+            warnings.warn(f'{entity}.{column} is left as {df[column].dtype}, it cannot be cast to {target}: {e}')
+    return df
+
+
+def compact(entity: str):
+    """
+    A decorator casting the DataFrame returned by a category method with `apply_schema`
+    when the session has `compact_dtypes` enabled.
+
+    :param entity:
+        A key of `schemas`
+    :return:
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrap(self, *args, **kwargs):
+            df = f(self, *args, **kwargs)
+            if df is None or not getattr(self._session, 'compact_dtypes', False):
+                return df
+            with stage(self._session, 'apply_schema'):
+                return apply_schema(df, entity)
+        return wrap
+    return decorator
+
+
+def async_compact(entity: str):
+    """
+    The asyncio counterpart of `compact` for coroutine methods.
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        async def wrap(self, *args, **kwargs):
+            df = await f(self, *args, **kwargs)
+            if df is None or not getattr(self._session, 'compact_dtypes', False):
+                return df
+            with stage(self._session, 'apply_schema'):
+                return apply_schema(df, entity)
+        return wrap
+    return decorator
@@ -0,0 +1,237 @@
+import json
+import sqlite3
+import time
+import warnings
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import pandas as pd
+from pandas import DataFrame
+
+from testrail_data._category import Cases, Results, Suites, Tests, _fan_out, _grow_pool, _project_runs
+from testrail_data._export import _fingerprint
+
+# the columns of every table besides `data`, the whole record as JSON
+tables = {
+    'runs': (
+        ('id', 'INTEGER PRIMARY KEY'), ('project_id', 'INTEGER'), ('plan_id', 'INTEGER'), ('suite_id', 'INTEGER'),
+        ('milestone_id', 'INTEGER'), ('name', 'TEXT'), ('is_completed', 'INTEGER'), ('created_on', 'INTEGER'),
+        ('completed_on', 'INTEGER'), ('fingerprint', 'TEXT'),
+    ),
+    'cases': (
+        ('id', 'INTEGER PRIMARY KEY'), ('project_id', 'INTEGER'), ('suite_id', 'INTEGER'),
+        ('section_id', 'INTEGER'), ('title', 'TEXT'), ('type_id', 'INTEGER'), ('priority_id', 'INTEGER'),
+        ('created_on', 'INTEGER'), ('updated_on', 'INTEGER'),
+    ),
+    'tests': (
+        ('id', 'INTEGER PRIMARY KEY'), ('run_id', 'INTEGER'), ('case_id', 'INTEGER'), ('status_id', 'INTEGER'),
+        ('title', 'TEXT'),
+    ),
+    'results': (
+        ('id', 'INTEGER PRIMARY KEY'), ('test_id', 'INTEGER'), ('run_id', 'INTEGER'), ('status_id', 'INTEGER'),
+        ('created_on', 'INTEGER'), ('created_by', 'INTEGER'),
+    ),
+}
+
+indexes = {
+    'runs': (('project_id',), ('created_on',)),
+    'cases': (('project_id', 'suite_id'), ('section_id',)),
+    'tests': (('run_id',), ('case_id',), ('status_id',)),
+    'results': (('run_id',), ('test_id', 'created_on'), ('status_id',), ('created_on',)),
+}
+
+
+def _json_value(value):
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _row(table: str, record: dict) -> tuple:
+    record = {key: _json_value(value) for key, value in record.items()}
+    columns = (record.get(column) for column, _ in tables[table])
+    return (*(json.dumps(value) if isinstance(value, (list, dict)) else value for value in columns),
+            json.dumps(record, default=str))
+
+
+class SQLiteSnapshot:
+    """
+    A local SQLite copy of projects for ad-hoc queries, built with the standard library only.
+
+    Every table holds the main fields of a record as indexed columns and the whole
+    record as JSON in `data`, e.g. `json_extract(data, '$.custom_automated')`.
+
+    A refresh only pulls what changed: the tests and results of runs whose metadata
+    (counts, completion, updates) is unchanged are not pulled again, results are
+    pulled after the last `created_on` of the run, and cases after the last
+    `updated_on` of the suite.
+
+    >>> snapshot = SQLiteSnapshot(api, '~/testrail/snapshot.db')
+    >>> snapshot.refresh(project_id=1, max_workers=8)
+    >>> snapshot.query('''
+    ...     SELECT r.* FROM results r JOIN tests t ON t.id = r.test_id
+    ...     WHERE t.case_id = ? AND r.status_id = 5 ORDER BY r.created_on DESC LIMIT 1''', (42,))
+    """
+
+    entities = ('cases', 'runs', 'tests', 'results')
+
+    def __init__(self, api, path: Union[str, Path]):
+        """
+        :param api:
+            The TestRailAPI to pull from
+        :param path:
+            The SQLite database file, created if missing
+        """
+        self._api = api
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self._create()
+
+    def _create(self):
+        with self.connection:
+            for table, columns in tables.items():
+                self.connection.execute('CREATE TABLE IF NOT EXISTS {} ({}, data TEXT)'.format(
+                    table, ', '.join(f'{column} {kind}' for column, kind in columns)))
+                for index in indexes[table]:
+                    self.connection.execute('CREATE INDEX IF NOT EXISTS ix_{}_{} ON {} ({})'.format(
+                        table, '_'.join(index), table, ', '.join(index)))
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS snapshots (project_id INTEGER PRIMARY KEY, refreshed_on INTEGER)')
+
+    def refresh(
+            self,
+            project_id: int,
+            entities: Iterable[str] = entities,
+            max_workers: Optional[int] = None,
+            full: bool = False
+    ) -> DataFrame:
+        """
+        Pulls what changed in a project since the last refresh into the database.
+
+        :param project_id:
+            The ID of the project
+        :param entities:
+            Entities to refresh, see `SQLiteSnapshot.entities`
+        :param max_workers:
+            Number of plans and runs to pull concurrently
+        :param full:
+            True to pull everything again, e.g. to drop the cases deleted from TestRail
+        :return: DataFrame
+            A row per entity with the number of `rows` written
+        """
+        entities = set(entities)
+        assert entities <= set(self.entities), f'entities must be within {self.entities}'
+        max_workers = max_workers or 1
+        _grow_pool(self._api, max_workers)
+        written = dict.fromkeys(sorted(entities, key=self.entities.index), 0)
+
+        if 'cases' in entities:
+            for suite in Suites(self._api).get_suites(project_id):
+                written['cases'] += self._refresh_cases(project_id, suite['id'], full)
+        if entities & {'runs', 'tests', 'results'}:
+            runs, failures = self._pull_runs(project_id, entities, max_workers, full)
+            for entity, rows in runs.items():
+                if entity in written:
+                    written[entity] += rows
+            if failures:
+                warnings.warn(f'Failed to pull {len(failures)} run(s): {sorted(failures)}')
+
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO snapshots VALUES (?, ?)', (project_id, int(time.time())))
+        return DataFrame(list(written.items()), columns=['entity', 'rows'])
+
+    def _refresh_cases(self, project_id: int, suite_id: int, full: bool) -> int:
+        mark = None if full else self.connection.execute(
+            'SELECT MAX(updated_on) FROM cases WHERE project_id = ? AND suite_id = ?',
+            (project_id, suite_id)).fetchone()[0]
+        # updated_after is pulled back by a second so cases sharing the
+        # watermark's second are not missed, they are replaced on insert
+        filters = {} if mark is None else {'updated_after': mark - 1}
+        records = Cases(self._api)._cases(project_id, suite_id=suite_id, **filters).to_dict('records')
+        with self.connection:
+            if mark is None:
+                self.connection.execute(
+                    'DELETE FROM cases WHERE project_id = ? AND suite_id = ?', (project_id, suite_id))
+            self._insert('cases', [{**record, 'project_id': project_id, 'suite_id': suite_id}
+                                   for record in records])
+        return len(records)
+
+    def _pull_runs(self, project_id: int, entities: set, max_workers: int, full: bool) -> tuple:
+        runs, _, failures = _project_runs(self._api, project_id, max_workers)
+        if failures:
+            # the runs of the plans which failed to pull would be deleted as gone
+            raise next(iter(failures.values()))
+        runs = [{**run, 'project_id': project_id} for run in runs]
+
+        stored = dict(self.connection.execute('SELECT id, fingerprint FROM runs WHERE project_id = ?', (project_id,)))
+        # a run is up to date once both its tests and results are pulled
+        synced = {'tests', 'results'} <= entities
+        for run in runs:
+            run['fingerprint'] = _fingerprint(run) if synced else stored.get(int(run['id']))
+        changed = [run for run in runs if full or not synced or stored.get(int(run['id'])) != run['fingerprint']]
+        marks = {} if full else dict(self.connection.execute(
+            'SELECT run_id, MAX(created_on) FROM results WHERE run_id IN (SELECT id FROM runs WHERE project_id = ?) '
+            'GROUP BY run_id', (project_id,)))
+
+        def pull(run):
+            run_id = int(run['id'])
+            df_tests = Tests(self._api)._tests_for_run(run_id) if 'tests' in entities else None
+            df_results = None
+            if 'results' in entities:
+                mark = marks.get(run_id)
+                # created_after is pulled back by a second, see `_refresh_cases`
+                filters = {} if mark is None else {'created_after': mark - 1}
+                df_results = Results(self._api)._dataframe_from_run(
+                    run_id, is_completed=run.get('is_completed'), **filters)
+            return df_tests, df_results
+
+        pulled, failures = _fan_out(lambda i: pull(changed[i]), range(len(changed)), max_workers)
+        rows = {'runs': 0, 'tests': 0, 'results': 0}
+        with self.connection:
+            gone = set(stored) - {int(run['id']) for run in runs}
+            for table, column in (('results', 'run_id'), ('tests', 'run_id'), ('runs', 'id')):
+                self.connection.executemany(f'DELETE FROM {table} WHERE {column} = ?', [(i,) for i in gone])
+            for i, (run, frames) in enumerate(zip(changed, pulled)):
+                if i in failures or frames is None:
+                    # keep the previous fingerprint so the run is pulled again next time
+                    run['fingerprint'] = stored.get(int(run['id']))
+                    continue
+                df_tests, df_results = frames
+                if df_tests is not None:
+                    self.connection.execute('DELETE FROM tests WHERE run_id = ?', (int(run['id']),))
+                    rows['tests'] += self._insert('tests', df_tests.to_dict('records'))
+                if df_results is not None:
+                    rows['results'] += self._insert(
+                        'results', [{**record, 'run_id': int(run['id'])} for record in df_results.to_dict('records')])
+            rows['runs'] = self._insert('runs', changed)
+        return rows, {int(changed[i]['id']): e for i, e in failures.items()}
+
+    def _insert(self, table: str, records: list) -> int:
+        placeholders = ', '.join('?' * (len(tables[table]) + 1))
+        self.connection.executemany(
+            f'INSERT OR REPLACE INTO {table} VALUES ({placeholders})', [_row(table, record) for record in records])
+        return len(records)
+
+    def query(self, sql: str, params=()) -> DataFrame:
+        """
+        Runs a query against the database.
+
+        :param sql:
+            The SQL query, with `?` placeholders
+        :param params:
+            The values of the placeholders
+        :return: DataFrame
+        """
+        return pd.read_sql_query(sql, self.connection, params=params)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,195 @@
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Callable, Optional
+
+# upper bounds in seconds of the latency histogram buckets
+latency_buckets = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float('inf'))
+
+
+def endpoint_name(endpoint: str) -> str:
+    """
+    The endpoint without its IDs and filters, e.g. `get_results_for_run` for `get_results_for_run/12&limit=250`.
+    """
+    return endpoint.split('&', 1)[0].split('/', 1)[0]
+
+
+class Stats:
+    """
+    Thread-safe counters of what a `TestRailAPI` spends its time on:
+
+    - endpoints: per endpoint, the `calls` made, the HTTP `responses` received, `retries`
+      (responses and connection errors beyond the first attempt of a call, and calls made again
+      by the paginated methods after a connection error), `connection_errors`,
+      `rate_limited` responses, `coalesced` calls answered by an identical one (see `Coalescer`),
+      `bytes` received, `seconds` spent and a `latency` histogram of the calls (the count per
+      upper bound in seconds, see `latency_buckets`)
+    - pagination: per paginated method, the `walks` over its pages, the `pages` pulled and the `max_pages` of a walk
+    - stages: per in-process stage (`build` of a page into a DataFrame or columns, `decode` of a response,
+      `concat` of pages into a DataFrame, `apply_schema`, `fill_id_fields`, `fill_custom_fields`), the `count`,
+      the `seconds` spent and the `network_seconds` of the calls made within the stage
+
+    Callbacks receive every event as a dict with its `type` (request, page_walk or stage),
+    e.g. to export them to a metrics system:
+
+    >>> api.stats.subscribe(lambda event: statsd.timing(event['type'], event['seconds']))
+    >>> api.stats.snapshot()['endpoints']['get_results_for_run']['retries']
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._callbacks = []
+        # the endpoint which last failed with a connection error, per thread and asyncio task
+        self._failed = contextvars.ContextVar('failed', default=None)
+        self.reset()
+
+    def reset(self):
+        """
+        Drops every counter, the callbacks are kept.
+        """
+        with self._lock:
+            self._endpoints = {}
+            self._pagination = {}
+            self._stages = {}
+
+    def subscribe(self, callback: Callable[[dict], None]):
+        """
+        Calls `callback(event)` for every recorded event, from the thread recording it.
+        """
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[dict], None]):
+        self._callbacks.remove(callback)
+
+    def _emit(self, event: dict):
+        for callback in list(self._callbacks):
+            callback(event)
+
+    def _endpoint(self, endpoint: str) -> dict:
+        name = endpoint_name(endpoint)
+        counters = self._endpoints.get(name)
+        if counters is None:
+            counters = self._endpoints[name] = {
+                'calls': 0, 'responses': 0, 'connection_errors': 0, 'rate_limited': 0, 'coalesced': 0,
+                'retried_calls': 0, 'bytes': 0, 'seconds': 0.0, 'latency': [0] * len(latency_buckets),
+            }
+        return counters
+
+    @property
+    def network_seconds(self) -> float:
+        """
+        Seconds the current thread spent in calls so far.
+        """
+        return getattr(self._local, 'network', 0.0)
+
+    def record_call(self, endpoint: str, seconds: float, nbytes: int = 0, status: Optional[int] = None,
+                    error: Optional[BaseException] = None):
+        """
+        Records a call of an endpoint, with its retries, from its start to its last response or error.
+        """
+        self._local.network = self.network_seconds + seconds
+        with self._lock:
+            counters = self._endpoint(endpoint)
+            counters['calls'] += 1
+            counters['bytes'] += nbytes
+            counters['seconds'] += seconds
+            counters['latency'][next(i for i, bound in enumerate(latency_buckets) if seconds <= bound)] += 1
+        self._emit({'type': 'request', 'endpoint': endpoint_name(endpoint), 'seconds': seconds, 'bytes': nbytes,
+                    'status': status, 'error': error})
+
+    def record_response(self, endpoint: str, status: int):
+        """
+        Records an HTTP response, calls retried by the session receive several.
+        """
+        with self._lock:
+            counters = self._endpoint(endpoint)
+            counters['responses'] += 1
+            counters['rate_limited'] += status == 429
+
+    def record_coalesced(self, endpoint: str):
+        """
+        Records a call answered by an identical one instead of the network, see `Coalescer`.
+        """
+        with self._lock:
+            self._endpoint(endpoint)['coalesced'] += 1
+
+    def record_connection_error(self, endpoint: str):
+        self._failed.set(endpoint)
+        with self._lock:
+            self._endpoint(endpoint)['connection_errors'] += 1
+
+    def record_retry(self):
+        """
+        Records that the call which last failed with a connection error, in the current
+        thread or asyncio task, is made again as a new call.
+        """
+        endpoint = self._failed.get()
+        if endpoint is None:
+            return
+        with self._lock:
+            self._endpoint(endpoint)['retried_calls'] += 1
+
+    def record_pages(self, method: str, pages: int):
+        """
+        Records a walk over the pages of a paginated method.
+        """
+        with self._lock:
+            counters = self._pagination.setdefault(method, {'walks': 0, 'pages': 0, 'max_pages': 0})
+            counters['walks'] += 1
+            counters['pages'] += pages
+            counters['max_pages'] = max(counters['max_pages'], pages)
+        self._emit({'type': 'page_walk', 'method': method, 'pages': pages})
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        Times an in-process stage, e.g. `with api.stats.stage('fill_id_fields'): ...`.
+        """
+        network = self.network_seconds
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            network = self.network_seconds - network
+            with self._lock:
+                counters = self._stages.setdefault(name, {'count': 0, 'seconds': 0.0, 'network_seconds': 0.0})
+                counters['count'] += 1
+                counters['seconds'] += seconds
+                counters['network_seconds'] += network
+            self._emit({'type': 'stage', 'name': name, 'seconds': seconds, 'network_seconds': network})
+
+    def snapshot(self) -> dict:
+        """
+        Returns a copy of the counters:
+
+            {
+                'endpoints': {<ENDPOINT>: {'calls': ..., 'retries': ..., 'latency': {<BOUND>: <COUNT>}, ...}},
+                'pagination': {<METHOD>: {'walks': ..., 'pages': ..., 'max_pages': ...}},
+                'stages': {<STAGE>: {'count': ..., 'seconds': ..., 'network_seconds': ...}},
+            }
+        """
+        with self._lock:
+            endpoints = {}
+            for name, counters in self._endpoints.items():
+                endpoints[name] = {
+                    **counters,
+                    'retries': max(0, counters['responses'] + counters['connection_errors'] - counters['calls'])
+                    + counters['retried_calls'],
+                    'latency': dict(zip(latency_buckets, counters['latency'])),
+                }
+            return {
+                'endpoints': endpoints,
+                'pagination': {name: dict(counters) for name, counters in self._pagination.items()},
+                'stages': {name: dict(counters) for name, counters in self._stages.items()},
+            }
+
+
+def stage(session, name: str):
+    """
+    `Stats.stage` of a session, a no-op for sessions without stats.
+    """
+    stats = getattr(session, 'stats', None)
+    return stats.stage(name) if stats is not None else contextlib.nullcontext()
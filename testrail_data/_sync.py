@@ -0,0 +1,132 @@
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+from pandas import DataFrame, Series
+
+from testrail_data._category import Results, _fan_out, _grow_pool, _project_runs
+
+
+class ResultSync:
+    """
+    Keeps a local results table of one or many projects up to date with
+    `created_after` watermarks, so a refresh only pulls the new results.
+
+    The watermark of a run is the highest `created_on` of its results seen so far,
+    the watermark of a project is the highest over its runs. A run is no longer
+    queried once it has been synced after being completed.
+
+    The table is stored as `results.parquet` next to a `state.json` holding the
+    watermarks in `path`.
+
+    >>> sync = ResultSync(api, '~/testrail/results')
+    >>> df_new = sync.sync(project_id=1)
+    >>> sync.table
+    """
+
+    def __init__(self, api, path: Union[str, Path]):
+        """
+        :param api:
+            The TestRailAPI to pull from
+        :param path:
+            Directory of the local table and its watermarks
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError('ResultSync requires pyarrow, run `pip install testrail-data[cache]`')
+        self._api = api
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._table_file = self.path / 'results.parquet'
+        self._state_file = self.path / 'state.json'
+        self.state = json.loads(self._state_file.read_text()) if self._state_file.exists() else {'projects': {}}
+        self.table = pd.read_parquet(self._table_file) if self._table_file.exists() else DataFrame()
+
+    def watermark(self, project_id: int, run_id: Optional[int] = None) -> Optional[int]:
+        """
+        Returns the high-water mark (`created_on` UNIX timestamp) of a project or one of its runs.
+        """
+        project = self.state['projects'].get(str(project_id), {})
+        if run_id is None:
+            return project.get('created_on')
+        return project.get('runs', {}).get(str(run_id), {}).get('created_on')
+
+    def sync(self, project_id: int, max_workers: Optional[int] = None, **kwargs) -> DataFrame:
+        """
+        Pulls the results created after the watermarks of the project's runs,
+        merges them into the local table and saves it.
+
+        :param project_id:
+            The ID of the project
+        :param max_workers:
+            Number of plans and runs to pull concurrently
+        :param kwargs: filters of `Runs.to_dataframe`, they also apply to the runs of test plans
+        :return: DataFrame
+            The rows merged into the table which were not in it yet
+        """
+        project = self.state['projects'].setdefault(str(project_id), {'created_on': None, 'runs': {}})
+        _grow_pool(self._api, max_workers)
+        records, _, plan_failures = _project_runs(self._api, project_id, max_workers or 1, **kwargs)
+        runs = {int(run['id']): run.get('is_completed') for run in records}
+        pending = [run_id for run_id in runs if not project['runs'].get(str(run_id), {}).get('completed')]
+
+        results = Results(self._api)
+
+        def pull(run_id):
+            mark = self.watermark(project_id, run_id)
+            # created_after is pulled back by a second so results sharing the
+            # watermark's second are not missed, duplicates are dropped on merge
+            filters = {} if mark is None else {'created_after': mark - 1}
+            return results._dataframe_from_run(run_id, **filters)
+
+        frames, failures = _fan_out(pull, pending, max_workers or 1)
+        new_frames = []
+        for run_id, df in zip(pending, frames):
+            if df is None:
+                continue
+            run = project['runs'].setdefault(str(run_id), {'created_on': None, 'completed': False})
+            if not df.empty:
+                df = df.assign(run_id=run_id, project_id=project_id)
+                new_frames.append(df)
+                run['created_on'] = max(int(df['created_on'].max()), run['created_on'] or 0)
+            run['completed'] = bool(runs[run_id])
+        marks = [run['created_on'] for run in project['runs'].values() if run['created_on'] is not None]
+        project['created_on'] = max(marks) if marks else None
+
+        df_new = self._merge(new_frames)
+        self.save()
+        if failures:
+            df_new.attrs['failed_runs'] = {run_id: repr(e) for run_id, e in failures.items()}
+            warnings.warn(f'Failed to sync {len(failures)} run(s): {sorted(failures)}')
+        if plan_failures:
+            df_new.attrs['failed_plans'] = {plan_id: repr(e) for plan_id, e in plan_failures.items()}
+            warnings.warn(f'Failed to pull {len(plan_failures)} plan(s), their runs are not synced: '
+                          f'{sorted(plan_failures)}')
+        return df_new
+
+    def _merge(self, frames: list) -> DataFrame:
+        if not frames:
+            return DataFrame()
+        df_new = pd.concat(frames).drop_duplicates('id', keep='last').reset_index(drop=True)
+        table = self.table
+        known = Series(dtype=object) if table.empty else table['id']
+        if not table.empty:
+            table = table[~table['id'].isin(df_new['id'])]
+        self.table = pd.concat([table, df_new]).reset_index(drop=True)
+        # the rows pulled back by `created_after` replace the stored ones but are not new
+        return df_new[~df_new['id'].isin(known)].reset_index(drop=True)
+
+    def save(self):
+        """
+        Writes the table and the watermarks to `path`.
+        """
+        tmp = self._table_file.with_suffix('.tmp')
+        self.table.to_parquet(tmp)
+        os.replace(tmp, self._table_file)
+        tmp = self._state_file.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.state))
+        os.replace(tmp, self._state_file)
@@ -1,80 +1,298 @@
+import os
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
 from testrail_api import TestRailAPI as TRApi
-from testrail_data._category import (
-    Runs,
-    Plans,
-    Results,
-    Milestones,
-    Cases,
-    CaseFields,
-    Sections,
-    Template,
-    CaseTypes,
-    Priorities,
-    Suites,
-    Statuses,
-    Tests,
-    Metas,
-)
+from testrail_api._enums import METHODS
+from testrail_data._cache import MetaCache, ResultCache
+from testrail_data._coalesce import Coalescer
+from testrail_data._json import loads
+from testrail_data._scheduler import Scheduler
+from testrail_data._stats import Stats
+
+if TYPE_CHECKING:  # pragma: no cover
+    from testrail_data._category import (
+        Runs,
+        Plans,
+        Results,
+        Milestones,
+        Cases,
+        CaseFields,
+        Sections,
+        Template,
+        CaseTypes,
+        Priorities,
+        Suites,
+        Statuses,
+        Tests,
+        Metas,
+    )
+
+
+# the private attributes of `testrail_api.Session` this client relies on, see setup.py for the supported versions
+session_internals = ('_Session__session', '_Session__timeout', '_Session__response_handler')
+
+
+class _Unshared(Exception):
+    """
+    Carries an error response out of `Coalescer.call`, so it is neither shared nor kept.
+    """
+
+    def __init__(self, response: requests.Response):
+        super().__init__(response.status_code)
+        self.response = response
 
 
 class TestRailAPI(TRApi):
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(
+            self,
+            url: Optional[str] = None,
+            email: Optional[str] = None,
+            password: Optional[str] = None,
+            *args,
+            result_cache: Optional[ResultCache] = None,
+            meta_ttl: float = 300,
+            compact_dtypes: bool = True,
+            scheduler: Optional[Scheduler] = None,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            connect_timeout: Optional[float] = None,
+            accept_encoding: Optional[str] = 'gzip, deflate',
+            json_decoder: Optional[Callable[[bytes], Any]] = None,
+            coalesce_window: Optional[float] = None,
+            **kwargs
+    ):
+        """
+        :param url:
+            TestRail address
+        :param email:
+            Email for the account on the TestRail
+        :param password:
+            Password for the account on the TestRail or token
+        :param result_cache:
+            An on-disk cache to serve the results of completed runs from
+        :param meta_ttl:
+            Seconds metadata lookups (sections, templates, case fields, ...) are
+            cached for, shared by every category of this instance.
+            See `meta_cache.invalidate` to drop them earlier.
+        :param compact_dtypes:
+            Cast runs, plans, results, tests and cases DataFrames into compact dtypes
+            (nullable Int32 IDs, datetime64 timestamps, categoricals), see `_schema.schemas`.
+            False to keep the dtypes inferred by pandas.
+        :param scheduler:
+            Rate limits and retries every request (429, 5xx, connection errors) per endpoint.
+            It replaces the 429 handling of `testrail_api` and the connection retry of the
+            paginated methods.
+        :param pool_connections:
+            Number of hosts to keep a connection pool for
+        :param pool_maxsize:
+            Maximum number of connections kept alive per host; it grows to the
+            concurrency used by `max_workers`/`prefetch`, see `grow_pool`
+        :param pool_block:
+            True to wait for a free connection instead of opening one that is
+            discarded afterwards when the pool is full
+        :param connect_timeout:
+            Seconds to wait for a connection, the `timeout` kwarg then only applies to reads
+        :param accept_encoding:
+            The `Accept-Encoding` header, None to leave the one of `requests`
+        :param json_decoder:
+            Decodes the body of successful responses, raising a ValueError on invalid JSON.
+            orjson when installed, `json` otherwise; a `response_handler` kwarg replaces it.
+        :param coalesce_window:
+            Seconds a GET response is shared with identical GETs after it returned, 0 to only
+            share it between identical concurrent GETs. Every caller decodes its own copy of
+            the response body. None (default) to send every request, see `Coalescer`.
+        :param kwargs:
+            Refer to `testrail_api.TestRailAPI`
+            :key timeout: int (default: 30)
+                How many seconds to wait for the server to send data
+
+        Requests, pagination and in-process stages are counted in `stats`, see `Stats`.
+        Categories (`runs`, `results`, ...) are imported on first access and then
+        kept for the lifetime of the instance.
+        """
+        self._categories = {}
+        super().__init__(url, email, password, *args, **kwargs)
+        missing = [name for name in session_internals if not hasattr(self, name)]
+        if missing:
+            raise RuntimeError(f'Unsupported testrail_api version, its Session has no {missing}, '
+                               f'run `pip install "testrail-api>=1.10,<2"`')
+        self.instance_url = (url or os.environ.get("TESTRAIL_URL")).rstrip('/')
+        self.result_cache = result_cache
+        self.meta_cache = MetaCache(ttl=meta_ttl)
+        self.compact_dtypes = compact_dtypes
+        self.scheduler = scheduler
+        if scheduler is not None:
+            self._rate_limit = False
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._pool_lock = threading.Lock()
+        self._mount()
+        if connect_timeout is not None:
+            self._Session__timeout = (connect_timeout, self._Session__timeout)
+        if accept_encoding is not None:
+            self._Session__session.headers['Accept-Encoding'] = accept_encoding
+        self.stats = Stats()
+        self.coalescer = None if coalesce_window is None else Coalescer(coalesce_window)
+        self.json_decoder = None if kwargs.get('response_handler') else json_decoder or loads
+        self._Session__session.hooks['response'].append(self._on_response)
+
+    def _on_response(self, response, **kwargs):
+        endpoint = response.url.partition('/api/v2/')[2]
+        if endpoint:
+            self.stats.record_response(endpoint, response.status_code)
+
+    def _mount(self):
+        session = self._Session__session
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, pool_block=self.pool_block)
+        replaced = {id(session.adapters[prefix]): session.adapters[prefix]
+                    for prefix in ('https://', 'http://') if prefix in session.adapters}
+        for prefix in ('https://', 'http://'):
+            session.mount(prefix, adapter)
+        # idle connections of the replaced pools are closed now, the ones in use once released
+        for old in replaced.values():
+            old.close()
+
+    def grow_pool(self, size: int):
+        """
+        Makes room for `size` connections per host when it is over `pool_maxsize`.
+        Called before pulling with `max_workers` or `prefetch`.
+
+        :param size:
+            Number of concurrent requests about to be made
+        """
+        with self._pool_lock:
+            if size <= self.pool_maxsize:
+                return
+            self.pool_maxsize = size
+            self._mount()
+
+    def request(self, method, endpoint: str, raw: bool = False, **kwargs):
+        if self.coalescer is None or raw or method != METHODS.GET or set(kwargs) - {'params'}:
+            return self._request(method, endpoint, raw, **kwargs)
+        params = kwargs.get('params') or {}
+        key = (endpoint, repr(sorted(params.items(), key=str)))
+        sent = []
+
+        def send():
+            sent.append(True)
+            response = self._request(method, endpoint, raw=True, **kwargs)
+            if not response.ok:
+                # errors are not shared, nor kept for the window
+                raise _Unshared(response)
+            return response
+
+        try:
+            # the HTTP response is shared, every caller decodes its own copy of the body
+            response, shared = self.coalescer.call(key, send)
+        except _Unshared as e:
+            # the callers which waited for the failed call send their own request
+            response = e.response if sent else self._request(method, endpoint, raw=True, **kwargs)
+            return self._decode(response)
+        if shared:
+            self.stats.record_coalesced(endpoint)
+        return self._decode(response)
+
+    def _request(self, method, endpoint: str, raw: bool = False, **kwargs):
+        start = time.perf_counter()
+        try:
+            if self.scheduler is None:
+                try:
+                    response = super().request(method, endpoint, raw=True, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    self.stats.record_connection_error(endpoint)
+                    raise
+            else:
+                response = self.scheduler.send(lambda: self._send(method, endpoint, **kwargs), endpoint)
+        except Exception as e:
+            self.stats.record_call(endpoint, time.perf_counter() - start, error=e)
+            raise
+        self.stats.record_call(endpoint, time.perf_counter() - start, len(response.content), response.status_code)
+        return response if raw else self._decode(response)
+
+    def _decode(self, response: requests.Response):
+        with self.stats.stage('decode'):
+            if self.json_decoder is None or not response.ok:
+                return self._Session__response_handler(response)
+            try:
+                return self.json_decoder(response.content)
+            except ValueError:
+                return response.text or None
+
+    def _send(self, method, endpoint: str, **kwargs) -> requests.Response:
+        try:
+            return super().request(method, endpoint, raw=True, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self.stats.record_connection_error(endpoint)
+            raise
+
+    def _category(self, name: str):
+        category = self._categories.get(name)
+        if category is None:
+            from testrail_data import _category
+
+            category = self._categories.setdefault(name, getattr(_category, name)(self))
+        return category
 
     @property
-    def runs(self) -> Runs:
-        return Runs(self)
+    def runs(self) -> 'Runs':
+        return self._category('Runs')
 
     @property
-    def plans(self) -> Plans:
-        return Plans(self)
+    def plans(self) -> 'Plans':
+        return self._category('Plans')
 
     @property
-    def results(self) -> Results:
-        return Results(self)
+    def results(self) -> 'Results':
+        return self._category('Results')
 
     @property
-    def cases(self) -> Cases:
-        return Cases(self)
+    def cases(self) -> 'Cases':
+        return self._category('Cases')
 
     @property
-    def milestones(self) -> Milestones:
-        return Milestones(self)
+    def milestones(self) -> 'Milestones':
+        return self._category('Milestones')
 
     @property
-    def case_fields(self) -> CaseFields:
-        return CaseFields(self)
+    def case_fields(self) -> 'CaseFields':
+        return self._category('CaseFields')
 
     @property
-    def sections(self) -> Sections:
-        return Sections(self)
+    def sections(self) -> 'Sections':
+        return self._category('Sections')
 
     @property
-    def templates(self) -> Template:
-        return Template(self)
+    def templates(self) -> 'Template':
+        return self._category('Template')
 
     @property
-    def case_types(self) -> CaseTypes:
-        return CaseTypes(self)
+    def case_types(self) -> 'CaseTypes':
+        return self._category('CaseTypes')
 
     @property
-    def priorities(self) -> Priorities:
-        return Priorities(self)
+    def priorities(self) -> 'Priorities':
+        return self._category('Priorities')
 
     @property
-    def suites(self) -> Suites:
-        return Suites(self)
+    def suites(self) -> 'Suites':
+        return self._category('Suites')
 
     @property
-    def statuses(self) -> Statuses:
-        return Statuses(self)
+    def statuses(self) -> 'Statuses':
+        return self._category('Statuses')
 
     @property
-    def tests(self) -> Tests:
-        return Tests(self)
+    def tests(self) -> 'Tests':
+        return self._category('Tests')
 
     @property
-    def metas(self) -> Metas:
-        return Metas(self)
\ No newline at end of file
+    def metas(self) -> 'Metas':
+        return self._category('Metas')
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+A minimal stand-in TestRail HTTP server for offline tests.
+
+Routes are registered by endpoint (e.g. `get_runs/1`). A list value is served
+page by page according to `offset`/`limit` (capped at `page_size` like TestRail),
+a callable receives the request parameters and returns the payload, anything else
+is returned as is.
+
+`latency` delays every response, `rate_limit_every`/`drop_every` answer every n-th
+request with a 429 (and `Retry-After: 0`) or close the connection without a response.
+Every request, faulted or not, is recorded in `calls` as (endpoint, params).
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote
+
+API_PREFIX = '/index.php?/api/v2/'
+
+
+class FakeTestRail:
+
+    def __init__(
+            self,
+            routes: dict = None,
+            page_size: int = 250,
+            latency: float = 0,
+            rate_limit_every: int = 0,
+            drop_every: int = 0,
+    ):
+        self.routes = routes or {}
+        self.page_size = page_size
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.drop_every = drop_every
+        self.calls = []
+        self.faults = {'rate_limited': 0, 'dropped': 0}
+        self._count = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def handle(self, endpoint: str, params: dict):
+        """
+        Returns (status, payload) for a request.
+        """
+        if endpoint not in self.routes:
+            return 400, {'error': f'Unknown endpoint {endpoint}'}
+        payload = self.routes[endpoint]
+        if callable(payload):
+            payload = payload(params)
+        if isinstance(payload, list):
+            offset = int(params.get('offset', 0))
+            limit = min(int(params.get('limit', self.page_size)), self.page_size)
+            payload = payload[offset:offset + limit]
+        return 200, payload
+
+    def fault(self):
+        """
+        Returns the fault to inject into the next request, if any: `rate_limited` or `dropped`.
+        """
+        with self._lock:
+            self._count += 1
+            for kind, every in (('dropped', self.drop_every), ('rate_limited', self.rate_limit_every)):
+                if every and self._count % every == 0:
+                    self.faults[kind] += 1
+                    return kind
+        return None
+
+    def start(self) -> 'FakeTestRail':
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if not self.path.startswith(API_PREFIX):
+                    self.send_error(404)
+                    return
+                endpoint, _, query = self.path[len(API_PREFIX):].partition('&')
+                endpoint, params = unquote(endpoint), dict(parse_qsl(query))
+                # every request is recorded, including the ones answered with a fault
+                fake.calls.append((endpoint, params))
+                if fake.latency:
+                    time.sleep(fake.latency)
+                fault = fake.fault()
+                if fault == 'dropped':
+                    self.close_connection = True
+                    return
+                if fault == 'rate_limited':
+                    self.send_response(429)
+                    self.send_header('Retry-After', '0')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                status, payload = fake.handle(endpoint, params)
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
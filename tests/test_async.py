@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from testrail_data import AsyncTestRailAPI  # noqa: E402
+
+
+def get_result(size, start=0):
+    return [{'id': start + i, 'status_id': 1, 'test_id': 1} for i in range(size)]
+
+
+def run(fake_server, coro_factory):
+    async def main():
+        async with AsyncTestRailAPI(fake_server.url, 'example@mail.com', 'password') as api:
+            return await coro_factory(api)
+    return asyncio.run(main())
+
+
+def test_dataframe_from_run_walks_all_pages(fake_server):
+    fake_server.routes['get_results_for_run/12'] = get_result(520)
+
+    df = run(fake_server, lambda api: api.results.dataframe_from_run(12))
+
+    assert df.shape == (520, 3)
+    assert [params['offset'] for _, params in fake_server.calls] == ['0', '250', '500']
+
+
+def test_dataframe_from_run_with_prefetch(fake_server):
+    fake_server.routes['get_results_for_run/12'] = get_result(510)
+
+    df = run(fake_server, lambda api: api.results.dataframe_from_run(12, prefetch=3))
+
+    assert df['id'].to_list() == list(range(510))
+
+
+def test_dataframe_from_runs_reports_failed_runs(fake_server):
+    fake_server.routes['get_results_for_run/1'] = get_result(2)
+    fake_server.routes['get_results_for_run/3'] = get_result(1, start=10)
+
+    with pytest.warns(UserWarning):
+        df = run(fake_server, lambda api: api.results.dataframe_from_runs(3, 2, 1, max_workers=2))
+
+    assert df['id'].to_list() == [10, 0, 1]
+    assert list(df.attrs['failed_runs']) == [2]
+
+
+def test_tests_to_dataframe_with_meta(fake_server):
+    fake_server.routes.update({
+        'get_tests/7': [{'id': 1, 'run_id': 7, 'type_id': 2, 'priority_id': 9}],
+        'get_run/7': {'id': 7, 'project_id': 3},
+        'get_case_types': [{'id': 2, 'name': 'Functional'}],
+        'get_priorities': [{'id': 1, 'name': 'Low'}],
+        'get_case_fields': [],
+    })
+
+    df = run(fake_server, lambda api: api.tests.to_dataframe(7, with_meta=True))
+
+    assert df['type_name'][0] == 'Functional'
+    assert df['priority_name'][0] == 'UNKNOWN 9'
+
+
+def test_tests_to_dataframe_pages_runs(fake_server):
+    fake_server.routes.update({
+        'get_tests/7': [{'id': i, 'run_id': 7} for i in range(260)],
+        'get_tests/8': [{'id': 1000, 'run_id': 8}],
+    })
+
+    df = run(fake_server, lambda api: api.tests.to_dataframe(7, 8, max_workers=1))
+
+    assert df['id'].to_list() == list(range(260)) + [1000]
+    assert len(fake_server.calls) == 3
+
+
+def test_cases_to_dataframe_by_section(fake_server):
+    fake_server.routes.update({
+        'get_sections/1': [{'id': 20, 'name': 'Root'}, {'id': 10, 'name': 'Child'}],
+        'get_cases/1': lambda params: [
+            {'id': int(params['section_id']) * 100 + i, 'section_id': int(params['section_id'])}
+            for i in range(260 if params['section_id'] == '10' else 1)],
+    })
+
+    df = run(fake_server, lambda api: api.cases.to_dataframe(1, 2, by_section=True))
+
+    assert df['id'].to_list() == [2000] + list(range(1000, 1260))
+
+
+def test_iter_run_pages(fake_server):
+    fake_server.routes['get_results_for_run/12'] = get_result(260)
+
+    async def pages(api):
+        return [df.shape[0] async for df in api.results.iter_run_pages(12, prefetch=2)]
+
+    assert run(fake_server, pages) == [250, 10]
+
+
+def test_get_runs_by_milestone(fake_server):
+    fake_server.routes.update({
+        'get_milestones/1': [{'id': 10, 'parent_id': None}, {'id': 11, 'parent_id': 10}],
+        'get_runs/1': lambda params: [{'id': 1}] if params['milestone_id'] == '10,11' else [],
+        'get_plans/1': [{'id': 5}],
+        'get_plan/5': {'id': 5, 'entries': [{'runs': [{'id': 2}]}]},
+    })
+
+    df = run(fake_server, lambda api: api.runs.get_runs_by_milestone(10, project_id=1))
+
+    assert df['id'].to_list() == [1, 2]
+
+
+def test_iter_run_pages_closed_early_cancels_prefetched_pages(fake_server):
+    fake_server.routes['get_results_for_run/12'] = get_result(1000)
+    fake_server.latency = 0.05
+
+    async def first_page(api):
+        pages = api.results.iter_run_pages(12, prefetch=3)
+        async for df in pages:
+            break
+        await pages.aclose()
+        return df, [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    df, pending = run(fake_server, first_page)
+
+    assert df.shape[0] == 250
+    assert pending == []
+
+
+def test_large_bodies_are_read_before_the_connection_is_released(fake_server):
+    fake_server.routes['get_results_for_run/12'] = [
+        {'id': i, 'status_id': 1, 'test_id': 1, 'comment': 'x' * 2000} for i in range(510)]
+
+    df = run(fake_server, lambda api: api.results.dataframe_from_run(12, prefetch=3))
+
+    assert df['id'].to_list() == list(range(510))
+
+
+def test_rate_limited_requests_are_retried_without_a_scheduler(fake_server):
+    fake_server.routes['get_results_for_run/12'] = get_result(520)
+    fake_server.rate_limit_every = 2
+
+    df = run(fake_server, lambda api: api.results.dataframe_from_run(12))
+
+    assert df['id'].to_list() == list(range(520))
+    assert fake_server.faults['rate_limited'] == 2
+    assert len(fake_server.calls) == 5
@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+import responses
+
+from testrail_data import TestRailAPI, ResultCache
+
+pytest.importorskip('pyarrow')
+
+
+def get_result(size=1):
+    return [{'id': i, 'status_id': 2, 'test_id': 1} for i in range(0, size)]
+
+
+@pytest.fixture
+def cached_api(auth_data, tmp_path):
+    yield TestRailAPI(*auth_data, result_cache=ResultCache(tmp_path))
+
+
+@responses.activate
+def test_completed_run_is_served_from_cache(cached_api, host):
+    responses.add(
+        responses.GET, '{}index.php?/api/v2/get_run/12'.format(host),
+        json={'id': 12, 'is_completed': True})
+    responses.add(
+        responses.GET, '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset=0'.format(host),
+        json=get_result(3))
+
+    df1 = cached_api.results.dataframe_from_run(12)
+    df2 = cached_api.results.dataframe_from_run(12)
+
+    assert len(responses.calls) == 2
+    assert df2.equals(df1)
+
+
+@responses.activate
+def test_active_run_is_not_cached(cached_api, host):
+    responses.add(
+        responses.GET, '{}index.php?/api/v2/get_run/12'.format(host),
+        json={'id': 12, 'is_completed': False})
+    responses.add(
+        responses.GET, '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset=0'.format(host),
+        json=get_result(3))
+
+    cached_api.results.dataframe_from_run(12)
+    cached_api.results.dataframe_from_run(12)
+
+    assert len(responses.calls) == 4
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultCache(tmp_path)
+    df = pd.DataFrame(get_result(10))
+    cache.put('a', df)
+    cache.put('b', df)
+    cache.get('a')
+    size = sum(f.stat().st_size for f in tmp_path.glob('*.parquet'))
+
+    cache.max_bytes = size - 1
+    cache.evict()
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
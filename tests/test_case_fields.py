@@ -0,0 +1,42 @@
+import responses
+
+API = '{}index.php?/api/v2/'
+
+CASE_FIELDS = [
+    {'system_name': 'custom_os', 'configs': [
+        {'context': {'is_global': False, 'project_ids': [1, 2]},
+         'options': {'items': '1, Linux\n2, Windows\n3,4'}},
+        {'context': {'is_global': False, 'project_ids': [3]},
+         'options': {'items': '1, macOS'}},
+    ]},
+    {'system_name': 'custom_browser', 'configs': [
+        {'context': {'is_global': True, 'project_ids': None},
+         'options': {'items': '1, Firefox\n\n2, Chrome'}},
+    ]},
+    {'system_name': 'custom_notes', 'configs': [
+        {'context': {'is_global': True, 'project_ids': None}, 'options': {'is_required': False}},
+    ]},
+]
+
+
+@responses.activate
+def test_get_configs(api, host):
+    responses.add(responses.GET, API.format(host) + 'get_case_fields', json=CASE_FIELDS)
+
+    configs = api.case_fields.get_configs()
+
+    linux = {1: ' Linux', 2: ' Windows', 3: 4}
+    assert configs['custom_os'] == {1: linux, 2: linux, 3: {1: ' macOS'}, None: '', '': ''}
+    assert configs['custom_browser'] == {'global': {1: ' Firefox', 0: 0, 2: ' Chrome'}, None: '', '': ''}
+    assert configs['custom_notes'] == {None: '', '': ''}
+
+
+@responses.activate
+def test_get_configs_index(api, host):
+    responses.add(responses.GET, API.format(host) + 'get_case_fields', json=CASE_FIELDS)
+
+    index = api.case_fields.get_configs_index()
+
+    assert index['custom_os'][2] == {'Linux': 1, 'Windows': 2, 4: 3}
+    assert index['custom_browser'] == {'global': {'Firefox': 1, 'Chrome': 2}}
+    assert index['custom_notes'] == {}
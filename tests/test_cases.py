@@ -0,0 +1,47 @@
+import responses
+
+API = '{}index.php?/api/v2/'
+
+
+def get_cases(size, section_id=1, start=0):
+    return [{'id': start + i, 'section_id': section_id, 'title': 'Case'} for i in range(size)]
+
+
+@responses.activate
+def test_to_dataframe_pulls_all_pages(api, host):
+    for offset, size in ((0, 250), (250, 250), (500, 7)):
+        responses.add(
+            responses.GET,
+            API.format(host) + 'get_cases/1&suite_id=2&offset={}'.format(offset),
+            json=get_cases(size, start=offset))
+
+    df = api.cases.to_dataframe(1, 2)
+
+    assert len(responses.calls) == 3
+    assert df['id'].to_list() == list(range(507))
+
+
+@responses.activate
+def test_to_dataframe_by_section_keeps_section_order(api, host):
+    responses.add(
+        responses.GET,
+        API.format(host) + 'get_sections/1&limit=250&offset=0&suite_id=2',
+        json=[{'id': 30, 'name': 'Root'}, {'id': 10, 'name': 'Child'}, {'id': 20, 'name': 'Empty'}])
+    responses.add(
+        responses.GET,
+        API.format(host) + 'get_cases/1&suite_id=2&section_id=30&offset=0',
+        json=get_cases(2, section_id=30, start=100))
+    for offset, size in ((0, 250), (250, 1)):
+        responses.add(
+            responses.GET,
+            API.format(host) + 'get_cases/1&suite_id=2&section_id=10&offset={}'.format(offset),
+            json=get_cases(size, section_id=10, start=offset))
+    responses.add(
+        responses.GET,
+        API.format(host) + 'get_cases/1&suite_id=2&section_id=20&offset=0',
+        json=[])
+
+    df = api.cases.to_dataframe(1, 2, by_section=True, max_workers=3)
+
+    assert df['id'].to_list() == [100, 101] + list(range(251))
+    assert df['section_id'].to_list() == [30] * 2 + [10] * 251
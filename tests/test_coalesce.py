@@ -0,0 +1,63 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from testrail_data import TestRailAPI
+from testrail_data._coalesce import Coalescer
+
+
+def test_concurrent_identical_gets_share_a_call(fake_server):
+    fake_server.routes['get_run/1'] = {'id': 1, 'project_id': 9}
+    fake_server.routes['get_run/2'] = {'id': 2, 'project_id': 9}
+    fake_server.latency = 0.2
+    api = TestRailAPI(fake_server.url, 'example@mail.com', 'password', coalesce_window=0)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        runs = list(executor.map(api.runs.get_run, [1, 1, 1, 1, 2, 2]))
+
+    assert [run['id'] for run in runs] == [1, 1, 1, 1, 2, 2]
+    runs[0]['id'] = 3
+    assert [run['id'] for run in runs[1:4]] == [1, 1, 1]
+    assert sorted(endpoint for endpoint, _ in fake_server.calls) == ['get_run/1', 'get_run/2']
+    assert api.stats.snapshot()['endpoints']['get_run']['coalesced'] == 4
+
+    api.runs.get_run(1)
+    assert len(fake_server.calls) == 3
+    assert TestRailAPI(fake_server.url, 'example@mail.com', 'password').coalescer is None
+
+
+def test_window_shares_results_but_not_errors():
+    coalescer = Coalescer(window=0.1)
+    calls = []
+
+    def fail():
+        calls.append('fail')
+        raise ConnectionError
+
+    assert coalescer.call('a', lambda: calls.append('a') or 1) == (1, False)
+    assert coalescer.call('a', lambda: calls.append('a') or 2) == (1, True)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            coalescer.call('b', fail)
+    time.sleep(0.15)
+    assert coalescer.call('a', lambda: calls.append('a') or 3) == (3, False)
+    assert calls == ['a', 'fail', 'fail', 'a']
+
+
+@responses.activate
+def test_error_responses_are_not_shared(auth_data, host):
+    from testrail_api._exception import StatusCodeError
+
+    url = '{}index.php?/api/v2/get_run/1'.format(host)
+    responses.add(responses.GET, url, json={'error': 'boom'}, status=500)
+    responses.add(responses.GET, url, json={'id': 1})
+    api = TestRailAPI(*auth_data, coalesce_window=5)
+
+    with pytest.raises(StatusCodeError):
+        api.runs.get_run(1)
+
+    assert api.runs.get_run(1) == {'id': 1}
+    assert api.runs.get_run(1) == {'id': 1}
+    assert len(responses.calls) == 2
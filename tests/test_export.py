@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+import pyarrow.dataset as ds  # noqa: E402
+
+from testrail_data import ParquetExporter, TestRailAPI  # noqa: E402
+
+
+def test_export_rewrites_only_changed_runs(fake_server, tmp_path):
+    fake_server.routes.update({
+        'get_plans/1': [{'id': 5, 'milestone_id': 2}],
+        'get_plan/5': {'id': 5, 'milestone_id': 2, 'entries': [{'runs': [{'id': 8, 'milestone_id': 2}]}]},
+        'get_runs/1': [{'id': 7, 'milestone_id': None, 'passed_count': 2}],
+        'get_results_for_run/7': [{'id': i, 'status_id': 1, 'test_id': 1, 'created_on': 1000} for i in range(260)],
+        'get_results_for_run/8': [{'id': 300, 'status_id': 5, 'test_id': 2, 'created_on': 1000}],
+    })
+    api = TestRailAPI(fake_server.url, 'example@mail.com', 'password')
+
+    report = ParquetExporter(api, tmp_path).export(1, entities=['runs', 'plans', 'results'])
+
+    assert report.set_index('partition')['rows'].to_dict() == {
+        'runs/project_id=1/milestone_id=__HIVE_DEFAULT_PARTITION__': 1,
+        'runs/project_id=1/milestone_id=2': 1,
+        'plans/project_id=1/milestone_id=2': 1,
+        'results/project_id=1/milestone_id=__HIVE_DEFAULT_PARTITION__/run_id=7': 260,
+        'results/project_id=1/milestone_id=2/run_id=8': 1,
+    }
+    assert len(list(tmp_path.glob('results/project_id=1/*/run_id=7/*.parquet'))) == 2
+    df = pd.read_parquet(tmp_path / 'results', partitioning=ds.partitioning(flavor='hive'))
+    assert sorted(df['run_id'].astype(int).unique()) == [7, 8]
+
+    fake_server.routes['get_runs/1'] = [{'id': 7, 'milestone_id': None, 'passed_count': 3}]
+    fake_server.calls.clear()
+
+    report = ParquetExporter(api, tmp_path).export(1, entities=['runs', 'plans', 'results'])
+
+    assert report.set_index('partition')['status'].to_list() == [
+        'written', 'unchanged', 'unchanged', 'written', 'unchanged']
+    assert 'get_results_for_run/8' not in [endpoint for endpoint, _ in fake_server.calls]
+
+
+def test_export_partitions_share_one_schema(fake_server, tmp_path):
+    import pyarrow.parquet as pq
+
+    fake_server.routes.update({
+        'get_plans/1': [],
+        'get_runs/1': [{'id': 1, 'milestone_id': None}, {'id': 2, 'milestone_id': None}],
+        'get_tests/1': [{'id': 1, 'case_id': 1, 'status_id': 1, 'assignedto_id': 3, 'priority_id': 2}],
+        'get_tests/2': [{'id': 2, 'case_id': 1, 'status_id': 5, 'assignedto_id': None, 'priority_id': 2}],
+        'get_suites/1': [{'id': 1}, {'id': 2}],
+        'get_cases/1': lambda params: [{'id': int(params['suite_id']), 'type_id': 1, 'priority_id': 2}],
+    })
+    api = TestRailAPI(fake_server.url, 'example@mail.com', 'password')
+
+    ParquetExporter(api, tmp_path).export(1, entities=['tests', 'cases'])
+
+    for entity, count in (('tests', 2), ('cases', 2)):
+        files = sorted(tmp_path.glob(f'{entity}/**/*.parquet'))
+        schemas = [pq.read_schema(file).remove_metadata() for file in files]
+        assert len(files) == count
+        assert schemas[0] == schemas[1]
+    assert str(pq.read_schema(files[0]).field('priority_id').type) == 'int32'
@@ -0,0 +1,139 @@
+import pandas as pd
+import responses
+
+API = '{}index.php?/api/v2/'
+
+
+def add_meta(host):
+    responses.add(responses.GET, API.format(host) + 'get_case_types', json=[{'id': 2, 'name': 'Functional'}])
+    responses.add(responses.GET, API.format(host) + 'get_priorities', json=[{'id': 1, 'name': 'Low'}])
+    responses.add(responses.GET, API.format(host) + 'get_case_fields', json=[])
+
+
+def count(endpoint):
+    return sum(1 for call in responses.calls if call.request.url.endswith(endpoint))
+
+
+@responses.activate
+def test_tests_to_dataframe_loads_metadata_once(api, host):
+    add_meta(host)
+    for run_id in (1, 2, 3):
+        responses.add(
+            responses.GET, API.format(host) + 'get_tests/{}&limit=250&offset=0'.format(run_id),
+            json=[{'id': run_id, 'type_id': 2, 'priority_id': 1}])
+        responses.add(
+            responses.GET, API.format(host) + 'get_run/{}'.format(run_id), json={'id': run_id, 'project_id': 9})
+
+    df = api.tests.to_dataframe(1, 2, 3, with_meta=True)
+    api.tests.to_dataframe(1, with_meta=True)
+
+    assert df['type_name'].to_list() == ['Functional'] * 3
+    assert count('get_case_types') == 1
+    assert count('get_priorities') == 1
+    assert count('get_case_fields') == 1
+    assert count('get_run/1') == 1
+
+
+@responses.activate
+def test_invalidate_reloads_metadata(api, host):
+    add_meta(host)
+
+    api.metas.fill_id_fields(9, 0, pd.DataFrame({'type_id': [2]}))
+    api.meta_cache.invalidate('case_types')
+    api.metas.fill_id_fields(9, 0, pd.DataFrame({'type_id': [2]}))
+
+    assert count('get_case_types') == 2
+
+
+def test_fill_custom_fields_resolves_labels():
+    from testrail_data._category import _fill_custom_columns
+
+    options = {1: 'Low', 2: 'High'}
+    lookup = {
+        'custom_level': {3: options, None: '', '': ''},
+        'custom_tags': {3: options, None: '', '': ''},
+        'custom_other': {4: options, None: '', '': ''},
+    }
+    df = pd.DataFrame({
+        'custom_level': [1.0, None, 2.0, 7.0, 0.0],
+        'custom_tags': [[1, 2], '[2, 0]', [], [1, 9], '1'],
+        'custom_other': [1, 2, 3, 4, 5],
+        'custom_missing': [1, None, 'a', [1], 0],
+    })
+
+    _fill_custom_columns(lookup, 3, df)
+
+    assert df['custom_level'].to_list() == ['Low', '', 'High', 'UNKNOWN 7', '']
+    assert df['custom_tags'].to_list() == ['Low,High', 'High', '', 'UNKNOWN [1, 9]', 'Low']
+    assert df['custom_other'].to_list() == [''] * 5
+    assert df['custom_missing'].to_list() == ['UNKNOWN 1', 'UNKNOWN None', 'UNKNOWN a', 'UNKNOWN [1]', 'UNKNOWN 0']
+
+
+@responses.activate
+def test_fill_id_fields_categorical(api, host):
+    add_meta(host)
+    df = pd.DataFrame({'type_id': [2, 2, 5], 'priority_id': [1, 1, 1]})
+
+    api.metas.fill_id_fields(9, 0, df, categorical=True)
+
+    assert df['type_name'].dtype == 'category'
+    assert df['type_name'].to_list() == ['Functional', 'Functional', 'UNKNOWN']
+    assert df['priority_name'].cat.categories.to_list() == ['Low', 'UNKNOWN']
+
+
+@responses.activate
+def test_tests_to_dataframe_pages_and_groups_runs_by_project(api, host):
+    add_meta(host)
+    responses.add(responses.GET, API.format(host) + 'get_suites/8', json=[{'id': 5, 'name': 'Master'}])
+    responses.add(responses.GET, API.format(host) + 'get_suites/9', json=[{'id': 6, 'name': 'Smoke'}])
+    pages = {1: [250, 3], 2: [1], 3: [2]}
+    for run_id, sizes in pages.items():
+        for offset, size in zip((0, 250), sizes):
+            responses.add(
+                responses.GET, API.format(host) + 'get_tests/{}&limit=250&offset={}'.format(run_id, offset),
+                json=[{'id': run_id, 'suite_id': 5 if run_id == 2 else 6} for _ in range(size)])
+        responses.add(
+            responses.GET, API.format(host) + 'get_run/{}'.format(run_id),
+            json={'id': run_id, 'project_id': 8 if run_id == 2 else 9})
+
+    df = api.tests.to_dataframe(1, 2, 3, with_meta=True)
+
+    assert df['id'].to_list() == [1] * 253 + [2] + [3] * 2
+    assert df['suite_name'].to_list() == ['Smoke'] * 253 + ['Master'] + ['Smoke'] * 2
+    assert count('get_suites/9') == 1
+    assert sum(1 for call in responses.calls if '/get_run/' in call.request.url) == 3
+
+
+SECTIONS = [
+    {'id': 1, 'name': 'Login', 'parent_id': None},
+    {'id': 2, 'name': 'Search', 'parent_id': None},
+    {'id': 7, 'name': 'Timeout', 'parent_id': 4},
+    {'id': 4, 'name': 'Errors', 'parent_id': 1},
+]
+
+
+def test_section_tree_in_pre_order():
+    from testrail_data._category import _section_tree
+
+    index = _section_tree(SECTIONS)
+
+    assert index.index.to_list() == [1, 4, 7, 2]
+    assert index['path'].to_list() == ['Login', 'Login > Errors', 'Login > Errors > Timeout', 'Search']
+    assert index['depth'].to_list() == [0, 1, 2, 0]
+    assert index['root_id'].to_list() == [1, 1, 1, 2]
+    assert index['subtree_end'].to_list() == [2, 2, 2, 3]
+
+
+@responses.activate
+def test_fill_id_fields_with_section_paths(api, host):
+    responses.add(
+        responses.GET, API.format(host) + 'get_sections/9&limit=250&offset=0&suite_id=3', json=SECTIONS)
+    df = pd.DataFrame({'section_id': [7, 2, 5]})
+
+    api.metas.fill_id_fields(9, 3, df, section_paths=True)
+
+    assert df['section_name'].to_list() == ['Timeout', 'Search', 'UNKNOWN 5']
+    assert df['section_path'].to_list() == ['Login > Errors > Timeout', 'Search', 'UNKNOWN 5']
+    assert df['section_root_id'].to_list() == [1, 2, pd.NA]
+    assert api.metas.get_subtree_ids(9, 3, 4, 2) == [4, 7, 2]
+    assert len(responses.calls) == 1
@@ -28,4 +28,63 @@ def test_to_dataframe(api, host):
     df = api.plans.to_dataframe(5)
 
     assert len(responses.calls) == 3
-    assert df.shape == (700, 2)
\ No newline at end of file
+    assert df.shape == (700, 2)
+
+
+API = '{}index.php?/api/v2/'
+
+PLAN = {
+    'id': 5, 'project_id': 1, 'is_completed': True,
+    'entries': [{
+        'id': 'a1', 'suite_id': 2, 'name': 'Smoke',
+        'runs': [
+            {'id': 7, 'config': 'Chrome, Linux', 'config_ids': [11, 21]},
+            {'id': 8, 'config': 'Firefox, Linux', 'config_ids': [12, 21]},
+        ],
+    }],
+}
+CONFIGS = [
+    {'id': 1, 'name': 'Browser', 'configs': [{'id': 11, 'name': 'Chrome'}, {'id': 12, 'name': 'Firefox'}]},
+    {'id': 2, 'name': 'OS', 'configs': [{'id': 21, 'name': 'Linux'}]},
+]
+
+
+@responses.activate
+def test_expand_normalizes_plan_entries_and_runs(api, host):
+    responses.add(responses.GET, API.format(host) + 'get_plan/5', json=PLAN)
+    responses.add(responses.GET, API.format(host) + 'get_configs/1', json=CONFIGS)
+
+    df_plans, df_entries, df_runs = api.plans.expand(5)
+
+    assert 'entries' not in df_plans.columns
+    assert df_entries[['id', 'plan_id']].values.tolist() == [['a1', 5]]
+    assert df_runs['entry_id'].to_list() == ['a1', 'a1']
+    assert df_runs['config_Browser'].to_list() == ['Chrome', 'Firefox']
+    assert df_runs['config_OS'].to_list() == ['Linux', 'Linux']
+
+
+@responses.activate
+def test_completed_plans_are_cached(api, host):
+    responses.add(responses.GET, API.format(host) + 'get_plan/5', json=PLAN)
+    responses.add(responses.GET, API.format(host) + 'get_plan/6', json={**PLAN, 'id': 6, 'is_completed': False})
+
+    api.runs.get_runs_by_plan(5, 6, 5)
+    api.runs.get_runs_by_plan(5, 6)
+
+    urls = [call.request.url for call in responses.calls]
+    assert sum(url.endswith('get_plan/5') for url in urls) == 1
+    assert sum(url.endswith('get_plan/6') for url in urls) == 2
+
+
+@responses.activate
+def test_cached_plans_are_returned_as_copies(api, host):
+    responses.add(responses.GET, API.format(host) + 'get_plan/5', json=PLAN)
+
+    plan, = api.plans.get_plans_by_id(5)
+    plan['entries'].clear()
+    plan['project_id'] = 2
+
+    plan, = api.plans.get_plans_by_id(5)
+    assert plan['project_id'] == 1
+    assert len(plan['entries']) == len(PLAN['entries'])
+    assert len(responses.calls) == 1
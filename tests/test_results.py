@@ -1,4 +1,6 @@
+import pytest
 import responses
+from requests.exceptions import ConnectionError
 
 
 def get_result(size=1):
@@ -115,3 +117,127 @@ def test_dataframe_from_milestone_when_has_record(api, host):
 
     assert df['status_id'][0] == 2
     assert df.shape[0] == 1
+
+
+@responses.activate
+def test_dataframe_from_run_with_prefetch(api, host):
+    for offset, size in ((0, 250), (250, 250), (500, 10), (750, 0)):
+        responses.add(
+            responses.GET,
+            '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset={}'.format(host, offset),
+            json=[{'id': offset + i, 'status_id': 1, 'test_id': 1} for i in range(size)], status=200)
+
+    df = api.results.dataframe_from_run(12, prefetch=4)
+
+    assert df.shape == (510, 3)
+    assert df['id'].to_list() == list(range(510))
+
+
+@responses.activate
+def test_dataframe_from_run_with_prefetch_does_not_retry_pages_past_the_end(api, host):
+    url = '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset={}'
+    responses.add(responses.GET, url.format(host, 0), json=get_result(10), status=200)
+    for offset in (250, 500):
+        responses.add(responses.GET, url.format(host, offset), body=ConnectionError('reset'))
+
+    df = api.results.dataframe_from_run(12, prefetch=3)
+
+    assert df.shape == (10, 3)
+    # the pages past the short one fail at most once and are dropped, without waiting to retry them
+    urls = [call.request.url for call in responses.calls]
+    assert len(urls) == len(set(urls))
+
+
+@responses.activate
+def test_dataframe_from_runs_with_max_workers_reports_failed_runs(api, host):
+    for run_id in (1, 2, 3):
+        responses.add(
+            responses.GET,
+            '{}index.php?/api/v2/get_results_for_run/{}&limit=250&offset=0'.format(host, run_id),
+            json=[{'id': run_id, 'status_id': 1, 'test_id': run_id}], status=200)
+    responses.add(
+        responses.GET,
+        '{}index.php?/api/v2/get_results_for_run/4&limit=250&offset=0'.format(host),
+        json={'error': 'boom'}, status=500)
+
+    with pytest.warns(UserWarning):
+        df = api.results.dataframe_from_runs(3, 4, 1, 2, max_workers=3)
+
+    assert df['id'].to_list() == [3, 1, 2]
+    assert list(df.attrs['failed_runs']) == [4]
+
+
+@responses.activate
+def test_iter_run_pages_yields_page_by_page(api, host):
+    responses.add(
+        responses.GET,
+        '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset=0'.format(host),
+        json=get_result(250), status=200)
+    responses.add(
+        responses.GET,
+        '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset=250'.format(host),
+        json=get_result(3), status=200)
+
+    pages = api.results.iter_run_pages(12)
+
+    assert len(responses.calls) == 0
+    assert next(pages).shape == (250, 3)
+    assert len(responses.calls) == 1
+    assert [df.shape[0] for df in pages] == [3]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_dataframe_from_run_compact_dtypes(auth_data, host):
+    from testrail_data import TestRailAPI
+
+    responses.add(
+        responses.GET,
+        '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset=0'.format(host),
+        json=[{'id': 1, 'test_id': 3, 'status_id': 1, 'assignedto_id': None, 'created_on': 1600000000},
+              {'id': 2, 'test_id': 4, 'status_id': 5, 'assignedto_id': 7, 'created_on': 1600000060}])
+
+    df = TestRailAPI(*auth_data).results.dataframe_from_run(12)
+    df_raw = TestRailAPI(*auth_data, compact_dtypes=False).results.dataframe_from_run(12)
+
+    assert str(df['id'].dtype) == 'Int32'
+    assert str(df['status_id'].dtype) == 'category'
+    assert df['assignedto_id'].to_list()[1] == 7
+    assert str(df['created_on'][0]) == '2020-09-13 12:26:40'
+    assert str(df_raw['created_on'].dtype) == 'int64'
+
+
+@responses.activate
+def test_dataframe_from_run_fills_fields_missing_from_records(auth_data, host):
+    from testrail_data import TestRailAPI
+
+    page = [{'id': i, 'test_id': 1, 'status_id': 1, 'comment': 'a'} for i in range(250)]
+    del page[1]['comment']
+    responses.add(
+        responses.GET,
+        '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset=0'.format(host), json=page)
+    responses.add(
+        responses.GET,
+        '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset=250'.format(host),
+        json=[{'id': 250, 'test_id': 1, 'elapsed': '1m'}])
+
+    df = TestRailAPI(*auth_data, compact_dtypes=False).results.dataframe_from_run(12)
+
+    assert df.columns.to_list() == ['id', 'test_id', 'status_id', 'comment', 'elapsed']
+    assert df['comment'].isna().to_list() == [False, True] + [False] * 248 + [True]
+    assert df['elapsed'].isna().sum() == 250
+    assert df['status_id'].isna().to_list()[-2:] == [False, True]
+
+
+def test_apply_schema_timestamps_and_failed_casts():
+    import pandas as pd
+    from testrail_data import _schema
+
+    df = pd.DataFrame({'created_on': [1600000000], 'test_id': ['x']})
+
+    with pytest.warns(UserWarning, match='results.test_id'):
+        _schema.apply_schema(df, 'results')
+
+    assert str(df['created_on'].dtype) == _schema.TIMESTAMP
+    assert str(df['created_on'][0]) == '2020-09-13 12:26:40'
+    assert df['test_id'].to_list() == ['x']
@@ -0,0 +1,26 @@
+import responses
+
+API = '{}index.php?/api/v2/'
+
+
+@responses.activate
+def test_get_runs_by_milestone_walks_the_tree_in_batches(api, host):
+    responses.add(responses.GET, API.format(host) + 'get_milestones/1&limit=250&offset=0', json=[
+        {'id': 10, 'parent_id': None, 'milestones': [{'id': 11, 'parent_id': 10}, {'id': 12, 'parent_id': 10}]},
+        {'id': 11, 'parent_id': 10},
+        {'id': 12, 'parent_id': 10},
+        {'id': 13, 'parent_id': 12},
+        {'id': 20, 'parent_id': None},
+    ])
+    responses.add(responses.GET, API.format(host) + 'get_runs/1&milestone_id=10,11,12,13&offset=0',
+                  json=[{'id': 1, 'milestone_id': 10}, {'id': 2, 'milestone_id': 13}])
+    responses.add(responses.GET, API.format(host) + 'get_plans/1&milestone_id=10,11,12,13&offset=0',
+                  json=[{'id': 5}, {'id': 6}])
+    for plan_id, run_id in ((5, 3), (6, 4)):
+        responses.add(responses.GET, API.format(host) + 'get_plan/{}'.format(plan_id), json={
+            'id': plan_id, 'entries': [{'runs': [{'id': run_id, 'milestone_id': 11}]}]})
+
+    df = api.runs.get_runs_by_milestone(10, project_id=1)
+
+    assert sorted(df['id'].to_list()) == [1, 2, 3, 4]
+    assert len(responses.calls) == 5
@@ -0,0 +1,76 @@
+import pytest
+import responses
+from testrail_api._exception import StatusCodeError
+
+from testrail_data import RetryPolicy, Scheduler, TestRailAPI
+from testrail_data._scheduler import TokenBucket
+
+RESULTS = '{}index.php?/api/v2/get_results_for_run/12&limit=250&offset=0'
+
+
+@responses.activate
+def test_scheduler_retries_rate_limit_and_server_errors(auth_data, host):
+    responses.add(responses.GET, RESULTS.format(host), status=429, headers={'Retry-After': '0'})
+    responses.add(responses.GET, RESULTS.format(host), status=503)
+    responses.add(responses.GET, RESULTS.format(host), json=[{'id': 1, 'status_id': 1}])
+    api = TestRailAPI(*auth_data, scheduler=Scheduler(policy=RetryPolicy(backoff=0)))
+
+    df = api.results.dataframe_from_run(12)
+
+    assert df.shape == (1, 2)
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_scheduler_gives_up_after_policy_total(auth_data, host):
+    responses.add(responses.GET, RESULTS.format(host), status=500)
+    api = TestRailAPI(*auth_data, scheduler=Scheduler(policy=RetryPolicy(total=2, backoff=0)))
+
+    with pytest.raises(StatusCodeError):
+        api.results.dataframe_from_run(12)
+    assert len(responses.calls) == 3
+
+
+def test_policy_for_endpoint():
+    results = RetryPolicy(total=10)
+    scheduler = Scheduler(policies={'get_results': results})
+
+    assert scheduler.policy_for('get_results_for_run/1') is results
+    assert scheduler.policy_for('get_runs/1') is scheduler.policy
+    assert scheduler.policy_for('add_result/1').statuses == (429,)
+
+
+def test_token_bucket_spaces_requests():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_scheduler_recovers_from_injected_faults(fake_server):
+    fake_server.routes['get_results_for_run/12'] = [{'id': i, 'status_id': 1, 'test_id': 1} for i in range(600)]
+    fake_server.rate_limit_every = 2
+    fake_server.drop_every = 3
+    api = TestRailAPI(fake_server.url, 'example@mail.com', 'password',
+                      scheduler=Scheduler(policy=RetryPolicy(backoff=0)))
+
+    df = api.results.dataframe_from_run(12)
+
+    assert df['id'].to_list() == list(range(600))
+    assert fake_server.faults['rate_limited'] > 0 and fake_server.faults['dropped'] > 0
+
+
+@responses.activate
+def test_retry_after_is_honored_in_full_up_to_max_retry_after(auth_data, host):
+    from testrail_api._exception import TestRailError
+
+    assert RetryPolicy(max_backoff=60).delay(0, retry_after=120) == 120
+    responses.add(responses.GET, RESULTS.format(host), status=429, headers={'Retry-After': '120'})
+    api = TestRailAPI(*auth_data, scheduler=Scheduler(policy=RetryPolicy(max_retry_after=60)))
+
+    with pytest.raises(TestRailError, match='retry after 120s'):
+        api.results.dataframe_from_run(12)
+    assert len(responses.calls) == 1
@@ -0,0 +1,87 @@
+import json
+import subprocess
+import sys
+
+import responses
+
+from testrail_data import TestRailAPI
+
+
+def adapter(api):
+    return api._Session__session.get_adapter('https://example.testrail.com/')
+
+
+def test_pool_and_encoding_options(auth_data):
+    api = TestRailAPI(*auth_data, pool_maxsize=4, pool_block=True, connect_timeout=3, timeout=60,
+                      accept_encoding='gzip')
+
+    assert adapter(api)._pool_maxsize == 4
+    assert adapter(api)._pool_block
+    assert api._Session__timeout == (3, 60)
+    assert api._Session__session.headers['Accept-Encoding'] == 'gzip'
+
+
+@responses.activate
+def test_pool_grows_with_max_workers(api, host):
+    for run_id in range(1, 4):
+        responses.add(
+            responses.GET,
+            '{}index.php?/api/v2/get_results_for_run/{}&limit=250&offset=0'.format(host, run_id),
+            json=[{'id': run_id, 'status_id': 1}])
+
+    api.grow_pool(5)
+    assert adapter(api)._pool_maxsize == 10
+
+    api.results.dataframe_from_runs(1, 2, 3, max_workers=8, prefetch=2)
+
+    assert adapter(api)._pool_maxsize == 16
+
+
+@responses.activate
+def test_json_decoder(auth_data, host):
+    decoded = []
+
+    def decoder(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    responses.add(responses.GET, '{}index.php?/api/v2/get_statuses'.format(host), json=[{'id': 1}])
+    responses.add(responses.GET, '{}index.php?/api/v2/get_case_types'.format(host), body='')
+
+    api = TestRailAPI(*auth_data, json_decoder=decoder)
+
+    assert api.statuses.get_statuses() == [{'id': 1}]
+    assert api.case_types.get_case_types() is None
+    assert decoded == [b'[{"id": 1}]', b'']
+
+
+def test_categories_are_imported_lazily_and_cached(auth_data):
+    code = ("import sys; from testrail_data import TestRailAPI; api = TestRailAPI(*sys.argv[1:]); "
+            "assert 'pandas' not in sys.modules and 'testrail_data._category' not in sys.modules; "
+            "assert api.results is api.results and 'pandas' in sys.modules")
+    subprocess.run([sys.executable, '-c', code, *auth_data], check=True)
+
+    api = TestRailAPI(*auth_data)
+    assert api.runs is api.runs
+    assert api.runs is not TestRailAPI(*auth_data).runs
+
+
+def test_grow_pool_closes_the_replaced_adapter(auth_data):
+    api = TestRailAPI(*auth_data)
+    old = adapter(api)
+    old.poolmanager.connection_from_url('https://example.testrail.com/')
+
+    api.grow_pool(20)
+
+    assert adapter(api) is not old
+    assert len(old.poolmanager.pools) == 0
+
+
+def test_supported_testrail_api_version(auth_data):
+    import testrail_api
+    from testrail_data._testrail_api import session_internals
+
+    major, minor = (int(part) for part in testrail_api.__version__.split('.')[:2])
+    assert (1, 10) <= (major, minor) < (2, 0)
+    api = TestRailAPI(*auth_data)
+    assert all(hasattr(api, name) for name in session_internals)
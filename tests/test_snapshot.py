@@ -0,0 +1,45 @@
+from testrail_data import SQLiteSnapshot, TestRailAPI
+
+
+def results(*ids, created_on=1000):
+    return [{'id': i, 'status_id': 5 if i % 2 else 1, 'test_id': 1, 'created_on': created_on} for i in ids]
+
+
+def test_refresh_pulls_only_what_changed(fake_server, tmp_path):
+    fake_server.routes.update({
+        'get_suites/1': [{'id': 3, 'name': 'Master'}],
+        'get_cases/1': [{'id': 40, 'section_id': 2, 'title': 'Login', 'updated_on': 900, 'custom_tags': [1, 2]}],
+        'get_plans/1': [{'id': 5}],
+        'get_plan/5': {'id': 5, 'entries': [{'runs': [{'id': 8, 'passed_count': 1}]}]},
+        'get_runs/1': [{'id': 7, 'passed_count': 2}],
+        'get_tests/7': [{'id': 1, 'run_id': 7, 'case_id': 40, 'status_id': 5}],
+        'get_tests/8': [{'id': 2, 'run_id': 8, 'case_id': 40, 'status_id': 1}],
+        'get_results_for_run/7': results(*range(260)),
+        'get_results_for_run/8': results(300),
+    })
+    api = TestRailAPI(fake_server.url, 'example@mail.com', 'password')
+
+    with SQLiteSnapshot(api, tmp_path / 'snapshot.db') as snapshot:
+        report = snapshot.refresh(1, max_workers=2)
+
+        assert report.set_index('entity')['rows'].to_dict() == {'cases': 1, 'runs': 2, 'tests': 2, 'results': 261}
+        df = snapshot.query(
+            'SELECT r.id, r.run_id FROM results r JOIN tests t ON t.id = r.test_id '
+            'WHERE t.case_id = ? AND r.status_id = 5 ORDER BY r.created_on DESC, r.id DESC LIMIT 1', (40,))
+        assert df.values.tolist() == [[259, 7]]
+        assert snapshot.query("SELECT json_extract(data, '$.custom_tags') AS tags FROM cases")['tags'][0] == '[1,2]'
+
+    fake_server.routes['get_runs/1'] = [{'id': 7, 'passed_count': 3}]
+    fake_server.routes['get_results_for_run/7'] = lambda params: results(260, created_on=1100)
+    fake_server.calls.clear()
+
+    with SQLiteSnapshot(api, tmp_path / 'snapshot.db') as snapshot:
+        snapshot.refresh(1)
+
+        assert snapshot.query('SELECT COUNT(*) AS n FROM results')['n'][0] == 262
+    endpoints = [endpoint for endpoint, _ in fake_server.calls]
+    assert 'get_results_for_run/8' not in endpoints
+    assert [params.get('created_after') for endpoint, params in fake_server.calls
+            if endpoint == 'get_results_for_run/7'] == ['999']
+    assert [params.get('updated_after') for endpoint, params in fake_server.calls
+            if endpoint == 'get_cases/1'] == ['899']
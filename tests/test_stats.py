@@ -0,0 +1,59 @@
+import pandas as pd
+import responses
+
+API = '{}index.php?/api/v2/'
+
+
+@responses.activate
+def test_stats_count_calls_retries_and_pages(api, host):
+    results = API.format(host) + 'get_results_for_run/12&limit=250&offset={}'
+    responses.add(responses.GET, results.format(0), status=429, headers={'Retry-After': '0'})
+    responses.add(responses.GET, results.format(0), json=[{'id': i, 'status_id': 1} for i in range(250)])
+    responses.add(responses.GET, results.format(250), json=[{'id': 250, 'status_id': 1}])
+    events = []
+    api.stats.subscribe(events.append)
+
+    api.results.dataframe_from_run(12)
+    stats = api.stats.snapshot()
+
+    endpoint = stats['endpoints']['get_results_for_run']
+    assert (endpoint['calls'], endpoint['responses'], endpoint['retries'], endpoint['rate_limited']) == (2, 3, 1, 1)
+    assert endpoint['bytes'] == sum(len(call.response.content) for call in responses.calls[1:])
+    assert sum(endpoint['latency'].values()) == 2
+    assert stats['pagination']['Results._results_for_run'] == {'walks': 1, 'pages': 2, 'max_pages': 2}
+    assert {'build', 'decode', 'concat', 'apply_schema'} <= set(stats['stages'])
+    assert [event['type'] for event in events].count('request') == 2
+
+
+@responses.activate
+def test_stats_time_metadata_fill(api, host):
+    responses.add(responses.GET, API.format(host) + 'get_case_types', json=[{'id': 2, 'name': 'Functional'}])
+    responses.add(responses.GET, API.format(host) + 'get_case_fields', json=[])
+    df = pd.DataFrame({'type_id': [2], 'custom_level': [1]})
+
+    api.metas.fill_id_fields(9, 0, df)
+    api.metas.fill_custom_fields(9, df)
+    api.stats.reset()
+    api.metas.fill_id_fields(9, 0, df)
+
+    stages = api.stats.snapshot()['stages']
+    assert stages['fill_id_fields']['count'] == 1
+    assert stages['fill_id_fields']['network_seconds'] == 0
+    assert 'fill_custom_fields' not in stages
+
+
+def test_stats_count_paginated_retry_after_dropped_connection(fake_server, monkeypatch):
+    from testrail_data import TestRailAPI, _category
+
+    monkeypatch.setattr(_category, 'retry_sleep', 0)
+    fake_server.routes['get_results_for_run/12'] = [{'id': i, 'status_id': 1} for i in range(251)]
+    fake_server.drop_every = 2
+    api = TestRailAPI(fake_server.url, 'example@mail.com', 'password')
+
+    df = api.results.dataframe_from_run(12)
+
+    endpoint = api.stats.snapshot()['endpoints']['get_results_for_run']
+    assert df.shape[0] == 251
+    assert fake_server.faults['dropped'] == 1
+    assert (endpoint['calls'], endpoint['responses'], endpoint['connection_errors']) == (3, 2, 1)
+    assert endpoint['retries'] == 1
@@ -0,0 +1,64 @@
+import pytest
+import responses
+
+from testrail_data import ResultSync
+
+pytest.importorskip('pyarrow')
+
+RUNS = '{}index.php?/api/v2/get_runs/1&offset=0'
+PLANS = '{}index.php?/api/v2/get_plans/1&offset=0'
+RESULTS = '{}index.php?/api/v2/get_results_for_run/{}&limit=250&offset=0'
+
+
+def get_result(*ids):
+    return [{'id': i, 'status_id': 1, 'test_id': 1, 'created_on': 1000 + i} for i in ids]
+
+
+@responses.activate
+def test_sync_pulls_only_new_results(api, host, tmp_path):
+    responses.add(responses.GET, PLANS.format(host), json=[])
+    responses.add(responses.GET, RUNS.format(host), json=[
+        {'id': 5, 'is_completed': False}, {'id': 6, 'is_completed': True}])
+    responses.add(responses.GET, RESULTS.format(host, 5), json=get_result(1, 2))
+    responses.add(responses.GET, RESULTS.format(host, 6), json=get_result(3))
+
+    sync = ResultSync(api, tmp_path)
+    df = sync.sync(1)
+
+    assert df.shape[0] == 3
+    assert sync.watermark(1) == 1003
+    assert sync.watermark(1, 5) == 1002
+
+    responses.replace(responses.GET, RUNS.format(host), json=[
+        {'id': 5, 'is_completed': True}, {'id': 6, 'is_completed': True}])
+    responses.add(
+        responses.GET,
+        '{}index.php?/api/v2/get_results_for_run/5&limit=250&created_after=1001&offset=0'.format(host),
+        json=get_result(2, 4))
+    responses.calls.reset()
+
+    df = ResultSync(api, tmp_path).sync(1)
+
+    assert len(responses.calls) == 3
+    assert df['id'].to_list() == [4]
+
+    sync = ResultSync(api, tmp_path)
+    assert sorted(sync.table['id']) == [1, 2, 3, 4]
+    assert sync.watermark(1, 5) == 1004
+
+
+@responses.activate
+def test_sync_pulls_runs_of_plans(api, host, tmp_path):
+    responses.add(responses.GET, PLANS.format(host), json=[{'id': 7}])
+    responses.add(responses.GET, '{}index.php?/api/v2/get_plan/7'.format(host), json={
+        'id': 7, 'is_completed': False, 'entries': [{'runs': [{'id': 8, 'is_completed': False}]}]})
+    responses.add(responses.GET, RUNS.format(host), json=[{'id': 5, 'is_completed': True}])
+    responses.add(responses.GET, RESULTS.format(host, 5), json=get_result(1))
+    responses.add(responses.GET, RESULTS.format(host, 8), json=get_result(2, 3))
+
+    sync = ResultSync(api, tmp_path)
+    df = sync.sync(1)
+
+    assert sorted(df['id']) == [1, 2, 3]
+    assert sorted(df.loc[df['run_id'] == 8, 'id']) == [2, 3]
+    assert sync.watermark(1, 8) == 1003